@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Canvas items and frame time vs entity count
+Renders the same seeded worlds with every renderer (separate canvas items,
+character grid as color runs, character grid as color layers) on the stub
+canvas while the number of krakens or bubbles grows, and reports how many
+canvas items each one keeps and how long a frame takes to render.
+
+ms/frame is the Python side only (composing plus canvas calls on the stub);
+on a real canvas Tk's own redraw cost grows with the number of items.
+
+Usage:
+    python3 bench/entity_scaling.py                  # krakens and bubbles
+    python3 bench/entity_scaling.py --sweep krakens  # one sweep
+    python3 bench/entity_scaling.py --ticks 300
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation import World, TICK
+from scene import SceneRenderer
+from compositor import GridRenderer
+from stub_canvas import StubCanvas
+
+WIDTH = 800
+HEIGHT = 600
+SEED = 1234
+
+RENDERERS = {
+    'items': lambda canvas: SceneRenderer(canvas, WIDTH, HEIGHT),
+    'grid runs': lambda canvas: GridRenderer(canvas, WIDTH, HEIGHT, items='runs'),
+    'grid layers': lambda canvas: GridRenderer(canvas, WIDTH, HEIGHT, items='layers'),
+}
+
+
+# ===== SWEEPS =====
+# Each sweep builds a world holding count entities and keeps it that way
+
+def kraken_world(count):
+    world = World(WIDTH, HEIGHT, rng=random.Random(SEED), verbose=False, kraken_count=count)
+    for i in range(20):  # Something to chase
+        world.drop_shrimp(120 + (i % 5) * 130, world.water_level + 80 + (i // 5) * 90)
+    return world, None
+
+
+def bubble_world(count):
+    world = World(WIDTH, HEIGHT, rng=random.Random(SEED), verbose=False)
+    world.bubble_spawn_chance = 0
+    world.bubbles.spawn(count)
+    return world, lambda: world.bubbles.spawn(count - len(world.bubbles))
+
+
+SWEEPS = {
+    'krakens': (kraken_world, (1, 10, 50, 100, 200)),
+    'bubbles': (bubble_world, (100, 500, 1000, 2000, 4000)),
+}
+
+
+def measure(make_world, count, make_renderer, ticks, warmup):
+    """Render ticks frames; returns (visible canvas items, ms per frame, canvas calls per frame)"""
+    random.seed(SEED)
+    world, before_tick = make_world(count)
+    canvas = StubCanvas(WIDTH, HEIGHT)
+    renderer = make_renderer(canvas)
+    rendering = 0.0
+    for tick in range(warmup + ticks):
+        if tick == warmup:
+            canvas.reset_calls()
+            rendering = 0.0
+        if before_tick is not None:
+            before_tick()
+        world.step(TICK)
+        snapshot = world.snapshot()
+        start = time.perf_counter()
+        renderer.render(snapshot)
+        rendering += time.perf_counter() - start
+    visible = sum(1 for item in canvas.items.values() if item['options'].get('state') != 'hidden')
+    return visible, rendering / ticks * 1000, canvas.total_calls() / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sweep', choices=sorted(SWEEPS), help='run one sweep (default: all)')
+    parser.add_argument('--ticks', type=int, default=200, help='measured frames per point')
+    parser.add_argument('--warmup', type=int, default=50, help='frames rendered before measuring')
+    args = parser.parse_args()
+
+    for name in ([args.sweep] if args.sweep else list(SWEEPS)):
+        make_world, counts = SWEEPS[name]
+        print(f"\n{name:<8}" + "".join(f"{renderer:>30}" for renderer in RENDERERS))
+        print(f"{'':<8}" + f"{'items':>10}{'ms/frame':>10}{'calls':>10}" * len(RENDERERS))
+        for count in counts:
+            cells = []
+            for make_renderer in RENDERERS.values():
+                items, ms, calls = measure(make_world, count, make_renderer, args.ticks, args.warmup)
+                cells.append(f"{items:>10d}{ms:>10.3f}{calls:>10.1f}")
+            print(f"{count:<8}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Legacy Canvas Drawing (benchmark baseline)
+The pet's original immediate-draw helpers, from before the simulation moved
+to simulation.py/particles.py and drawing to the scene and surface
+renderers. Nothing in the app uses them; tcl_calls.py keeps them only to
+compare immediate and retained canvas items on the old per-tick workload.
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from layers import layer_for
+from fontmetrics import font_metrics
+from designs import (UNDERWATER_ENVIRONMENT, RENDER_CONFIG, DEBUG_CONFIG, SURFACE_FONT,
+                     get_boat_sprite, integrate_boat_into_waves)
+
+
+def render_ascii_art(lines, x, y, canvas, tag="pet", color="#333333", font_size=6):
+    """Render ASCII art on a tkinter canvas with customizable font size"""
+    layer = layer_for(canvas, RENDER_CONFIG['retained'])
+    layer.begin(tag)  # Clears previous art in immediate mode
+    
+    # Moving existing art is a single canvas.move for the whole tag
+    first_line = layer.position((tag, 0)) if layer.retained else None
+    if first_line is not None:
+        layer.translate(tag, x - first_line[0], y - first_line[1])
+    
+    line_height = font_size + 2
+    for i, line in enumerate(lines):
+        layer.text(
+            (tag, i),
+            x, y + (i * line_height), tag,
+            text=line, 
+            font=('Courier', font_size, 'bold'), 
+            anchor='center',
+            fill=color
+        )
+
+def render_underwater_environment(canvas, width, height, animation_frame=0, boat_char_pos=None, boat_active=False, boat_direction='lr'):
+    """Render ocean cross-section: top 1/5 surface area, bottom 4/5 underwater
+    
+    Args:
+        canvas: Tkinter canvas
+        width: Canvas width
+        height: Canvas height
+        animation_frame: Current animation frame for wave animation
+        boat_char_pos: Character position of boat (for integration into waves)
+        boat_active: Whether boat is active and should be rendered
+        boat_direction: Direction of boat ('lr' = left-to-right, 'rl' = right-to-left)
+    """
+    layer = layer_for(canvas, RENDER_CONFIG['retained'])
+    layer.begin("environment")  # Clears previous environment in immediate mode
+    created = False  # Whether any environment item is new (needs lowering)
+    
+    # Calculate water level (top 1/5 is surface, bottom 4/5 is underwater)
+    water_level = height // 5
+    underwater_height = height - water_level
+    
+    # ===== SURFACE AREA (Top 1/5) =====
+    # Draw surface area background (deep blue, almost black)
+    created |= layer.rectangle(
+        ("environment", "surface_bg"),
+        0, 0, width, water_level, "environment",
+        fill='#0A0F1C', outline=''
+    )
+    
+    # ===== ANIMATED OCEAN SURFACE (7 LINES TALL: 5 blank + 2 waves) =====
+    # Cycle through wave animation frames
+    wave_frames = [
+        UNDERWATER_ENVIRONMENT['ocean_surface_frame1'],
+        UNDERWATER_ENVIRONMENT['ocean_surface_frame2'],
+        UNDERWATER_ENVIRONMENT['ocean_surface_frame3'],
+        UNDERWATER_ENVIRONMENT['ocean_surface_frame4']
+    ]
+    current_wave_top = wave_frames[animation_frame % 4]
+    # Bottom line uses alternating frame for better wave effect
+    current_wave_bottom = wave_frames[(animation_frame + 2) % 4]
+    
+    # Make surface lines span the ENTIRE width
+    surface_metrics = font_metrics(SURFACE_FONT)
+    num_chars = int(width // surface_metrics.char_width) + 2  # Add extra for safety
+    full_wave_line_top = (current_wave_top * (num_chars // len(current_wave_top) + 1))[:num_chars]
+    full_wave_line_bottom = (current_wave_bottom * (num_chars // len(current_wave_bottom) + 1))[:num_chars]
+    
+    # Create 5 blank lines above waves
+    blank_line = " " * (len(full_wave_line_top))
+    
+    # Integrate boat into surface if active (boat is 6 lines, overlaps top wave)
+    if boat_active and boat_char_pos is not None:
+        boat_sprite = get_boat_sprite(boat_direction)
+        if len(boat_sprite) >= 6:
+            # Boat line 5 (hull bottom) overwrites the top wave line
+            full_wave_line_top = integrate_boat_into_waves(full_wave_line_top, boat_sprite[5], boat_char_pos)
+    
+    # Render 7-line surface: 5 blank lines + 2 wave lines
+    line_height = surface_metrics.line_height
+    surface_y_start = water_level - (5 * line_height)  # Start 5 lines above water_level
+    
+    # Draw 5 blank lines (or boat lines 1-5 if boat is present)
+    for i in range(5):
+        y_pos = surface_y_start + (i * line_height)
+        
+        if boat_active and boat_char_pos is not None and i < len(boat_sprite) - 1:
+            # Render boat line i into this blank line
+            line_text = integrate_boat_into_waves(blank_line, boat_sprite[i], boat_char_pos)
+        else:
+            # Just blank space
+            line_text = blank_line
+        created |= layer.text(
+            ("environment", "line", i),
+            0, y_pos, "environment",
+            text=line_text,
+            font=SURFACE_FONT,
+            fill='#FFFFFF',
+            anchor='w'
+        )
+    
+    # Draw FIRST animated wave line (line 6, with boat hull bottom overlapping if active)
+    created |= layer.text(
+        ("environment", "wave_top"),
+        0, water_level, "environment",  # First wave line at water level
+        text=full_wave_line_top,
+        font=SURFACE_FONT,
+        fill='#FFFFFF',
+        anchor='w'  # Anchor to west (left) to ensure full coverage
+    )
+    
+    # Draw SECOND animated wave line (line 7, bottom wave)
+    created |= layer.text(
+        ("environment", "wave_bottom"),
+        0, water_level + line_height, "environment",  # Second line below first
+        text=full_wave_line_bottom,
+        font=SURFACE_FONT,
+        fill='#AAAAAA',  # Slightly darker to show depth
+        anchor='w'
+    )
+    
+    # ===== UNDERWATER AREA (Bottom 4/5) =====
+    # Draw underwater background (deep blue, almost black)
+    # Start below the 2-line surface (20 pixels for 2 lines)
+    surface_height = 20  # Height of 2-line surface
+    created |= layer.rectangle(
+        ("environment", "underwater_bg"),
+        0, water_level + surface_height, width, height, "environment",
+        fill='#0A0F1C', outline=''
+    )
+    
+    # CRITICAL: Lower environment to bottom of z-order so it doesn't cover kraken/shrimp/bubbles
+    # Retained items keep their stacking order, so this is only needed when items were created
+    if created:
+        canvas.lower("environment")
+    
+    # Draw debug grid if enabled
+    if DEBUG_CONFIG['show_grid']:
+        from debug_grid import render_debug_grid
+        render_debug_grid(canvas, width, height, water_level)
+    
+    return water_level  # Return water level for movement constraints
+
+def spawn_bubble(bubble_list, width, water_level, height, rng=random):
+    """Spawn a new bubble at a random underwater position"""
+    # Spawn in underwater area only (below 2-line surface, above ocean floor)
+    surface_height = 20  # Height of 2-line surface
+    underwater_start = water_level + surface_height + 10  # Below surface
+    underwater_end = height - 60  # Above ocean floor
+    
+    # Spawn across entire width (no margin)
+    x = rng.randint(0, width)
+    y = rng.randint(underwater_start, underwater_end)
+    
+    # Bubble appearance
+    bubble_char = rng.choice(UNDERWATER_ENVIRONMENT['bubbles_small'] + 
+                             UNDERWATER_ENVIRONMENT['bubbles_medium'])
+    bubble_size = rng.choice([10, 12, 14, 16])
+    bubble_color = '#FFFFFF'
+    
+    # Add to bubble list with all needed info
+    bubble_list.append({
+        'x': x,
+        'y': y,
+        'char': bubble_char,
+        'size': bubble_size,
+        'color': bubble_color,
+        'canvas_id': None  # Will be set when rendered
+    })
+
+
+def step_bubbles(bubble_list, width, water_level, height, spawn_chance=0.05, rng=random):
+    """Bubble physics without rendering: spawn new bubbles randomly, move existing bubbles upward, remove at surface
+    
+    Args:
+        bubble_list: List of bubble dictionaries to update
+        width: Canvas width
+        water_level: Y-coordinate of ocean surface
+        height: Canvas height
+        spawn_chance: Probability (0.0-1.0) of spawning a bubble each frame
+        rng: Random source (random module or a random.Random instance)
+    """
+    # Randomly spawn new bubble
+    if rng.random() < spawn_chance:
+        spawn_bubble(bubble_list, width, water_level, height, rng)
+    
+    # Update existing bubbles
+    bubbles_to_remove = []
+    # Surface is 2 lines tall: water_level to water_level + 10
+    # Remove bubbles slightly before they reach the visible surface (for realism)
+    bubble_removal_threshold = 15  # Remove 15 pixels before water_level
+    for i, bubble in enumerate(bubble_list):
+        # Move bubble upward (rising physics)
+        bubble['y'] -= 2  # Rise speed: 2 pixels per frame
+        
+        # Mark for removal if approaching surface (slightly before water_level)
+        if bubble['y'] <= water_level + bubble_removal_threshold:
+            bubbles_to_remove.append(i)
+    
+    # Remove bubbles that reached surface (reverse order to preserve indices)
+    for i in reversed(bubbles_to_remove):
+        bubble_list.pop(i)
+
+
+def update_bubbles(bubble_list, canvas, width, water_level, height, spawn_chance=0.05):
+    """Update bubble physics and render the result
+    
+    Args:
+        bubble_list: List of bubble dictionaries to update
+        canvas: Tkinter canvas to render on
+        width: Canvas width
+        water_level: Y-coordinate of ocean surface
+        height: Canvas height
+        spawn_chance: Probability (0.0-1.0) of spawning a bubble each frame
+    """
+    step_bubbles(bubble_list, width, water_level, height, spawn_chance)
+    
+    # Render all bubbles
+    render_bubbles(bubble_list, canvas)
+
+
+def render_bubbles(bubble_list, canvas):
+    """Render all bubbles on canvas, reusing a pool of bubble items"""
+    layer = layer_for(canvas, RENDER_CONFIG['retained'])
+    layer.begin("bubbles")  # Clears existing bubble graphics in immediate mode
+    
+    # Render each bubble at its current position (slot i reuses pool item i)
+    live_keys = set()
+    for i, bubble in enumerate(bubble_list):
+        key = ("bubbles", i)
+        live_keys.add(key)
+        layer.text(
+            key,
+            bubble['x'], bubble['y'], "bubbles",
+            text=bubble['char'],
+            font=('Arial', bubble['size']),
+            fill=bubble['color']
+        )
+    
+    # Hide pool items that are not needed this frame
+    if layer.retained:
+        layer.hide_except("bubbles", live_keys)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Headless scenario benchmarks
+Drives the simulation and the scene renderer deterministically (seeded RNG,
+stub canvas, one frame per tick) through scripted scenarios and reports
+ticks/sec, memory allocated per tick (tracemalloc) and canvas calls per tick.
+
+Canvas calls and allocations only depend on the code, not on the machine, so
+they can be compared across commits exactly; ticks/sec is best-of --repeat.
+
+Usage:
+    python3 bench/scenarios.py                       # all scenarios
+    python3 bench/scenarios.py idle bubbles_2000     # some of them
+    python3 bench/scenarios.py --json after.json     # save results
+    python3 bench/scenarios.py --compare before.json # show change vs saved results
+    python3 bench/scenarios.py --backend grid        # character grid renderer
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from simulation import World, TICK
+from scene import SceneRenderer
+from compositor import GridRenderer
+from particles import np
+from stub_canvas import StubCanvas
+
+WIDTH = 800
+HEIGHT = 600
+SEED = 1234
+
+BACKENDS = {
+    'items': SceneRenderer,
+    'grid': GridRenderer,
+}
+
+
+# ===== SCENARIOS =====
+# Each scenario has setup(world) called once and before_tick(world, tick)
+# called before every tick, so the workload is the same on every run.
+
+def setup_idle(world):
+    """Nothing to do: the kraken drifts around and bubbles rise"""
+
+
+def setup_shrimp(world):
+    """Queue 20 shrimp on a grid across the water"""
+    queue_shrimp(world)
+
+
+def shrimp_tick(world, tick):
+    # Refill the queue once the kraken has eaten everything
+    if not world.shrimp:
+        queue_shrimp(world)
+
+
+def queue_shrimp(world):
+    for row in range(4):
+        for column in range(5):
+            world.drop_shrimp(120 + column * 130, world.water_level + 80 + row * 90)
+
+
+def setup_boat(world):
+    """Boats sail across back to back; a full counter gives 50% destruction odds"""
+    world.shrimp_eaten_count = 100
+
+
+def boat_tick(world, tick):
+    if not world.boat.active:
+        world.spawn_boat('rl' if world.boats_destroyed % 2 else 'lr')
+
+
+def setup_school(world):
+    """100 krakens competing for a queue of 20 shrimp"""
+    queue_shrimp(world)
+
+
+def setup_bubbles(world):
+    """Keep 2,000 bubbles in the water"""
+    world.bubble_spawn_chance = 0
+    world.bubbles.spawn(2000)
+
+
+def bubbles_tick(world, tick):
+    world.bubbles.spawn(2000 - len(world.bubbles))
+
+
+SCENARIOS = {
+    'idle': (setup_idle, None),
+    'shrimp_20': (setup_shrimp, shrimp_tick),
+    'boat_attack': (setup_boat, boat_tick),
+    'bubbles_2000': (setup_bubbles, bubbles_tick),
+    'school_100': (setup_school, shrimp_tick),
+}
+
+# Krakens per scenario (default 1)
+KRAKENS = {
+    'school_100': 100,
+}
+
+
+# ===== RUNNER =====
+
+def make_scene(name, seed=SEED, backend='items'):
+    """Build a seeded world and renderer for a scenario, with the first frame drawn"""
+    random.seed(seed)  # Anything still using the global RNG
+    world = World(WIDTH, HEIGHT, rng=random.Random(seed), verbose=False,
+                  kraken_count=KRAKENS.get(name, 1))
+    canvas = StubCanvas(WIDTH, HEIGHT)
+    renderer = BACKENDS[backend](canvas, WIDTH, HEIGHT)
+    setup, before_tick = SCENARIOS[name]
+    setup(world)
+    renderer.render(world.snapshot())
+    return world, canvas, renderer, before_tick
+
+
+def run_ticks(world, renderer, before_tick, start, ticks):
+    """Advance and render ticks frames"""
+    for tick in range(start, start + ticks):
+        if before_tick is not None:
+            before_tick(world, tick)
+        world.step(TICK)
+        renderer.render(world.snapshot())
+
+
+def measure(name, ticks, warmup, repeat, backend='items'):
+    """Benchmark one scenario
+
+    Returns:
+        dict with ticks_per_sec, canvas_calls_per_tick, alloc_bytes_per_tick,
+        alloc_blocks_per_tick and canvas_items at the end of the run
+    """
+    # Timing: best of repeat runs, no tracing
+    best = None
+    for _ in range(repeat):
+        world, canvas, renderer, before_tick = make_scene(name, backend=backend)
+        run_ticks(world, renderer, before_tick, 0, warmup)
+        canvas.reset_calls()
+        start = time.perf_counter()
+        run_ticks(world, renderer, before_tick, warmup, ticks)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    calls = dict(canvas.calls)
+
+    # Allocations: a separate traced run (tracing slows everything down).
+    # Peak-above-baseline per tick counts short-lived garbage too; blocks is
+    # the net number of new live allocations per tick.
+    world, canvas, renderer, before_tick = make_scene(name, backend=backend)
+    run_ticks(world, renderer, before_tick, 0, warmup)
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    allocated = 0
+    for tick in range(warmup, warmup + ticks):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run_ticks(world, renderer, before_tick, tick, 1)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - current
+    blocks = sys.getallocatedblocks() - blocks_before
+    tracemalloc.stop()
+
+    return {
+        'ticks': ticks,
+        'ticks_per_sec': round(ticks / best, 1),
+        'canvas_calls_per_tick': round(sum(calls.values()) / ticks, 2),
+        'canvas_calls': {call: round(count / ticks, 2) for call, count in sorted(calls.items())},
+        'alloc_bytes_per_tick': round(allocated / ticks, 1),
+        'alloc_blocks_per_tick': round(blocks / ticks, 2),
+        'canvas_items': len(canvas.items),
+        'bubbles': len(world.bubbles),
+        'shrimp_eaten': world.shrimp_eaten_count,
+        'boats_destroyed': world.boats_destroyed,
+    }
+
+
+def environment(backend='items'):
+    """Where the numbers came from"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'commit': commit or None,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__ if np is not None else None,
+        'seed': SEED,
+        'backend': backend,
+    }
+
+
+# ===== OUTPUT =====
+
+COLUMNS = [
+    ('ticks_per_sec', 'ticks/s', '{:>10.0f}'),
+    ('canvas_calls_per_tick', 'calls/tick', '{:>11.2f}'),
+    ('alloc_bytes_per_tick', 'B alloc/tick', '{:>13.0f}'),
+    ('alloc_blocks_per_tick', 'blocks/tick', '{:>12.2f}'),
+    ('canvas_items', 'items', '{:>7d}'),
+]
+
+
+def print_table(results, baseline=None):
+    """Print one row per scenario, with % change vs baseline when given"""
+    header = f"{'scenario':<14}" + "".join(f"{title:>{len(fmt.format(0))}}"
+                                            for _, title, fmt in COLUMNS)
+    print(header)
+    for name, result in results.items():
+        print(f"{name:<14}" + "".join(fmt.format(result[key]) for key, _, fmt in COLUMNS))
+        old = (baseline or {}).get(name)
+        if old:
+            cells = []
+            for key, _, fmt in COLUMNS:
+                width = len(fmt.format(0))
+                if old.get(key):
+                    cells.append(f"{(result[key] - old[key]) / old[key]:>+{width}.1%}")
+                else:
+                    cells.append(f"{'-':>{width}}")
+            print(f"{'  vs baseline':<14}" + "".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('scenarios', nargs='*',
+                        help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument('--ticks', type=int, default=600, help='measured ticks per scenario')
+    parser.add_argument('--warmup', type=int, default=100, help='ticks run before measuring')
+    parser.add_argument('--repeat', type=int, default=3, help='timing runs (best is kept)')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='items',
+                        help='renderer to benchmark (default: items)')
+    parser.add_argument('--json', metavar='PATH', help='write results to a JSON file')
+    parser.add_argument('--compare', metavar='PATH', help='JSON results to compare against')
+    args = parser.parse_args()
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    results = {}
+    for name in names:
+        results[name] = measure(name, args.ticks, args.warmup, args.repeat, args.backend)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            saved = json.load(f)
+        baseline = saved['scenarios']
+        print(f"Baseline: {saved['environment'].get('commit')} ({args.compare})")
+    env = environment(args.backend)
+    print(f"Commit {env['commit']}, Python {env['python']}, NumPy {env['numpy'] or 'not installed'}, "
+          f"{args.backend} renderer, {args.ticks} ticks after {args.warmup} warm-up")
+    print_table(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'environment': env, 'ticks': args.ticks, 'warmup': args.warmup,
+                       'scenarios': results}, f, indent=2, sort_keys=True)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Display-free stand-in for tkinter.Canvas
+Every public Canvas method is one Python -> Tcl round-trip in tkinter, so the
+stub counts method calls per name to report Tcl calls without an X server.
+A BatchedCanvas flush (see tclbatch.py) counts as one 'batch' call.
+"""
+
+from collections import Counter
+
+
+class StubCanvas:
+    """Minimal canvas that tracks items and counts calls"""
+
+    def __init__(self, width=800, height=600):
+        self.width = width
+        self.height = height
+        self.calls = Counter()
+        self.items = {}  # item_id -> {'kind', 'coords', 'tags', 'options'}
+        self.tagged = {}  # tag -> {item_id: None} in creation order (like Tk's tag lookup, minus the scan)
+        self.next_id = 1
+        self.tk = self  # BatchedCanvas flushes with canvas.tk.call
+
+    def __str__(self):
+        return '.stub'
+
+    def reset_calls(self):
+        """Clear the call counters (items are kept)"""
+        self.calls.clear()
+
+    def total_calls(self):
+        """Total number of canvas calls since the last reset"""
+        return sum(self.calls.values())
+
+    def _match(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        if tag_or_id == "all":
+            return list(self.items)
+        if tag_or_id.startswith("!"):  # Tag expression: items without the tag
+            excluded = self.tagged.get(tag_or_id[1:], ())
+            return [item_id for item_id in self.items if item_id not in excluded]
+        return list(self.tagged.get(tag_or_id, ()))
+
+    def _create(self, kind, coords, options):
+        tags = options.pop('tags', ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        item_id = self.next_id
+        self.next_id += 1
+        self.items[item_id] = {'kind': kind, 'coords': list(coords),
+                               'tags': tuple(tags), 'options': options}
+        for tag in tags:
+            self.tagged.setdefault(tag, {})[item_id] = None
+        return item_id
+
+    def create_text(self, *coords, **options):
+        self.calls['create_text'] += 1
+        return self._create('text', coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        self.calls['create_rectangle'] += 1
+        return self._create('rectangle', coords, options)
+
+    def create_line(self, *coords, **options):
+        self.calls['create_line'] += 1
+        return self._create('line', coords, options)
+
+    def delete(self, *tags_or_ids):
+        self.calls['delete'] += 1
+        for tag_or_id in tags_or_ids:
+            for item_id in self._match(tag_or_id):
+                for tag in self.items.pop(item_id)['tags']:
+                    members = self.tagged[tag]
+                    del members[item_id]
+                    if not members:
+                        del self.tagged[tag]
+
+    def coords(self, tag_or_id, *coords):
+        self.calls['coords'] += 1
+        matches = self._match(tag_or_id)
+        if not matches:
+            return []
+        if coords:
+            for item_id in matches[:1]:
+                self.items[item_id]['coords'] = list(coords)
+            return None
+        return [float(value) for value in self.items[matches[0]]['coords']]
+
+    def move(self, tag_or_id, dx, dy):
+        self.calls['move'] += 1
+        for item_id in self._match(tag_or_id):
+            item_coords = self.items[item_id]['coords']
+            for i in range(len(item_coords)):
+                item_coords[i] += dx if i % 2 == 0 else dy
+
+    def itemconfigure(self, tag_or_id, **options):
+        self.calls['itemconfigure'] += 1
+        for item_id in self._match(tag_or_id):
+            self.items[item_id]['options'].update(options)
+
+    itemconfig = itemconfigure
+
+    def find_withtag(self, tag_or_id):
+        self.calls['find_withtag'] += 1
+        return tuple(self._match(tag_or_id))
+
+    def find_all(self):
+        self.calls['find_all'] += 1
+        return tuple(self.items)
+
+    def lower(self, *args):
+        self.calls['lower'] += 1
+
+    tag_lower = lower
+
+    def tag_raise(self, *args):
+        self.calls['tag_raise'] += 1
+
+    lift = tag_raise
+
+    def eval(self, script):
+        """Accepts BatchedCanvas's proc definition (nothing else is evaluated)"""
+
+    def call(self, command, commands):
+        """Run a BatchedCanvas batch: one round-trip, each command applied to this stub"""
+        calls = self.calls.copy()
+        methods = {'itemconfigure': self._batch_itemconfigure, 'coords': self.coords, 'move': self.move,
+                   'delete': self.delete, 'raise': self.tag_raise, 'lower': self.lower}
+        for _, name, *args in commands:
+            methods[name](*args)
+        self.calls = calls  # The whole batch is one round-trip
+        self.calls['batch'] += 1
+
+    def _batch_itemconfigure(self, tag_or_id, *words):
+        self.itemconfigure(tag_or_id, **{words[i][1:]: words[i + 1] for i in range(0, len(words), 2)})
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Per-call canvas updates vs one batched Tcl script per frame
+Renders the benchmark scenarios with each renderer twice: calling the canvas
+directly (one Python -> Tcl round-trip per call) and through a BatchedCanvas
+that sends each frame's commands with a single tk.call. Reports round-trips
+and milliseconds per frame.
+
+The stub canvas has no Tcl behind it, so its ms/frame only shows the
+Python-side cost of queueing (slightly higher than calling directly); the
+run also checks that both paths leave every canvas item with the same text,
+coordinates and state. With --tk both paths drive a real Tk canvas, which
+is where the saved round-trips show up in ms/frame.
+
+Usage:
+    python3 bench/tcl_batch.py                      # stub canvas
+    python3 bench/tcl_batch.py --tk                 # real Tk canvas (needs a display)
+    python3 bench/tcl_batch.py --scenario boat_attack --ticks 500
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation import World, TICK
+from scene import SceneRenderer
+from compositor import GridRenderer
+from profiler import CountingTk
+from tclbatch import BatchedCanvas
+from stub_canvas import StubCanvas
+from scenarios import SCENARIOS, KRAKENS, WIDTH, HEIGHT, SEED
+
+RENDERERS = {
+    'items': SceneRenderer,
+    'grid': GridRenderer,
+}
+
+
+def make_canvas(use_tk):
+    """A stub canvas, or a real one whose Tcl round-trips are counted
+
+    Returns:
+        (canvas, round-trips since the last reset, reset)
+    """
+    if not use_tk:
+        canvas = StubCanvas(WIDTH, HEIGHT)
+        return canvas, canvas.total_calls, canvas.reset_calls
+
+    import tkinter as tk
+    root = make_canvas.root = getattr(make_canvas, 'root', None) or tk.Tk()
+    canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT)
+    canvas.pack()
+    counter = CountingTk(canvas.tk)
+    canvas.tk = counter
+
+    def reset():
+        counter.count = 0
+    return canvas, lambda: counter.count, reset
+
+
+def item_state(canvas):
+    """Text, coordinates and visibility of every stub canvas item"""
+    return {item_id: (item['options'].get('text'), [float(value) for value in item['coords']],
+                      item['options'].get('state'))
+            for item_id, item in canvas.items.items()}
+
+
+def measure(scenario, renderer_class, batched, ticks, warmup, use_tk):
+    """Render a scenario; returns (round-trips per frame, ms per frame, canvas)"""
+    random.seed(SEED)
+    world = World(WIDTH, HEIGHT, rng=random.Random(SEED), verbose=False,
+                  kraken_count=KRAKENS.get(scenario, 1))
+    canvas, total_calls, reset_calls = make_canvas(use_tk)
+    target = BatchedCanvas(canvas) if batched else canvas
+    renderer = renderer_class(target, WIDTH, HEIGHT)
+    setup, before_tick = SCENARIOS[scenario]
+    setup(world)
+
+    rendering = 0.0
+    for tick in range(warmup + ticks):
+        if tick == warmup:
+            reset_calls()
+            rendering = 0.0
+        if before_tick is not None:
+            before_tick(world, tick)
+        world.step(TICK)
+        snapshot = world.snapshot()
+        start = time.perf_counter()
+        renderer.render(snapshot)
+        if batched:
+            target.flush()
+        if use_tk:
+            canvas.update_idletasks()  # Let Tk redraw, as the main loop would
+        rendering += time.perf_counter() - start
+    return total_calls() / ticks, rendering / ticks * 1000, canvas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scenario', choices=sorted(SCENARIOS), help='run one scenario (default: all)')
+    parser.add_argument('--ticks', type=int, default=300, help='measured frames per run')
+    parser.add_argument('--warmup', type=int, default=50, help='frames rendered before measuring')
+    parser.add_argument('--tk', action='store_true', help='draw on a real Tk canvas')
+    args = parser.parse_args()
+
+    print(f"{'scenario':<14}{'renderer':<10}{'calls/frame':>14}{'batched':>10}"
+          f"{'ms/frame':>12}{'batched':>10}")
+    for scenario in ([args.scenario] if args.scenario else list(SCENARIOS)):
+        for name, renderer_class in RENDERERS.items():
+            calls, ms, canvas = measure(scenario, renderer_class, False, args.ticks, args.warmup, args.tk)
+            batch_calls, batch_ms, batch_canvas = measure(scenario, renderer_class, True,
+                                                          args.ticks, args.warmup, args.tk)
+            note = ""
+            if not args.tk and item_state(canvas) != item_state(batch_canvas):
+                note = "  ❌ canvas items differ"
+            print(f"{scenario:<14}{name:<10}{calls:>14.1f}{batch_calls:>10.1f}"
+                  f"{ms:>12.3f}{batch_ms:>10.3f}{note}")
+
+
+if __name__ == "__main__":
+    main()
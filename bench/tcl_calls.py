@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tcl calls per frame: immediate mode vs retained mode
+Replays the pet's per-tick rendering (waves + boat, bubbles, kraken) through
+the pet's original draw functions (legacy_render.py) and reports canvas calls per frame.
+
+Usage:
+    python3 bench/tcl_calls.py          # display-free stub canvas
+    python3 bench/tcl_calls.py --tk     # real Tk canvas (needs a display)
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import designs
+from designs import get_kraken_color, get_density_font_size
+from kraken_sprites import ASCII_PET_SPRITES
+from legacy_render import render_ascii_art, render_underwater_environment, update_bubbles
+from profiler import CountingTk
+from stub_canvas import StubCanvas
+
+WIDTH = 800
+HEIGHT = 600
+
+
+def make_canvas(use_tk):
+    """Create a stub canvas, or a real one whose Tcl calls are counted"""
+    if not use_tk:
+        canvas = StubCanvas(WIDTH, HEIGHT)
+        return canvas, canvas.total_calls, canvas.reset_calls
+
+    import tkinter as tk
+    root = tk.Tk()
+    canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT)
+    counter = CountingTk(canvas.tk)
+    canvas.tk = counter
+
+    def reset():
+        counter.count = 0
+    return canvas, lambda: counter.count, reset
+
+
+def run(retained, frames, use_tk, seed=1):
+    """Render frames ticks and return average canvas calls per tick"""
+    designs.RENDER_CONFIG['retained'] = retained
+    random.seed(seed)
+    canvas, total_calls, reset_calls = make_canvas(use_tk)
+
+    bubbles = []
+    water_level = render_underwater_environment(canvas, WIDTH, HEIGHT, 0)
+    sprite_names = list(ASCII_PET_SPRITES)
+    x, y = WIDTH // 2, water_level + 100
+    boat_char_pos = -16
+    reset_calls()
+
+    for frame in range(frames):
+        # Waves and boat strip every 10 ticks, like update_behavior
+        if frame % 10 == 0:
+            render_underwater_environment(canvas, WIDTH, HEIGHT, frame // 10,
+                                          boat_char_pos=boat_char_pos, boat_active=True)
+        if frame % 3 == 0:
+            boat_char_pos += 1
+
+        # Bubble physics every tick
+        update_bubbles(bubbles, canvas, WIDTH, water_level, HEIGHT, spawn_chance=0.05)
+
+        # Kraken swims every tick and changes sprite every 5 ticks
+        x += 2 if (frame // 100) % 2 == 0 else -2
+        sprite = ASCII_PET_SPRITES[sprite_names[(frame // 5) % len(sprite_names)]]
+        render_ascii_art(sprite, x, y, canvas, tag="kraken",
+                         color=get_kraken_color(), font_size=get_density_font_size())
+
+    return total_calls() / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--frames', type=int, default=1000, help='ticks to render')
+    parser.add_argument('--tk', action='store_true', help='count calls on a real Tk canvas')
+    args = parser.parse_args()
+
+    before = run(False, args.frames, args.tk)
+    after = run(True, args.frames, args.tk)
+    print(f"Tcl calls per frame ({args.frames} frames, {'Tk' if args.tk else 'stub'} canvas)")
+    print(f"  immediate (delete + recreate): {before:8.2f}")
+    print(f"  retained (coords/itemconfig):  {after:8.2f}")
+    print(f"  reduction:                     {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Character Grid Compositor
+Renders World snapshots onto a Tk canvas as a character framebuffer instead
+of one canvas item per sprite line, bubble and shrimp: every layer is blitted
+into a CharFrame (spaces are transparent) and each row is drawn as a few
+text items, so the item count depends on the rows, not on the entities.
+"""
+
+from designs import RENDER_CONFIG, get_density_font_size
+from fontmetrics import font_metrics
+from framebuffer import FrameComposer
+from layers import RetainedLayer
+from nullprofiler import NULL_PROFILER
+from renderer import Renderer
+
+GRID_TAG = "grid"
+
+# (world width, world height, cell width) -> FrameComposer shared by every
+# GridRenderer of that world, so viewports compose each snapshot once
+_composers = {}
+
+
+def shared_composer(width, height, cell_width):
+    """The FrameComposer every grid viewport of a world this size uses"""
+    key = (width, height, cell_width)
+    composer = _composers.get(key)
+    if composer is None:
+        composer = _composers[key] = FrameComposer(width, height, cell_width)
+    return composer
+
+
+def row_layers(chars, colors):
+    """One (start, text, color) per color in a row, other colors' cells blanked
+
+    Overlaying the texts reproduces the row; a row needs as many items as
+    it has colors, but each item spans every cell of its color in between.
+    """
+    layers = {}  # color -> [first col, list of characters]
+    for col, char in enumerate(chars):
+        if char == ' ':
+            continue
+        color = colors[col]
+        layer = layers.get(color)
+        if layer is None:
+            layer = layers[color] = [col, [' '] * len(chars)]
+        layer[1][col] = char
+    return [(start, ''.join(line[start:]).rstrip(), color) for color, (start, line) in layers.items()]
+
+
+def row_runs(chars, colors):
+    """Adjacent same-colored characters of a row as (start, text, color) runs
+
+    Spaces look the same in any color, so they join whichever run they sit
+    in and only a change of color between visible characters starts a new
+    run; leading and trailing spaces are dropped. Every item covers just
+    its own stretch of the row.
+    """
+    runs = []  # [start, end, color]
+    for col, char in enumerate(chars):
+        if char == ' ':
+            continue
+        color = colors[col]
+        if runs and runs[-1][2] == color:
+            runs[-1][1] = col + 1
+        else:
+            runs.append([col, col + 1, color])
+    return [(start, ''.join(chars[start:end]), color) for start, end, color in runs]
+
+
+# How a row becomes text items (RENDER_CONFIG['grid_items'])
+ROW_SPLITTERS = {
+    'runs': row_runs,
+    'layers': row_layers,
+}
+
+
+class GridRenderer(Renderer):
+    """Draws composed CharFrames as a few retained text items per row
+
+    All items of a row share a monospace font and are placed at their
+    first character's cell; cells are as wide as the font's measured
+    characters, so runs starting mid-row line up with the ones before.
+    With 'runs' each item is one run of a single color; with 'layers' each
+    item holds all of one color's characters (other cells blank), which
+    needs fewer items when colors interleave.
+    The whole world is composed once per snapshot and shared by all the
+    viewports (each draws its own columns of it); only rows that changed
+    since the previous frame are touched, and unchanged items are skipped
+    by the RetainedLayer.
+
+    Args:
+        canvas: Canvas to draw on
+        width, height: Canvas size
+        origin_x: World x-coordinate of the canvas's left edge (viewports)
+        show_shrimp_counter, show_boat_counter: Accepted for SceneRenderer
+            compatibility; the counters are part of the composed frame and
+            land in the first/last viewport by position
+        items: 'runs' or 'layers' (default: RENDER_CONFIG['grid_items'])
+    """
+
+    def __init__(self, canvas, width, height, origin_x=0, show_shrimp_counter=True, show_boat_counter=True,
+                 items=None):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.origin_x = origin_x
+        self.font = ('Courier', get_density_font_size(), 'bold')
+        self.layer = RetainedLayer(canvas)
+        self.composer = None  # Shared composer, sized from the first snapshot (the whole world)
+        self.first_col = 0
+        self.cols = 0
+        self.drawn = None  # Composer serial of the frame drawn last
+        self.split_row = ROW_SPLITTERS[items or RENDER_CONFIG['grid_items']]
+        self.row_items = {}  # row -> number of visible items in that row
+        self.profiler = NULL_PROFILER  # Set a FrameProfiler to time render phases
+
+    def render(self, snapshot):
+        """Draw one frame of the world"""
+        if self.composer is None:
+            self.composer = shared_composer(snapshot.width, snapshot.height, font_metrics(self.font).char_width)
+            self.first_col = int(self.origin_x // self.composer.cell_width)
+            self.cols = -int(-self.width // self.composer.cell_width)  # Partial last column too
+        with self.profiler.phase('compose'):
+            frame, serial = self.composer.compose_shared(snapshot)
+        if serial == self.drawn:
+            return  # Same snapshot again: nothing to redraw
+        # Diff against the composer's previous frame only if that's the one on screen
+        previous = self.composer.frames[1] if serial - 1 == self.drawn else None
+        with self.profiler.phase('grid_render'):
+            for row in frame.changed_rows(previous):
+                self.render_row(frame, row)
+        self.drawn = serial
+
+    def render_row(self, frame, row):
+        """Update the items of one row, reusing them in order and hiding the rest"""
+        first = self.first_col
+        last = first + self.cols
+        pieces = self.split_row(frame.chars[row][first:last], frame.colors[row][first:last])
+
+        cell_width = self.composer.cell_width
+        y = row * self.composer.cell_height
+        for i, (start, text, color) in enumerate(pieces):
+            self.layer.text((row, i), start * cell_width, y, GRID_TAG, text=text,
+                            fill=color, font=self.font, anchor='nw')
+        for i in range(len(pieces), self.row_items.get(row, 0)):
+            self.layer.hide((row, i))
+        self.row_items[row] = len(pieces)
+
+    def close(self):
+        self.layer.discard_tag(GRID_TAG)
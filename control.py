@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Control Socket
+Lets other programs (a build server throwing shrimp on every green build,
+scripts, ...) feed the kraken and launch boats through a Unix domain
+socket instead of mouse clicks.
+
+The server runs on an asyncio event loop that never runs on its own: the
+pet polls it from a Tk after() callback, one non-blocking pass at a time,
+so the socket I/O happens on the Tk thread between frames and never blocks
+Tk's mainloop. Commands read from the socket are only queued; they are all
+applied at the start of the next simulation tick (through the same inputs
+as clicks, so recordings include them), and each gets its reply once that
+tick has run. A burst of thousands of feeds therefore costs one tick's
+worth of cheap drop_shrimp calls, not one frame per command.
+
+Protocol: one JSON object per line, one JSON reply line per command, in order.
+    {"cmd": "feed", "x": 300, "y": 400}          -> {"ok": true, "accepted": 1, "rejected": 0}
+    {"cmd": "feed_many", "points": [[x, y], ...]} -> {"ok": true, "accepted": N, "rejected": M}
+    {"cmd": "spawn_boat", "direction": "lr"}      -> {"ok": true, "spawned": true}
+    {"cmd": "stats"}                              -> {"ok": true, "shrimp_eaten": ..., ...}
+Anything else gets {"ok": false, "error": "..."}. Coordinates are world
+pixels, as for clicks; shrimp outside the water or beyond the shrimp limit
+are counted as rejected.
+
+Command-line client:
+    python3 control.py feed 300 400
+    python3 control.py feed_many 300,400 320,410
+    python3 control.py spawn_boat rl
+    python3 control.py stats
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import sys
+
+from designs import CONTROL_CONFIG
+
+
+class ControlServer:
+    """Unix-socket command server polled from the Tk loop
+
+    Args:
+        path: Socket path (~ is expanded)
+        world: World the commands act on
+        inputs: Where feeds and boats go (the world, or a Recorder wrapping it)
+        stats: Optional callable returning extra fields for the stats reply
+        on_command: Optional callable run when a command arrives (e.g. to wake an idle pet)
+    """
+
+    def __init__(self, path, world, inputs=None, stats=None, on_command=None):
+        self.path = os.path.expanduser(path)
+        self.world = world
+        self.inputs = inputs or world
+        self.extra_stats = stats
+        self.on_command = on_command
+        self.loop = asyncio.new_event_loop()
+        self.server = None
+        self.pending = []  # (command line, client writer, future done once answered) read since the last tick
+        self.writers = set()  # Open client connections
+        self.commands_applied = 0
+        self.ticks_with_commands = 0
+
+    # ===== LIFECYCLE =====
+
+    def start(self):
+        """Listen on the socket (raises OSError if it can't)"""
+        if not hasattr(asyncio, 'start_unix_server'):
+            raise OSError("Unix domain sockets are not supported on this platform")
+        self.remove_stale_socket()
+        try:
+            self.server = self.loop.run_until_complete(asyncio.start_unix_server(
+                self.handle_client, self.path, limit=CONTROL_CONFIG['max_line']))
+        except NotImplementedError:
+            raise OSError("Unix domain sockets are not supported by this event loop")
+        os.chmod(self.path, 0o600)  # Only this user may drive the pet
+
+    def remove_stale_socket(self):
+        """Delete a socket file left by a pet that didn't exit cleanly"""
+        if not os.path.exists(self.path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.path)  # Nobody listening
+            return
+        finally:
+            probe.close()
+        raise OSError(f"{self.path} is in use (is another pet running?)")
+
+    def poll(self):
+        """Run one non-blocking pass of the event loop (accept, read, write what's ready)"""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+    def close(self):
+        """Stop listening, drop the clients and remove the socket file"""
+        if self.server is None:
+            return
+        self.server.close()
+        for _, _, future in self.pending:
+            future.set_result(None)  # Unanswered: nothing waits for these any more
+        self.pending = []
+        for writer in list(self.writers):
+            writer.close()
+        # Let the client handlers see their connections close and return
+        tasks = asyncio.all_tasks(self.loop)
+        if tasks:
+            self.loop.run_until_complete(asyncio.wait(tasks, timeout=1.0))
+        self.loop.close()
+        self.server = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    # ===== CONNECTIONS =====
+
+    async def handle_client(self, reader, writer):
+        """Queue every line a client sends; replies are written as their tick runs"""
+        self.writers.add(writer)
+        future = None  # Done once this client's latest command is answered
+        try:
+            while True:
+                # Don't let a flood of commands grow the queue without bound
+                while len(self.pending) >= CONTROL_CONFIG['max_pending']:
+                    await asyncio.sleep(CONTROL_CONFIG['poll_interval'])
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than max_line: answer and drop the connection
+                    self.reply(writer, json.dumps({'ok': False, 'error': 'line too long'}))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                future = self.loop.create_future()
+                self.pending.append((line, writer, future))
+                if self.on_command is not None:
+                    self.on_command()
+            if future is not None:
+                await future  # Answer everything sent before the client stopped writing
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.writers.discard(writer)
+            writer.close()
+
+    def reply(self, writer, text):
+        """Send reply lines to a client (buffered; the event loop sends them on its next pass)"""
+        if not writer.is_closing():
+            writer.write(text.encode() + b'\n')
+
+    # ===== COMMANDS =====
+
+    def apply_pending(self):
+        """Apply the queued commands in one go (call at the start of a simulation tick)
+
+        At most CONTROL_CONFIG['max_per_tick'] run per tick so a burst can't
+        stall a frame; the rest wait for the next tick, in order.
+        """
+        if not self.pending:
+            return
+        limit = CONTROL_CONFIG['max_per_tick']
+        pending, self.pending = self.pending[:limit], self.pending[limit:]
+        replies = {}  # Writer -> reply lines, sent with one write per client
+        verbose = self.world.verbose
+        self.world.verbose = False  # One log line per rejected shrimp would flood the terminal
+        try:
+            for line, writer, future in pending:
+                try:
+                    response = self.execute(json.loads(line))
+                except KeyError as e:
+                    response = {'ok': False, 'error': f"missing field {e}"}
+                except (ValueError, TypeError) as e:
+                    response = {'ok': False, 'error': str(e)}
+                except Exception as e:
+                    # Whatever a command breaks, the pet and the other clients carry on
+                    print(f"⚠️ Control command failed: {e!r}")
+                    response = {'ok': False, 'error': f"command failed: {e}"}
+                self.commands_applied += 1
+                replies.setdefault(writer, []).append(json.dumps(response))
+                future.set_result(None)
+        finally:
+            self.world.verbose = verbose
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_result(None)  # Never leave a client waiting on a reply that won't come
+        for writer, lines in replies.items():
+            self.reply(writer, '\n'.join(lines))
+        self.ticks_with_commands += 1
+
+    def execute(self, command):
+        """Run one parsed command and return its reply"""
+        if not isinstance(command, dict):
+            raise ValueError("expected a JSON object")
+        cmd = command.get('cmd')
+        if cmd == 'feed':
+            return self.feed([(command['x'], command['y'])])
+        if cmd == 'feed_many':
+            points = command['points']
+            if not isinstance(points, list) or len(points) > CONTROL_CONFIG['max_points']:
+                raise ValueError(f"points must be a list of at most {CONTROL_CONFIG['max_points']} [x, y] pairs")
+            return self.feed(points)
+        if cmd == 'spawn_boat':
+            direction = command.get('direction', 'lr')
+            if direction not in ('lr', 'rl'):
+                raise ValueError("direction must be 'lr' or 'rl'")
+            spawned = not self.world.boat.active
+            if spawned:
+                self.inputs.spawn_boat(direction=direction)
+            return {'ok': True, 'spawned': spawned}
+        if cmd == 'stats':
+            return self.stats()
+        raise ValueError(f"unknown command {cmd!r}")
+
+    def feed(self, points):
+        """Drop a shrimp at every (x, y); returns how many the world took
+
+        Points outside the world are rejected without reaching the world (or
+        the recorder).
+        """
+        parsed = []
+        for point in points:
+            x, y = point
+            if not all(isinstance(value, (int, float)) and math.isfinite(value) for value in (x, y)):
+                raise ValueError("coordinates must be finite numbers")
+            parsed.append((int(x), int(y)))  # Validate them all before dropping any
+        inside = [(x, y) for x, y in parsed if 0 <= x < self.world.width and 0 <= y < self.world.height]
+        accepted = sum(1 for x, y in inside if self.inputs.drop_shrimp(x, y))
+        return {'ok': True, 'accepted': accepted, 'rejected': len(parsed) - accepted}
+
+    def stats(self):
+        world = self.world
+        stats = {
+            'ok': True,
+            'shrimp_eaten': world.shrimp_eaten_count,
+            'boats_destroyed': world.boats_destroyed,
+            'shrimp': len(world.shrimp),
+            'max_shrimp': world.max_shrimp,
+            'krakens': len(world.krakens),
+            'boat_active': world.boat.active,
+            'width': world.width,
+            'height': world.height,
+            'water_level': world.water_level,
+            'commands_applied': self.commands_applied,
+        }
+        if self.extra_stats is not None:
+            stats.update(self.extra_stats())
+        return stats
+
+
+# ===== CLIENT =====
+
+def send_commands(path, commands, timeout=5.0):
+    """Send commands to a running pet and return its replies (in order)"""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    client.connect(os.path.expanduser(path))
+    with client, client.makefile('rwb') as stream:
+        for command in commands:
+            stream.write(json.dumps(command).encode() + b'\n')
+        stream.flush()
+        return [json.loads(stream.readline()) for _ in commands]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send a command to a running ASCII pet")
+    parser.add_argument('--socket', default=CONTROL_CONFIG['path'],
+                        help=f"control socket (default: {CONTROL_CONFIG['path']})")
+    commands = parser.add_subparsers(dest='cmd', required=True)
+    feed = commands.add_parser('feed', help='drop a shrimp at world pixel x, y')
+    feed.add_argument('x', type=int)
+    feed.add_argument('y', type=int)
+    feed_many = commands.add_parser('feed_many', help='drop shrimp at several x,y points')
+    feed_many.add_argument('points', nargs='+', metavar='X,Y')
+    boat = commands.add_parser('spawn_boat', help='launch a boat')
+    boat.add_argument('direction', nargs='?', choices=('lr', 'rl'), default='lr')
+    commands.add_parser('stats', help='print counters and frame statistics')
+    args = parser.parse_args()
+
+    command = {'cmd': args.cmd}
+    if args.cmd == 'feed':
+        command.update(x=args.x, y=args.y)
+    elif args.cmd == 'feed_many':
+        command['points'] = [[int(value) for value in point.split(',')] for point in args.points]
+    elif args.cmd == 'spawn_boat':
+        command['direction'] = args.direction
+
+    try:
+        response, = send_commands(args.socket, [command])
+    except OSError as e:
+        print(f"⚠️ Could not reach the pet at {args.socket}: {e}")
+        sys.exit(1)
+    print(json.dumps(response, indent=2))
+    sys.exit(0 if response.get('ok') else 1)
+
+
+if __name__ == "__main__":
+    main()
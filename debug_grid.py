@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Debug Grid Overlay
+Only imported when DEBUG_CONFIG['show_grid'] is enabled.
+"""
+
+from designs import DEBUG_CONFIG, RENDER_CONFIG, get_density_font_size
+from layers import layer_for
+
+
+def render_debug_grid(canvas, width, height, water_level):
+    """Render a debugging grid overlay to help with positioning and boundaries
+    
+    Args:
+        canvas: Tkinter canvas
+        width: Canvas width
+        height: Canvas height
+        water_level: Y-coordinate of water surface
+    """
+    grid_size = DEBUG_CONFIG['grid_size']
+    grid_color = DEBUG_CONFIG['grid_color']
+    
+    layer = layer_for(canvas, RENDER_CONFIG['retained'])
+    layer.begin("debug_grid")  # Clears previous debug elements in immediate mode
+    created = False
+    
+    # Draw vertical grid lines
+    for x in range(0, width, grid_size):
+        created |= layer.line(
+            ("debug_grid", "x", x),
+            x, 0, x, height, "debug_grid",
+            fill=grid_color,
+            dash=(2, 4)  # Dashed line
+        )
+        # Add x-coordinate labels
+        if DEBUG_CONFIG['show_coordinates'] and x > 0:
+            created |= layer.text(
+                ("debug_grid", "x_label", x),
+                x, 10, "debug_grid",
+                text=str(x),
+                fill='#888888',
+                font=('Arial', 8)
+            )
+    
+    # Draw horizontal grid lines
+    for y in range(0, height, grid_size):
+        created |= layer.line(
+            ("debug_grid", "y", y),
+            0, y, width, y, "debug_grid",
+            fill=grid_color,
+            dash=(2, 4)  # Dashed line
+        )
+        # Add y-coordinate labels
+        if DEBUG_CONFIG['show_coordinates'] and y > 0:
+            created |= layer.text(
+                ("debug_grid", "y_label", y),
+                10, y, "debug_grid",
+                text=str(y),
+                fill='#888888',
+                font=('Arial', 8)
+            )
+    
+    # Show boundaries if enabled
+    if DEBUG_CONFIG['show_boundaries']:
+        # Calculate wave surface height
+        wave_font_size = max(6, get_density_font_size() - 2)
+        wave_line_height = wave_font_size + 2
+        surface_height = wave_line_height * 2
+        
+        # Water level line (top of waves) - HIDDEN
+        # canvas.create_line(
+        #     0, water_level, width, water_level,
+        #     fill='#00FFFF',  # Cyan
+        #     width=2,
+        #     tags="debug_grid"
+        # )
+        # canvas.create_text(
+        #     width - 80, water_level - 10,
+        #     text=f"Water Level: {water_level}",
+        #     fill='#00FFFF',
+        #     font=('Arial', 9, 'bold'),
+        #     tags="debug_grid"
+        # )
+        
+        # Underwater start (below waves) - HIDDEN
+        # underwater_start = water_level + surface_height + 5
+        # canvas.create_line(
+        #     0, underwater_start, width, underwater_start,
+        #     fill='#00FF00',  # Green
+        #     width=2,
+        #     tags="debug_grid"
+        # )
+        # canvas.create_text(
+        #     width - 120, underwater_start + 15,
+        #     text=f"Underwater Start: {underwater_start}",
+        #     fill='#00FF00',
+        #     font=('Arial', 9, 'bold'),
+        #     tags="debug_grid"
+        # )
+        
+        # Ocean floor boundary
+        ocean_floor = height - 50
+        created |= layer.line(
+            ("debug_grid", "ocean_floor"),
+            0, ocean_floor, width, ocean_floor, "debug_grid",
+            fill='#FF8800',  # Orange
+            width=2
+        )
+        created |= layer.text(
+            ("debug_grid", "ocean_floor_label"),
+            width - 100, ocean_floor - 15, "debug_grid",
+            text=f"Ocean Floor: {ocean_floor}",
+            fill='#FF8800',
+            font=('Arial', 9, 'bold')
+        )
+    
+    # Keep grid below other elements but above environment
+    # Only lower if bubbles exist (to avoid "doesn't match any items" error)
+    # Retained grid items keep their stacking order once placed
+    if created and canvas.find_withtag("bubbles"):
+        canvas.tag_lower("debug_grid", "bubbles")
@@ -4,6 +4,8 @@ ASCII Underwater Kraken Environment
 Collection of ASCII art for underwater kraken animations
 """
 
+from fontmetrics import font_metrics
+
 # ===== CONFIGURATION =====
 # Master density control - adjust this to change overall ASCII character density
 # Higher values = more characters visible, smaller individual characters
@@ -17,13 +19,34 @@ ASCII_DENSITY_CONFIG = {
 # Kraken appearance configuration
 KRAKEN_CONFIG = {
     'color': '#E0C6FF',  # Kraken sprite color (change this to update all kraken sprites)
+    'count': 1,          # Krakens sharing the aquarium (they compete for the same shrimp)
 }
 
 # Boat configuration
 BOAT_CONFIG = {
-    'speed': 1,
+    'speed': 10 / 3,  # Characters per second (independent of frame rate)
     'color': '#FFFFFF',
-    'update_interval': 3  # Update every N frames to slow down movement
+}
+
+# Frame scheduling configuration
+SCHEDULER_CONFIG = {
+    'fps_plugged_in': 60,  # Render rate cap on mains power
+    'fps_on_battery': 5,   # Render rate cap on battery
+    'power_check_interval': 30.0,  # Seconds between power source checks
+    'first_power_check': 1.0,      # Seconds after startup before the first check
+    'max_catch_up': 5.0,   # Most simulated seconds caught up after a stall
+    'idle_interval': 1.0,  # Seconds between simulation wakeups while idle (nothing rendered)
+    'idle_after': 5.0,     # Seconds of quiet before going idle
+    'idle_bubble_distance': 0,  # Bubbles this close (px) to a kraken's sprite keep it from going idle
+    # Tk reports windows covered by others only on X11 (<Visibility>); elsewhere minimized or
+    # withdrawn windows are found by checking their state this often (seconds)
+    'window_check_interval': 1.0,
+}
+
+# Shrimp (food) configuration
+FOOD_CONFIG = {
+    'max_shrimp': 20,     # Maximum shrimp in the water (raise to thousands for a "feeding frenzy")
+    'min_distance': 80,   # Minimum distance between dropped shrimp in pixels
 }
 
 # Debug grid overlay configuration
@@ -33,6 +56,93 @@ DEBUG_CONFIG = {
     'grid_color': '#444444',  # Grid line color (dark gray)
     'show_coordinates': True,  # Show coordinate labels
     'show_boundaries': True,   # Show water level and boundaries
+    'log_movement': False,     # Print kraken boundary clamping (very noisy)
+}
+
+# Profiling configuration (per-phase frame timings)
+PROFILE_CONFIG = {
+    'enabled': False,          # Time tick/render phases and count Tcl calls
+    'show_hud': True,          # Show the timings overlay on the canvas (when enabled)
+    'hud_interval': 0.5,       # Seconds between overlay refreshes
+    'window': 600,             # Samples kept per phase for p50/p95/p99
+    'dump_path': 'pet_profile.json',  # Written on exit (None to skip)
+}
+
+# Adaptive quality: trade detail for CPU time when frames get expensive
+QUALITY_CONFIG = {
+    'enabled': True,
+    'budget_ms': 8.0,          # CPU per rendered frame (simulation + rendering) to stay within
+    'window': 30,              # Frames averaged for each decision
+    'downgrade_above': 1.0,    # Lower quality when the average exceeds budget x this
+    'upgrade_below': 0.5,      # Raise it again when the average is under budget x this
+    'cooldown': 3.0,           # Seconds after a change before the next one (x4 when an upgrade fails)
+}
+
+# Quality levels, best first. bubbles scales the spawn chance, wave_ticks is
+# how many ticks the procedural waves hold still and sprite_rate scales sprite
+# animation speed
+QUALITY_LEVELS = [
+    {'name': 'full',    'bubbles': 1.0,  'wave_ticks': 1, 'sprite_rate': 1.0},
+    {'name': 'reduced', 'bubbles': 0.5,  'wave_ticks': 2, 'sprite_rate': 1.0},
+    {'name': 'low',     'bubbles': 0.25, 'wave_ticks': 5, 'sprite_rate': 0.5},
+    {'name': 'minimal', 'bubbles': 0.1,  'wave_ticks': 10, 'sprite_rate': 0.5},
+]
+
+# Pet state kept across restarts (counters, queued shrimp, kraken positions)
+SAVE_CONFIG = {
+    'enabled': True,           # Restore the last state on startup and save it while running
+    'path': '~/.ascii_pet_state',  # Binary snapshot file
+    'interval': 30,            # Seconds between snapshots (one more is written on exit)
+}
+
+# Local control socket (see control.py): feed the kraken and launch boats from scripts
+CONTROL_CONFIG = {
+    'enabled': False,          # Listen on startup (or start the pet with --control)
+    'path': '~/.ascii_pet.sock',  # Unix domain socket
+    'poll_interval': 0.02,     # Seconds between non-blocking passes of the socket's event loop
+    'max_per_tick': 200,       # Commands applied per simulation tick (a burst spreads over a few ticks)
+    'max_pending': 10000,      # Queued commands before clients have to wait for the next tick
+    'max_points': 1000,        # Most shrimp in one feed_many
+    'max_line': 65536,         # Longest command line in bytes
+}
+
+# Multi-monitor aquarium: one world shown across several windows
+VIEWPORT_CONFIG = {
+    'regions': None,           # Monitor regions as [(x, y, width, height), ...]; None = one window
+    'height': None,            # Window/world height in pixels (None = same as the single window)
+    'bottom_margin': 50,       # Gap between each window and the bottom of its monitor
+}
+
+# Procedural ocean surface (waves.py)
+WAVE_CONFIG = {
+    'procedural': True,  # Sum-of-sines surface; False = cycle the four ocean_surface_frame strings
+    'period': 600,       # Phase buckets (ticks) before the pattern repeats
+    # (amplitude, wavelength in characters, cycles per period); negative cycles travel left
+    'components': [(1.0, 2.0, 30), (0.7, 3.1, -23), (0.5, 11.0, 11), (0.35, 29.0, -5)],
+    'threshold': 0.0,    # Heights above this become ≈, below ~
+    # Wakes and splashes (height field on top of the waves)
+    'ripple_speed': 0.6,         # Columns per tick a ripple spreads (below 1)
+    'ripple_damping': 0.9,       # Fraction of a ripple kept each tick
+    'ripple_rest': 0.05,         # Below this the water counts as calm again
+    'ripple_glyph_level': 0.3,   # Ripples stronger than this show as ≈ (crest) / ~ (trough)
+    'splash_glyph_level': 1.2,   # Crests higher than this show as spray (^)
+    'wake_strength': 0.5,        # Impulse from the boat's bow (up) and stern (down) each tick
+    'splash_strength': 2.5,      # Impulse from a kraken thrashing at the surface
+}
+
+# Terminal backend configuration (terminal.py)
+TERMINAL_CONFIG = {
+    'fps': 10,          # Frames per second (one per simulation tick is plenty for whole cells)
+    'truecolor': None,  # 24-bit colors; None = detect from $COLORTERM, else 256 colors
+    'mouse': True,      # Click to feed/spawn boats (xterm mouse reporting, works in tmux)
+}
+
+# Canvas rendering configuration
+RENDER_CONFIG = {
+    'retained': True,  # Reuse canvas items between frames (False = delete and recreate every frame)
+    'backend': 'items',  # 'items' = canvas items per sprite/bubble/shrimp, 'grid' = character grid rows
+    'grid_items': 'runs',  # Grid rows as 'runs' (one item per same-color run) or 'layers' (one per color)
+    'batch_tcl': True,  # Queue each frame's canvas updates and send them to Tcl in one call
 }
 
 # Boat ASCII art - Left to Right (6 lines tall, rectangularized)
@@ -80,7 +190,7 @@ def get_boat_sprite(direction='lr'):
     return BOAT_SPRITE_LR
 
 def get_boat_speed():
-    """Get the configured boat speed"""
+    """Get the configured boat speed in characters per second"""
     return BOAT_CONFIG['speed']
 
 def get_boat_color():
@@ -93,10 +203,6 @@ def get_boat_width():
         return len(BOAT_SPRITE_LR[0])
     return 0
 
-def get_boat_update_interval():
-    """Get the configured boat update interval (frames between position updates)"""
-    return BOAT_CONFIG['update_interval']
-
 def integrate_boat_into_waves(wave_line, boat_line, boat_char_position):
     """Integrate a boat line into a wave line at the specified character position
     
@@ -128,214 +234,13 @@ def integrate_boat_into_waves(wave_line, boat_line, boat_char_position):
     
     return ''.join(wave_chars)
 
-# ASCII art for the kraken in different states
-# Each state has multiple frames for animation
-# All sprites are 11 lines tall and 23 characters wide (rectangular)
-
-ASCII_PET_SPRITES = {
-    # Idle - simple compact octopus design
-    # Clean structure with clear tentacles
-    'idle1': [
-        "         ______        ",
-        "        /      \\       ",
-        "       /        \\      ",
-        "       |        |      ",
-        "    )  o        o   ?  ",
-        "   (    \\      /    |  ",
-        "  _ \\___/||||||\\___/ _ ",
-        "   \\____/ |||| \\____/ `",
-        "   ,-.___/ || \\__,-._  ",
-        "  /    ___/  \\__       ",
-        "     _/         `---   ",
-    ],
-    
-    'idle2': [
-        "         ______        ",
-        "        /      \\       ",
-        "       /        \\      ",
-        "       |        |      ",
-        "    )  O        O   ?  ",
-        "   (    \\  __  /    |  ",
-        "  _ \\___/||||||\\___/ _ ",
-        "   \\____/ |||| \\____/ `",
-        "   ,-.___/ || \\__,-._  ",
-        "  /    ___/  \\__       ",
-        "     _/         `---   ",
-    ],
-    
-    # Swimming - tentacles actively moving
-    'swim1': [
-        "         ______        ",
-        "        /      \\       ",
-        "       /        \\      ",
-        "       |        |      ",
-        "    )  @        @   ?  ",
-        "   (    \\  >   /    |  ",
-        "  _ \\___/||||||\\___/ _ ",
-        "   \\____/ |||| \\____/ `",
-        "   ,-.___/ || \\__,-._  ",
-        "  /    ___/  \\__       ",
-        "     _/         `---   ",
-    ],
-    
-    'swim2': [
-        "         ______        ",
-        "        /      \\       ",
-        "       /        \\      ",
-        "       |        |      ",
-        "    )  O        O   ?  ",
-        "   (    \\  ^   /    |  ",
-        "  _ \\___/||||||\\___/ _ ",
-        "   \\____/ |||| \\____/ `",
-        "   ,-.___/ || \\__,-._  ",
-        "  /    ___/  \\__       ",
-        "     _/         `---   ",
-    ],
-    
-    'swim3': [
-        "         ______        ",
-        "        /      \\       ",
-        "       /        \\      ",
-        "       |        |      ",
-        "    )  @        @   ?  ",
-        "   (    \\  >   /    |  ",
-        "  _ \\___/||||||\\___/ _ ",
-        "   \\____/ |||| \\____/ `",
-        "   ,-.___/ || \\__,-._  ",
-        "  /    ___/  \\__       ",
-        "     _/         `---   ",
-    ],
-    
-    # Eating - chewing animation (no tentacle wrapping)
-    # Mouth is positioned over shrimp, then chews
-    'eat1': [
-        "         ______        ",
-        "        /      \\       ",
-        "       /        \\      ",
-        "       |        |      ",
-        "    )  X        X   ?  ",
-        "   (    \\ /VV\\ /    |  ",
-        "  _ \\___/||||||\\___/ _ ",
-        "   \\____/ |||| \\____/ `",
-        "   ,-.___/ || \\__,-._  ",
-        "  /    ___/  \\__       ",
-        "     _/         `---   ",
-    ],
-    
-    'eat2': [
-        "         ______        ",
-        "        /      \\       ",
-        "       /        \\      ",
-        "       |        |      ",
-        "    )  *        *   ?  ",
-        "   (    \\ <WW> /    |  ",
-        "  _ \\___/||||||\\___/ _ ",
-        "   \\____/ |||| \\____/ `",
-        "   ,-.___/ || \\__,-._  ",
-        "  /    ___/  \\__       ",
-        "     _/         `---   ",
-    ],
-    
-    'eat3': [
-        "         ______        ",
-        "        /      \\       ",
-        "       /        \\      ",
-        "       |        |      ",
-        "    )  ^        ^   ?  ",
-        "   (    \\ /^^\\ /    |  ",
-        "  _ \\___/||||||\\___/ _ ",
-        "   \\____/ |||| \\____/ `",
-        "   ,-.___/ || \\__,-._  ",
-        "  /    ___/  \\__       ",
-        "     _/         `---   ",
-    ],
-    
-    # Upside-down swimming sprites (for swimming to intercept boats)
-    'swim_flip1': [
-        "     _/         `---   ",
-        "  /    ___/  \\__       ",
-        "   ,-.___/ || \\__,-._  ",
-        "   \\____/ |||| \\____/ `",
-        "  _ \\___/||||||\\___/ _ ",
-        "   (    \\      /    |  ",
-        "    )  @        @   ?  ",
-        "       |        |      ",
-        "       \\        /      ",
-        "        \\______/       ",
-        "                       ",
-    ],
-    
-    'swim_flip2': [
-        "     _/         `---   ",
-        "  /    ___/  \\__       ",
-        "   ,-.___/ || \\__,-._  ",
-        "   \\____/ |||| \\____/ `",
-        "  _ \\___/||||||\\___/ _ ",
-        "   (    \\  ^   /    |  ",
-        "    )  O        O   ?  ",
-        "       |        |      ",
-        "       \\        /      ",
-        "        \\______/       ",
-        "                       ",
-    ],
-    
-    'swim_flip3': [
-        "     _/         `---   ",
-        "  /    ___/  \\__       ",
-        "   ,-.___/ || \\__,-._  ",
-        "   \\____/ |||| \\____/ `",
-        "  _ \\___/||||||\\___/ _ ",
-        "   (    \\  >   /    |  ",
-        "    )  @        @   ?  ",
-        "       |        |      ",
-        "       \\        /      ",
-        "        \\______/       ",
-        "                       ",
-    ],
-    
-    # Upside-down attack sprites (for attacking boats)
-    'attack1': [
-        "     _/         `---   ",
-        "  /    ___/  \\__       ",
-        "   ,-.___/ || \\__,-._  ",
-        "   \\____/ |||| \\____/ `",
-        "  _ \\___/||||||\\___/ _ ",
-        "   (    \\  ><  /    |  ",
-        "    )  @        @   ?  ",
-        "       |        |      ",
-        "       \\        /      ",
-        "        \\______/       ",
-        "                       ",
-    ],
-    
-    'attack2': [
-        "     _/         `---   ",
-        "  /    ___/  \\__       ",
-        "   ,-.___/ || \\__,-._  ",
-        "   \\____/ |||| \\____/ `",
-        "  _ \\___/||||||\\___/ _ ",
-        "   (    \\ >XX< /    |  ",
-        "    )  X        X   ?  ",
-        "       |        |      ",
-        "       \\        /      ",
-        "        \\______/       ",
-        "                       ",
-    ],
-    
-    'attack3': [
-        "     _/         `---   ",
-        "  /    ___/  \\__       ",
-        "   ,-.___/ || \\__,-._  ",
-        "   \\____/ |||| \\____/ `",
-        "  _ \\___/||||||\\___/ _ ",
-        "   (    \\ <**> /    |  ",
-        "    )  *        *   ?  ",
-        "       |        |      ",
-        "       \\        /      ",
-        "        \\______/       ",
-        "                       ",
-    ],
-}
+# Kraken sprite frames live in kraken_sprites.py and are only loaded when the
+# first sprite is drawn (designs.ASCII_PET_SPRITES still works, see __getattr__)
+def __getattr__(name):
+    if name == 'ASCII_PET_SPRITES':
+        from kraken_sprites import ASCII_PET_SPRITES
+        return ASCII_PET_SPRITES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Animation sequences for different kraken states
 ASCII_ANIMATIONS = {
@@ -346,6 +251,10 @@ ASCII_ANIMATIONS = {
     'attacking': ['attack1', 'attack2', 'attack3']
 }
 
+# Font of the ocean surface lines (waves and the boat); its measured size
+# converts surface character positions to pixels (see fontmetrics.py)
+SURFACE_FONT = ('Courier', 8, 'bold')
+
 # Ocean Cross-Section Environment ASCII Art
 UNDERWATER_ENVIRONMENT = {
 
@@ -363,352 +272,31 @@ UNDERWATER_ENVIRONMENT = {
 
 def get_ascii_pet(sprite_name):
     """Get ASCII art for a specific sprite"""
+    from kraken_sprites import ASCII_PET_SPRITES
     return ASCII_PET_SPRITES.get(sprite_name, ASCII_PET_SPRITES['idle1'])
 
 def get_animation_frames(state):
     """Get animation sequence for a specific state"""
     return ASCII_ANIMATIONS.get(state, ASCII_ANIMATIONS['idle'])
 
-def render_ascii_art(lines, x, y, canvas, tag="pet", color="#333333", font_size=6):
-    """Render ASCII art on a tkinter canvas with customizable font size"""
-    canvas.delete(tag)  # Clear previous art
-    
-    line_height = font_size + 2
-    for i, line in enumerate(lines):
-        canvas.create_text(
-            x, y + (i * line_height), 
-            text=line, 
-            font=('Courier', font_size, 'bold'), 
-            anchor='center',
-            fill=color,
-            tags=tag
-        )
-
-def render_underwater_environment(canvas, width, height, animation_frame=0, boat_char_pos=None, boat_active=False, boat_direction='lr'):
-    """Render ocean cross-section: top 1/5 surface area, bottom 4/5 underwater
-    
-    Args:
-        canvas: Tkinter canvas
-        width: Canvas width
-        height: Canvas height
-        animation_frame: Current animation frame for wave animation
-        boat_char_pos: Character position of boat (for integration into waves)
-        boat_active: Whether boat is active and should be rendered
-        boat_direction: Direction of boat ('lr' = left-to-right, 'rl' = right-to-left)
-    """
-    canvas.delete("environment")  # Clear previous environment
-    
-    # Calculate water level (top 1/5 is surface, bottom 4/5 is underwater)
-    water_level = height // 5
-    underwater_height = height - water_level
-    
-    # ===== SURFACE AREA (Top 1/5) =====
-    # Draw surface area background (deep blue, almost black)
-    canvas.create_rectangle(
-        0, 0, width, water_level,
-        fill='#0A0F1C', outline='',
-        tags="environment"
-    )
-    
-    # ===== ANIMATED OCEAN SURFACE (7 LINES TALL: 5 blank + 2 waves) =====
-    # Cycle through wave animation frames
-    wave_frames = [
-        UNDERWATER_ENVIRONMENT['ocean_surface_frame1'],
-        UNDERWATER_ENVIRONMENT['ocean_surface_frame2'],
-        UNDERWATER_ENVIRONMENT['ocean_surface_frame3'],
-        UNDERWATER_ENVIRONMENT['ocean_surface_frame4']
-    ]
-    current_wave_top = wave_frames[animation_frame % 4]
-    # Bottom line uses alternating frame for better wave effect
-    current_wave_bottom = wave_frames[(animation_frame + 2) % 4]
-    
-    # Make surface lines span the ENTIRE width
-    num_repeats = (width // 8) + 2  # Character width ~8 pixels, add extra for safety
-    full_wave_line_top = current_wave_top * num_repeats
-    full_wave_line_bottom = current_wave_bottom * num_repeats
-    
-    # Create 5 blank lines above waves
-    blank_line = " " * (len(full_wave_line_top))
-    
-    # Integrate boat into surface if active (boat is 6 lines, overlaps top wave)
-    if boat_active and boat_char_pos is not None:
-        boat_sprite = get_boat_sprite(boat_direction)
-        if len(boat_sprite) >= 6:
-            # Boat line 5 (hull bottom) overwrites the top wave line
-            full_wave_line_top = integrate_boat_into_waves(full_wave_line_top, boat_sprite[5], boat_char_pos)
-    
-    # Render 7-line surface: 5 blank lines + 2 wave lines
-    line_height = 10
-    surface_y_start = water_level - (5 * line_height)  # Start 5 lines above water_level
-    
-    # Draw 5 blank lines (or boat lines 1-5 if boat is present)
-    for i in range(5):
-        y_pos = surface_y_start + (i * line_height)
-        
-        if boat_active and boat_char_pos is not None and i < len(boat_sprite) - 1:
-            # Render boat line i into this blank line
-            boat_line_text = blank_line
-            boat_line_text = integrate_boat_into_waves(boat_line_text, boat_sprite[i], boat_char_pos)
-            canvas.create_text(
-                0, y_pos,
-                text=boat_line_text,
-                font=('Courier', 8, 'bold'),
-                fill='#FFFFFF',
-                anchor='w',
-                tags="environment"
-            )
-        else:
-            # Just blank space
-            canvas.create_text(
-                0, y_pos,
-                text=blank_line,
-                font=('Courier', 8, 'bold'),
-                fill='#FFFFFF',
-                anchor='w',
-                tags="environment"
-            )
-    
-    # Draw FIRST animated wave line (line 6, with boat hull bottom overlapping if active)
-    canvas.create_text(
-        0, water_level,  # First wave line at water level
-        text=full_wave_line_top,
-        font=('Courier', 8, 'bold'),
-        fill='#FFFFFF',
-        anchor='w',  # Anchor to west (left) to ensure full coverage
-        tags="environment"
-    )
-    
-    # Draw SECOND animated wave line (line 7, bottom wave)
-    canvas.create_text(
-        0, water_level + 10,  # Second line below first
-        text=full_wave_line_bottom,
-        font=('Courier', 8, 'bold'),
-        fill='#AAAAAA',  # Slightly darker to show depth
-        anchor='w',
-        tags="environment"
-    )
-    
-    # ===== UNDERWATER AREA (Bottom 4/5) =====
-    # Draw underwater background (deep blue, almost black)
-    # Start below the 2-line surface (20 pixels for 2 lines)
-    surface_height = 20  # Height of 2-line surface
-    canvas.create_rectangle(
-        0, water_level + surface_height, width, height,
-        fill='#0A0F1C', outline='',
-        tags="environment"
-    )
-    
-    # CRITICAL: Lower environment to bottom of z-order so it doesn't cover kraken/shrimp/bubbles
-    canvas.lower("environment")
-    
-    # Draw debug grid if enabled
-    if DEBUG_CONFIG['show_grid']:
-        render_debug_grid(canvas, width, height, water_level)
-    
-    return water_level  # Return water level for movement constraints
+def get_surface_height():
+    """Height of the 2-line wave surface in pixels (two lines of the measured SURFACE_FONT)"""
+    return 2 * font_metrics(SURFACE_FONT).line_height
 
-def render_debug_grid(canvas, width, height, water_level):
-    """Render a debugging grid overlay to help with positioning and boundaries
+def is_in_water(x, y, water_level, canvas_height, surface_height=None):
+    """Check if coordinates are in the underwater area (bottom 4/5 of canvas)
     
     Args:
-        canvas: Tkinter canvas
-        width: Canvas width
-        height: Canvas height
-        water_level: Y-coordinate of water surface
+        surface_height: Height of the 2-line surface (default: get_surface_height())
     """
-    grid_size = DEBUG_CONFIG['grid_size']
-    grid_color = DEBUG_CONFIG['grid_color']
-    
-    # Clear previous debug elements
-    canvas.delete("debug_grid")
-    
-    # Draw vertical grid lines
-    for x in range(0, width, grid_size):
-        canvas.create_line(
-            x, 0, x, height,
-            fill=grid_color,
-            tags="debug_grid",
-            dash=(2, 4)  # Dashed line
-        )
-        # Add x-coordinate labels
-        if DEBUG_CONFIG['show_coordinates'] and x > 0:
-            canvas.create_text(
-                x, 10,
-                text=str(x),
-                fill='#888888',
-                font=('Arial', 8),
-                tags="debug_grid"
-            )
-    
-    # Draw horizontal grid lines
-    for y in range(0, height, grid_size):
-        canvas.create_line(
-            0, y, width, y,
-            fill=grid_color,
-            tags="debug_grid",
-            dash=(2, 4)  # Dashed line
-        )
-        # Add y-coordinate labels
-        if DEBUG_CONFIG['show_coordinates'] and y > 0:
-            canvas.create_text(
-                10, y,
-                text=str(y),
-                fill='#888888',
-                font=('Arial', 8),
-                tags="debug_grid"
-            )
-    
-    # Show boundaries if enabled
-    if DEBUG_CONFIG['show_boundaries']:
-        # Calculate wave surface height
-        wave_font_size = max(6, get_density_font_size() - 2)
-        wave_line_height = wave_font_size + 2
-        surface_height = wave_line_height * 2
-        
-        # Water level line (top of waves) - HIDDEN
-        # canvas.create_line(
-        #     0, water_level, width, water_level,
-        #     fill='#00FFFF',  # Cyan
-        #     width=2,
-        #     tags="debug_grid"
-        # )
-        # canvas.create_text(
-        #     width - 80, water_level - 10,
-        #     text=f"Water Level: {water_level}",
-        #     fill='#00FFFF',
-        #     font=('Arial', 9, 'bold'),
-        #     tags="debug_grid"
-        # )
-        
-        # Underwater start (below waves) - HIDDEN
-        # underwater_start = water_level + surface_height + 5
-        # canvas.create_line(
-        #     0, underwater_start, width, underwater_start,
-        #     fill='#00FF00',  # Green
-        #     width=2,
-        #     tags="debug_grid"
-        # )
-        # canvas.create_text(
-        #     width - 120, underwater_start + 15,
-        #     text=f"Underwater Start: {underwater_start}",
-        #     fill='#00FF00',
-        #     font=('Arial', 9, 'bold'),
-        #     tags="debug_grid"
-        # )
-        
-        # Ocean floor boundary
-        ocean_floor = height - 50
-        canvas.create_line(
-            0, ocean_floor, width, ocean_floor,
-            fill='#FF8800',  # Orange
-            width=2,
-            tags="debug_grid"
-        )
-        canvas.create_text(
-            width - 100, ocean_floor - 15,
-            text=f"Ocean Floor: {ocean_floor}",
-            fill='#FF8800',
-            font=('Arial', 9, 'bold'),
-            tags="debug_grid"
-        )
-    
-    # Keep grid below other elements but above environment
-    # Only lower if bubbles exist (to avoid "doesn't match any items" error)
-    if canvas.find_withtag("bubbles"):
-        canvas.tag_lower("debug_grid", "bubbles")
-
-def is_in_water(x, y, water_level, canvas_height):
-    """Check if coordinates are in the underwater area (bottom 4/5 of canvas)"""
-    # Water starts after the 2-line surface (20 pixels total)
-    surface_height = 20
+    # Water starts after the 2-line surface
+    if surface_height is None:
+        surface_height = get_surface_height()
     underwater_start = water_level + surface_height
     # Leave space above ocean floor
     underwater_end = canvas_height - 50
     return y >= underwater_start and y <= underwater_end
 
-def spawn_bubble(bubble_list, width, water_level, height):
-    """Spawn a new bubble at a random underwater position"""
-    import random
-    
-    # Spawn in underwater area only (below 2-line surface, above ocean floor)
-    surface_height = 20  # Height of 2-line surface
-    underwater_start = water_level + surface_height + 10  # Below surface
-    underwater_end = height - 60  # Above ocean floor
-    
-    # Spawn across entire width (no margin)
-    x = random.randint(0, width)
-    y = random.randint(underwater_start, underwater_end)
-    
-    # Bubble appearance
-    bubble_char = random.choice(UNDERWATER_ENVIRONMENT['bubbles_small'] + 
-                              UNDERWATER_ENVIRONMENT['bubbles_medium'])
-    bubble_size = random.choice([10, 12, 14, 16])
-    bubble_color = '#FFFFFF'
-    
-    # Add to bubble list with all needed info
-    bubble_list.append({
-        'x': x,
-        'y': y,
-        'char': bubble_char,
-        'size': bubble_size,
-        'color': bubble_color,
-        'canvas_id': None  # Will be set when rendered
-    })
-
-
-def update_bubbles(bubble_list, canvas, width, water_level, height, spawn_chance=0.05):
-    """Update bubble physics: spawn new bubbles randomly, move existing bubbles upward, remove at surface
-    
-    Args:
-        bubble_list: List of bubble dictionaries to update
-        canvas: Tkinter canvas to render on
-        width: Canvas width
-        water_level: Y-coordinate of ocean surface
-        height: Canvas height
-        spawn_chance: Probability (0.0-1.0) of spawning a bubble each frame
-    """
-    import random
-    
-    # Randomly spawn new bubble
-    if random.random() < spawn_chance:
-        spawn_bubble(bubble_list, width, water_level, height)
-    
-    # Update existing bubbles
-    bubbles_to_remove = []
-    # Surface is 2 lines tall: water_level to water_level + 10
-    # Remove bubbles slightly before they reach the visible surface (for realism)
-    bubble_removal_threshold = 15  # Remove 15 pixels before water_level
-    for i, bubble in enumerate(bubble_list):
-        # Move bubble upward (rising physics)
-        bubble['y'] -= 2  # Rise speed: 2 pixels per frame
-        
-        # Mark for removal if approaching surface (slightly before water_level)
-        if bubble['y'] <= water_level + bubble_removal_threshold:
-            bubbles_to_remove.append(i)
-    
-    # Remove bubbles that reached surface (reverse order to preserve indices)
-    for i in reversed(bubbles_to_remove):
-        bubble_list.pop(i)
-    
-    # Render all bubbles
-    render_bubbles(bubble_list, canvas)
-
-
-def render_bubbles(bubble_list, canvas):
-    """Render all bubbles on canvas"""
-    # Clear existing bubble graphics
-    canvas.delete("bubbles")
-    
-    # Render each bubble at its current position
-    for bubble in bubble_list:
-        canvas.create_text(
-            bubble['x'], bubble['y'],
-            text=bubble['char'],
-            font=('Arial', bubble['size']),
-            fill=bubble['color'],
-            tags="bubbles"
-        )
-
 def demo_ascii_art():
     """Demo function to preview all kraken ASCII art"""
     print("=== ASCII Underwater Kraken Art Demo ===\n")
@@ -719,6 +307,7 @@ def demo_ascii_art():
         print(f"  Show Coordinates: {DEBUG_CONFIG['show_coordinates']}")
         print(f"  Show Boundaries: {DEBUG_CONFIG['show_boundaries']}\n")
     
+    from kraken_sprites import ASCII_PET_SPRITES
     for state, frames in ASCII_ANIMATIONS.items():
         print(f"--- {state.upper()} Animation Frames ---")
         for frame_name in frames:
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Offscreen Exporter
+Runs the simulation for a number of ticks without a display and streams the
+frames to disk as an asciinema .cast file, an animated GIF or an APNG.
+Everything is pure Python (zlib for PNG), one frame in memory at a time.
+
+Usage:
+    python3 export.py kraken.cast --ticks 600
+    python3 export.py kraken.gif --ticks 300 --krakens 5 --feed-every 3
+    python3 export.py kraken.png --ticks 300 --scale 2     # APNG
+"""
+
+import argparse
+import json
+import random
+import struct
+import sys
+import time
+import zlib
+
+from framebuffer import FrameComposer, BACKGROUND
+from simulation import World, TICK
+
+
+def hex_to_rgb(color):
+    """'#RRGGBB' -> (r, g, b)"""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+# ===== TEXT (asciicast v2) =====
+
+class CastWriter:
+    """Streams frames to an asciicast v2 file (JSON header + one event per frame)
+
+    Only rows that changed since the previous frame are written, each as
+    a cursor move plus the row in 24-bit ANSI colors.
+    """
+
+    def __init__(self, path, cols, rows, fps, palette, title="ASCII Underwater Kraken"):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.frame_time = 1.0 / fps
+        self.frames = 0
+        self.previous = None
+        self.background = "\x1b[48;2;%d;%d;%dm" % hex_to_rgb(BACKGROUND)
+        self.foreground = {color: "\x1b[38;2;%d;%d;%dm" % hex_to_rgb(color) for color in palette}
+        header = {'version': 2, 'width': cols, 'height': rows, 'timestamp': int(time.time()),
+                  'title': title, 'env': {'TERM': 'xterm-256color'}}
+        self.file.write(json.dumps(header) + "\n")
+
+    def write_frame(self, frame):
+        parts = []
+        if self.previous is None:
+            parts.append(self.background + "\x1b[2J\x1b[?25l")  # Clear screen, hide cursor
+        for row in frame.changed_rows(self.previous):
+            parts.append(f"\x1b[{row + 1};1H" + self.background)
+            for col, text, color in frame.row_runs(row):
+                parts.append(self.foreground.get(color, '') + text)
+        if parts:
+            event = [round(self.frames * self.frame_time, 3), "o", "".join(parts)]
+            self.file.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self.previous = frame
+        self.frames += 1
+
+    def close(self):
+        self.file.write(json.dumps([round(self.frames * self.frame_time, 3), "o", "\x1b[0m\x1b[?25h"]) + "\n")
+        self.file.close()
+
+
+# ===== RASTER =====
+
+# 3x5 bitmap glyphs for every character the scene uses; unknown characters draw as a block
+GLYPHS = {
+    ' ': ("...", "...", "...", "...", "..."),
+    '(': (".#.", "#..", "#..", "#..", ".#."),
+    ')': (".#.", "..#", "..#", "..#", ".#."),
+    '*': ("...", "#.#", ".#.", "#.#", "..."),
+    ',': ("...", "...", "...", ".#.", "#.."),
+    '-': ("...", "...", "###", "...", "..."),
+    '.': ("...", "...", "...", "...", ".#."),
+    '/': ("..#", "..#", ".#.", "#..", "#.."),
+    '\\': ("#..", "#..", ".#.", "..#", "..#"),
+    '<': ("..#", ".#.", "#..", ".#.", "..#"),
+    '>': ("#..", ".#.", "..#", ".#.", "#.."),
+    '?': ("##.", "..#", ".#.", "...", ".#."),
+    '@': (".#.", "#.#", "###", "#..", ".##"),
+    'O': ("###", "#.#", "#.#", "#.#", "###"),
+    'V': ("#.#", "#.#", "#.#", "#.#", ".#."),
+    'W': ("#.#", "#.#", "#.#", "###", "#.#"),
+    'X': ("#.#", "#.#", ".#.", "#.#", "#.#"),
+    '^': (".#.", "#.#", "...", "...", "..."),
+    '_': ("...", "...", "...", "...", "###"),
+    '`': ("#..", ".#.", "...", "...", "..."),
+    'o': ("...", "...", "###", "#.#", "###"),
+    '|': (".#.", ".#.", ".#.", ".#.", ".#."),
+    '~': ("...", "...", "#.#", ".#.", "..."),
+    '≈': ("#.#", ".#.", "...", "#.#", ".#."),
+    '°': (".#.", "#.#", ".#.", "...", "..."),
+    '·': ("...", "...", ".#.", "...", "..."),
+    '∘': ("...", ".#.", "#.#", ".#.", "..."),
+    '○': ("...", "###", "#.#", "###", "..."),
+    '●': ("...", "###", "###", "###", "..."),
+    '+': ("...", ".#.", "###", ".#.", "..."),
+    ':': ("...", ".#.", "...", ".#.", "..."),
+    '⛵': (".#.", ".##", ".#.", "###", ".#."),
+    '0': ("###", "#.#", "#.#", "#.#", "###"),
+    '1': (".#.", "##.", ".#.", ".#.", "###"),
+    '2': ("###", "..#", "###", "#..", "###"),
+    '3': ("###", "..#", ".##", "..#", "###"),
+    '4': ("#.#", "#.#", "###", "..#", "..#"),
+    '5': ("###", "#..", "###", "..#", "###"),
+    '6': ("###", "#..", "###", "#.#", "###"),
+    '7': ("###", "..#", "..#", ".#.", ".#."),
+    '8': ("###", "#.#", "###", "#.#", "###"),
+    '9': ("###", "#.#", "###", "..#", "###"),
+}
+UNKNOWN_GLYPH = ("...", "###", "###", "###", "...")
+GLYPH_WIDTH = 4  # 3 pixels + 1 spacing
+GLYPH_HEIGHT = 6  # 5 pixels + 1 spacing
+
+
+class Rasterizer:
+    """Draws CharFrames into an 8-bit palette-indexed pixel buffer
+
+    Only cells that changed since the previous frame are redrawn, and the
+    bounding box of those cells is reported so encoders can store just
+    that rectangle.
+
+    Args:
+        cols, rows: Frame size in characters
+        palette: Colors frames use ('#RRGGBB'), background first
+        scale: Pixels per glyph pixel
+    """
+
+    def __init__(self, cols, rows, palette, scale=1):
+        self.cols = cols
+        self.rows = rows
+        self.scale = scale
+        self.cell_width = GLYPH_WIDTH * scale
+        self.cell_height = GLYPH_HEIGHT * scale
+        self.width = cols * self.cell_width
+        self.height = rows * self.cell_height
+        self.color_index = {color: i for i, color in enumerate(palette)}
+        self.pixels = bytearray(self.width * self.height)  # All background (index 0)
+        self.previous = None
+        self.glyph_rows = {}  # (char, color index) -> rows of scaled pixel bytes
+
+    def glyph(self, char, index):
+        key = (char, index)
+        rows = self.glyph_rows.get(key)
+        if rows is None:
+            rows = []
+            for line in GLYPHS.get(char, UNKNOWN_GLYPH) + ("...",):
+                row = b"".join(bytes([index if bit == '#' else 0]) * self.scale for bit in line + ".")
+                rows.extend([row] * self.scale)
+            self.glyph_rows[key] = rows
+        return rows
+
+    def draw(self, frame):
+        """Update the pixels for frame; returns the changed (x, y, width, height) or None"""
+        previous = self.previous
+        self.previous = frame
+        pixels = self.pixels
+        width = self.width
+        cell_width = self.cell_width
+        cell_height = self.cell_height
+        min_col = min_row = None
+        max_col = max_row = -1
+        for row in range(frame.rows):
+            chars = frame.chars[row]
+            colors = frame.colors[row]
+            if previous is not None and chars == previous.chars[row] and colors == previous.colors[row]:
+                continue
+            for col in range(frame.cols):
+                char = chars[col]
+                color = colors[col]
+                if previous is not None and char == previous.chars[row][col] and color == previous.colors[row][col]:
+                    continue
+                index = self.color_index.get(color, 0) if char != ' ' else 0
+                glyph = self.glyph(char if index else ' ', index)
+                offset = row * cell_height * width + col * cell_width
+                for glyph_row in glyph:
+                    pixels[offset:offset + cell_width] = glyph_row
+                    offset += width
+                if min_col is None or col < min_col:
+                    min_col = col
+                if col > max_col:
+                    max_col = col
+                if min_row is None:
+                    min_row = row
+                max_row = row
+        if min_col is None:
+            return None
+        return (min_col * cell_width, min_row * cell_height,
+                (max_col - min_col + 1) * cell_width, (max_row - min_row + 1) * cell_height)
+
+    def region(self, x, y, width, height):
+        """Pixel rows of a rectangle, as one bytes object per row"""
+        return [bytes(self.pixels[(y + i) * self.width + x:(y + i) * self.width + x + width])
+                for i in range(height)]
+
+
+def lzw_encode(indices, min_code_size):
+    """GIF-flavoured LZW compression of a sequence of palette indices"""
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    output = bytearray()
+    bit_buffer = 0
+    bit_count = 0
+
+    def emit(code, size):
+        nonlocal bit_buffer, bit_count
+        bit_buffer |= code << bit_count
+        bit_count += size
+        while bit_count >= 8:
+            output.append(bit_buffer & 0xFF)
+            bit_buffer >>= 8
+            bit_count -= 8
+
+    code_size = min_code_size + 1
+    table = {}
+    next_code = end_code + 1
+    emit(clear_code, code_size)
+    prefix = None
+    for index in indices:
+        if prefix is None:
+            prefix = index
+            continue
+        key = (prefix << 8) | index
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix, code_size)
+        if next_code < 4096:
+            table[key] = next_code
+            if next_code == (1 << code_size) and code_size < 12:
+                code_size += 1
+            next_code += 1
+        else:
+            # Table full: start over
+            emit(clear_code, code_size)
+            table = {}
+            next_code = end_code + 1
+            code_size = min_code_size + 1
+        prefix = index
+    if prefix is not None:
+        emit(prefix, code_size)
+    emit(end_code, code_size)
+    if bit_count:
+        output.append(bit_buffer & 0xFF)
+    return bytes(output)
+
+
+class GifWriter:
+    """Streams frames to an animated, looping GIF
+
+    Every frame after the first only stores the rectangle that changed.
+    GIF delays are in 1/100 s, so fps above 50 are rounded.
+    """
+
+    def __init__(self, path, cols, rows, fps, palette, scale=1):
+        self.raster = Rasterizer(cols, rows, palette, scale)
+        self.delay = max(2, int(round(100 / fps)))
+        self.file = open(path, 'wb')
+
+        table_bits = max(1, (len(palette) - 1).bit_length())  # Color table holds 2**table_bits entries
+        self.min_code_size = max(2, table_bits)
+        colors = b"".join(bytes(hex_to_rgb(color)) for color in palette)
+        colors += b"\x00" * (3 * (1 << table_bits) - len(colors))
+
+        f = self.file
+        f.write(b"GIF89a")
+        f.write(struct.pack('<HHBBB', self.raster.width, self.raster.height,
+                            0x80 | ((table_bits - 1) << 4) | (table_bits - 1), 0, 0))
+        f.write(colors)
+        f.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00")  # Loop forever
+
+    def write_frame(self, frame):
+        box = self.raster.draw(frame)
+        if box is None:
+            box = (0, 0, 1, 1)  # Nothing changed: a 1-pixel frame keeps the timing
+        x, y, width, height = box
+        f = self.file
+        f.write(struct.pack('<BBBBHBB', 0x21, 0xF9, 4, 1 << 2, self.delay, 0, 0))  # Keep previous frame
+        f.write(struct.pack('<BHHHHB', 0x2C, x, y, width, height, 0))
+        data = lzw_encode(b"".join(self.raster.region(x, y, width, height)), self.min_code_size)
+        f.write(bytes([self.min_code_size]))
+        for i in range(0, len(data), 255):
+            block = data[i:i + 255]
+            f.write(bytes([len(block)]) + block)
+        f.write(b"\x00")
+
+    def close(self):
+        self.file.write(b"\x3B")
+        self.file.close()
+
+
+def png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+class ApngWriter:
+    """Streams frames to an animated PNG (palette color, zlib-compressed)
+
+    The frame count in the acTL chunk is patched when the file is closed,
+    so frames can be written without knowing how many there will be.
+    """
+
+    def __init__(self, path, cols, rows, fps, palette, scale=1):
+        self.raster = Rasterizer(cols, rows, palette, scale)
+        self.delay = (1, max(1, int(round(fps))))  # Numerator, denominator in seconds
+        self.sequence = 0
+        self.frames = 0
+        self.file = open(path, 'wb')
+
+        f = self.file
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(png_chunk(b'IHDR', struct.pack('>IIBBBBB', self.raster.width, self.raster.height,
+                                               8, 3, 0, 0, 0)))
+        self.actl_offset = f.tell()
+        f.write(png_chunk(b'acTL', struct.pack('>II', 0, 0)))  # Frame count filled in by close()
+        f.write(png_chunk(b'PLTE', b"".join(bytes(hex_to_rgb(color)) for color in palette)))
+
+    def write_frame(self, frame):
+        box = self.raster.draw(frame)
+        if self.frames == 0:
+            box = (0, 0, self.raster.width, self.raster.height)  # First frame is the full image
+        elif box is None:
+            box = (0, 0, 1, 1)
+        x, y, width, height = box
+        self.file.write(png_chunk(b'fcTL', struct.pack('>IIIIIHHBB', self.sequence, width, height, x, y,
+                                                       self.delay[0], self.delay[1], 0, 0)))
+        self.sequence += 1
+        # Filter type 0 (none) before every scanline
+        data = zlib.compress(b"".join(b"\x00" + row for row in self.raster.region(x, y, width, height)), 9)
+        if self.frames == 0:
+            self.file.write(png_chunk(b'IDAT', data))
+        else:
+            self.file.write(png_chunk(b'fdAT', struct.pack('>I', self.sequence) + data))
+            self.sequence += 1
+        self.frames += 1
+
+    def close(self):
+        f = self.file
+        f.write(png_chunk(b'IEND', b""))
+        f.seek(self.actl_offset)
+        f.write(png_chunk(b'acTL', struct.pack('>II', self.frames, 0)))  # 0 plays = loop forever
+        f.close()
+
+
+WRITERS = {
+    'cast': CastWriter,
+    'gif': GifWriter,
+    'apng': ApngWriter,
+}
+
+
+def format_for(path):
+    """Guess the output format from a file name"""
+    lower = path.lower()
+    if lower.endswith('.gif'):
+        return 'gif'
+    if lower.endswith(('.png', '.apng')):
+        return 'apng'
+    return 'cast'
+
+
+# ===== DRIVER =====
+
+def export(path, ticks, fmt=None, width=800, height=600, fps=10, seed=None, kraken_count=None,
+           feed_every=None, boat_every=None, scale=1, verbose=False):
+    """Run the simulation headlessly and stream its frames to path
+
+    Args:
+        path: Output file
+        ticks: Simulation ticks to run (TICK seconds each)
+        fmt: 'cast', 'gif' or 'apng' (default: from the file extension)
+        width, height: World size in pixels
+        fps: Frames written per simulated second (at most 1 / TICK)
+        seed: Random seed (same seed, same animation)
+        kraken_count: Number of krakens (default: KRAKEN_CONFIG['count'])
+        feed_every: Drop a shrimp at a random spot every this many seconds
+        boat_every: Send a boat across every this many seconds
+        scale: Pixels per glyph pixel for GIF/APNG
+
+    Returns:
+        Number of frames written
+    """
+    fmt = fmt or format_for(path)
+    rng = random.Random(seed)
+    world = World(width, height, rng=rng, verbose=verbose, kraken_count=kraken_count)
+    composer = FrameComposer(width, height)
+    options = {'scale': scale} if fmt != 'cast' else {}
+    writer = WRITERS[fmt](path, composer.cols, composer.rows, fps, composer.palette(), **options)
+
+    ticks_per_frame = max(1, int(round(1.0 / (fps * TICK))))
+    feed_ticks = int(round(feed_every / TICK)) if feed_every else None
+    boat_ticks = int(round(boat_every / TICK)) if boat_every else None
+    frames = 0
+    try:
+        writer.write_frame(composer.compose(world.snapshot()))
+        frames += 1
+        for tick in range(1, ticks + 1):
+            if feed_ticks and tick % feed_ticks == 0:
+                world.drop_shrimp(rng.randrange(40, width - 40),
+                                  rng.randrange(world.water_level + 40, world.ocean_floor))
+            if boat_ticks and tick % boat_ticks == 0:
+                world.spawn_boat(rng.choice(('lr', 'rl')))
+            world.step(TICK)
+            if tick % ticks_per_frame == 0:
+                writer.write_frame(composer.compose(world.snapshot()))
+                frames += 1
+    finally:
+        writer.close()
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the kraken aquarium to .cast, GIF or APNG without a display")
+    parser.add_argument('output', help='output file (.cast, .gif, .png/.apng)')
+    parser.add_argument('--format', choices=sorted(WRITERS), help='output format (default: from extension)')
+    parser.add_argument('--ticks', type=int, default=600, help='simulation ticks to run (10 per second)')
+    parser.add_argument('--fps', type=float, default=10, help='frames per simulated second (max 10)')
+    parser.add_argument('--width', type=int, default=800, help='world width in pixels')
+    parser.add_argument('--height', type=int, default=600, help='world height in pixels')
+    parser.add_argument('--seed', type=int, default=1, help='random seed')
+    parser.add_argument('--krakens', type=int, help='number of krakens')
+    parser.add_argument('--feed-every', type=float, default=4.0, help='seconds between dropped shrimp (0 = never)')
+    parser.add_argument('--boat-every', type=float, default=30.0, help='seconds between boats (0 = never)')
+    parser.add_argument('--scale', type=int, default=1, help='raster scale (GIF/APNG)')
+    parser.add_argument('--verbose', action='store_true', help='print simulation messages')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    frames = export(args.output, args.ticks, args.format, args.width, args.height, args.fps, args.seed,
+                    args.krakens, args.feed_every, args.boat_every, args.scale, args.verbose)
+    print(f"🎞️ Wrote {frames} frames to {args.output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Font Metrics
+Pixel sizes of the monospace fonts the pet draws with, measured with
+tkinter.font once per font and cached, so character positions can be
+converted to pixels exactly instead of assuming 8 px per character.
+
+Without a Tk root (headless runs: replays, benchmarks, exports, the
+terminal backend) nothing can be measured and the old approximations are
+returned instead, so those runs don't depend on the machine's fonts.
+"""
+
+from collections import namedtuple
+
+FontMetrics = namedtuple('FontMetrics', [
+    'char_width',   # Advance of one character in pixels (may be fractional)
+    'line_height',  # Distance between lines in pixels
+    'ascent', 'descent',
+    'measured',     # False when these are the approximations (no Tk root)
+])
+
+FALLBACK_CHAR_WIDTH = 8  # What the layout code assumed before fonts were measured
+
+_cache = {}  # Font tuple -> FontMetrics
+
+
+def fallback_metrics(font):
+    """The approximations used without Tk: 8 px per character, font size + 2 per line"""
+    size = abs(font[1])
+    return FontMetrics(FALLBACK_CHAR_WIDTH, size + 2, size, 2, False)
+
+
+def font_metrics(font):
+    """Measured metrics of a (family, size, ...) font, cached per font
+
+    Returns fallback_metrics(font) (not cached) if there is no Tk root yet.
+    """
+    key = tuple(font)
+    metrics = _cache.get(key)
+    if metrics is not None:
+        return metrics
+    try:
+        import tkinter.font
+    except ImportError:
+        return fallback_metrics(key)
+    try:
+        tk_font = tkinter.font.Font(font=key)
+        # Averaged over a long run, as Tk places characters at fractional advances
+        char_width = tk_font.measure('0' * 100) / 100
+        ascent, descent, line_height = (tk_font.metrics(name) for name in ('ascent', 'descent', 'linespace'))
+    except (RuntimeError, AttributeError, tkinter.TclError):
+        return fallback_metrics(key)  # No default root yet
+    metrics = _cache[key] = FontMetrics(char_width, line_height, ascent, descent, True)
+    return metrics
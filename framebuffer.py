@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Character Framebuffer
+Composes a World snapshot into a grid of colored characters, independent of
+Tk, for text and raster export.
+"""
+
+import re
+
+from designs import (UNDERWATER_ENVIRONMENT, get_ascii_pet, get_boat_sprite, get_boat_color,
+                     get_kraken_color, get_density_line_height, integrate_boat_into_waves)
+from particles import RISE_PER_TICK
+from waves import get_wave_field
+
+BACKGROUND = '#0A0F1C'  # Same deep blue as the canvas
+SURFACE_COLOR = '#FFFFFF'
+WAVE_SHADOW_COLOR = '#AAAAAA'  # Bottom wave line, darker for depth
+SHRIMP_COLOR = '#FFB6C1'
+BUBBLE_COLOR = '#FFFFFF'
+COUNTER_COLOR = '#FFB6C1'
+BOAT_COUNTER_COLOR = '#FFFFFF'
+NON_SPACE = re.compile(r'[^ ]+')
+
+
+class CharFrame:
+    """A cols x rows grid of characters, each with a foreground color"""
+    __slots__ = ('cols', 'rows', 'chars', 'colors')
+
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        self.chars = [[' '] * cols for _ in range(rows)]
+        self.colors = [[None] * cols for _ in range(rows)]  # None = background
+
+    def clear(self):
+        """Blank every cell in place (no new row lists)"""
+        blank_chars = [' '] * self.cols
+        blank_colors = [None] * self.cols
+        for row in range(self.rows):
+            self.chars[row][:] = blank_chars
+            self.colors[row][:] = blank_colors
+
+    def put(self, col, row, char, color):
+        """Set one cell (ignored outside the grid)"""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            self.chars[row][col] = char
+            self.colors[row][col] = color
+
+    def text(self, col, row, text, color, transparent=True):
+        """Write a string starting at (col, row); spaces don't overwrite when transparent"""
+        if not 0 <= row < self.rows:
+            return
+        chars = self.chars[row]
+        colors = self.colors[row]
+        if not transparent:
+            # Opaque (the wave rows): copy the visible part in one slice
+            start = max(col, 0)
+            end = min(col + len(text), self.cols)
+            if start < end:
+                chars[start:end] = text[start - col:end - col]
+                colors[start:end] = [color] * (end - start)
+            return
+        for i, char in enumerate(text, col):
+            if 0 <= i < self.cols and not (transparent and char == ' '):
+                chars[i] = char
+                colors[i] = color
+
+    def blit(self, col, row, segments, color):
+        """Draw a sprite given as (row offset, col offset, text) runs without spaces
+
+        Whole runs are copied with slice assignment, which is much faster
+        than text() for sprites drawn many times per frame.
+        """
+        cols = self.cols
+        rows = self.rows
+        chars = self.chars
+        colors = self.colors
+        fill = [color] * cols  # Sliced to each run's length
+        for dy, dx, text in segments:
+            y = row + dy
+            if not 0 <= y < rows:
+                continue
+            start = col + dx
+            end = start + len(text)
+            if start < 0 or end > cols:
+                if end <= 0 or start >= cols:
+                    continue
+                if start < 0:
+                    text = text[-start:]
+                    start = 0
+                if end > cols:
+                    text = text[:cols - start]
+                    end = cols
+            chars[y][start:end] = text
+            colors[y][start:end] = fill[:end - start]
+
+    def row_text(self, row):
+        """Characters of one row as a string"""
+        return ''.join(self.chars[row])
+
+    def row_runs(self, row):
+        """Split a row into (start_col, text, color) runs of one color"""
+        chars = self.chars[row]
+        colors = self.colors[row]
+        runs = []
+        start = 0
+        for col in range(1, self.cols + 1):
+            if col == self.cols or colors[col] != colors[start]:
+                runs.append((start, ''.join(chars[start:col]), colors[start]))
+                start = col
+        return runs
+
+    def changed_rows(self, other):
+        """Rows that differ from another frame of the same size (all rows if other is None)"""
+        if other is None:
+            return list(range(self.rows))
+        return [row for row in range(self.rows)
+                if self.chars[row] != other.chars[row] or self.colors[row] != other.colors[row]]
+
+
+class FrameComposer:
+    """Turns World snapshots into CharFrames on a fixed character grid
+
+    One cell is cell_width x cell_height pixels of the world, so sprites
+    land on whole character positions like in a terminal.
+
+    Args:
+        width, height: World size in pixels
+        cell_width: Pixels per column, may be fractional (default: 8, the World's
+            surface character without measured fonts)
+        cell_height: Pixels per row (default: the kraken's line height)
+    """
+
+    def __init__(self, width, height, cell_width=8, cell_height=None):
+        self.cell_width = cell_width
+        self.cell_height = cell_height or get_density_line_height()
+        self.cols = int(width // self.cell_width)
+        self.rows = int(height // self.cell_height)
+
+        self.segments = {}  # Sprite name -> solid runs for CharFrame.blit
+        self.wave_field = get_wave_field()  # None = cycle the four classic wave strings
+        repeats = self.cols // 2 + 2
+        self.wave_lines = [(UNDERWATER_ENVIRONMENT[f'ocean_surface_frame{i}'] * repeats)[:self.cols]
+                           for i in range(1, 5)]
+
+        # compose_shared(): two recycled frames and the snapshot the newest one shows
+        self.frames = [None, None]  # [newest, the one before]
+        self.serial = 0  # Snapshots composed by compose_shared()
+        self.last_snapshot = None
+
+    def palette(self):
+        """Every color a composed frame can use, background first"""
+        colors = [BACKGROUND]
+        for color in (SURFACE_COLOR, WAVE_SHADOW_COLOR, get_boat_color(), BUBBLE_COLOR,
+                      SHRIMP_COLOR, get_kraken_color(), COUNTER_COLOR, BOAT_COUNTER_COLOR):
+            if color not in colors:
+                colors.append(color)
+        return colors
+
+    def compose(self, snapshot):
+        """Build the CharFrame for one snapshot (back to front, like the canvas z-order)"""
+        frame = CharFrame(self.cols, self.rows)
+        self.compose_layers(frame, snapshot)
+        return frame
+
+    def compose_shared(self, snapshot):
+        """Compose a snapshot once for every renderer that draws it
+
+        The first call with a snapshot composes it into the older of two
+        recycled frames; further calls with the same snapshot (the other
+        viewports of that frame) get the same CharFrame back. Returns
+        (frame, serial): serial counts composed snapshots, so a caller that
+        drew serial - 1 can diff against self.frames[1]. The frame is
+        overwritten two snapshots later; callers must not keep it.
+        """
+        if snapshot is not self.last_snapshot:
+            frame = self.frames[1]
+            if frame is None:
+                frame = CharFrame(self.cols, self.rows)
+            else:
+                frame.clear()
+            self.compose_layers(frame, snapshot)
+            self.frames = [frame, self.frames[0]]
+            self.serial += 1
+            self.last_snapshot = snapshot
+        return self.frames[0], self.serial
+
+    def compose_layers(self, frame, snapshot):
+        """Draw a snapshot into a blank frame"""
+        self.compose_surface(frame, snapshot)
+        self.compose_bubbles(frame, snapshot)
+        self.compose_shrimp(frame, snapshot)
+        self.compose_krakens(frame, snapshot)
+        self.compose_counters(frame, snapshot)
+
+    def compose_surface(self, frame, snapshot):
+        """Two wave rows at water level, with the boat sailing in the five rows above"""
+        water_row = snapshot.water_level // self.cell_height
+        if self.wave_field is not None:
+            wave_top, wave_bottom = self.wave_field.lines(0, self.cols, snapshot.wave_phase)
+        else:
+            wave_top = self.wave_lines[snapshot.wave_frame % 4]
+            wave_bottom = self.wave_lines[(snapshot.wave_frame + 2) % 4]
+        # Surface positions are in world characters; scale them if cells are a different width
+        scale = snapshot.char_width / self.cell_width
+        if snapshot.wake is not None:
+            wake_col, wake_top, wake_bottom = snapshot.wake
+            wake_col = int(round(wake_col * scale))
+            wave_top = integrate_boat_into_waves(wave_top, wake_top, wake_col)
+            wave_bottom = integrate_boat_into_waves(wave_bottom, wake_bottom, wake_col)
+        frame.text(0, water_row, wave_top, SURFACE_COLOR, transparent=False)
+        frame.text(0, water_row + 1, wave_bottom, WAVE_SHADOW_COLOR, transparent=False)
+        if snapshot.boat_active:
+            boat_sprite = get_boat_sprite(snapshot.boat_direction)
+            top_row = water_row - (len(boat_sprite) - 1)  # Last boat line replaces the top wave
+            boat_col = int(round(snapshot.boat_char_pos * scale))
+            for i, line in enumerate(boat_sprite):
+                frame.text(boat_col, top_row + i, line, get_boat_color())
+
+    def compose_bubbles(self, frame, snapshot):
+        system = snapshot.bubbles
+        lag = RISE_PER_TICK * (1.0 - snapshot.alpha)
+        cell_width = self.cell_width
+        cell_height = self.cell_height
+        for slot in system.live_slots():
+            x, y, char, size, color = system.bubble(slot)
+            frame.put(int(x // cell_width), int((y + lag) // cell_height), char, color)
+
+    def compose_shrimp(self, frame, snapshot):
+        for tag, x, y in snapshot.shrimp:
+            frame.put(int(x // self.cell_width), int(y // self.cell_height), ',', SHRIMP_COLOR)
+
+    def sprite_segments(self, name):
+        """A kraken sprite as (row, col offset from center, text) runs of non-spaces"""
+        segments = self.segments.get(name)
+        if segments is None:
+            segments = []
+            for i, line in enumerate(get_ascii_pet(name)):
+                left = -(len(line) // 2)  # Lines are centered like the canvas sprites
+                for start, text in ((m.start(), m.group()) for m in NON_SPACE.finditer(line)):
+                    segments.append((i, left + start, text))
+            segments = self.segments[name] = tuple(segments)
+        return segments
+
+    def compose_krakens(self, frame, snapshot):
+        color = get_kraken_color()
+        for x, y, sprite in snapshot.krakens:
+            # (x, y) is the center of the sprite's top line
+            center_col = int(round(x / self.cell_width))
+            top_row = int(round(y / self.cell_height))
+            frame.blit(center_col, top_row, self.sprite_segments(sprite), color)
+
+    def compose_counters(self, frame, snapshot):
+        """Shrimp counter top left, boat counter top right (like the canvas)"""
+        counter = str(snapshot.shrimp_eaten_count)
+        frame.text(2, 1, counter, COUNTER_COLOR)
+        if snapshot.counter_indicator:
+            frame.text(3 + len(counter), 1, snapshot.counter_indicator, COUNTER_COLOR)
+        if snapshot.show_boat_counter:
+            text = f"⛵: {snapshot.boats_destroyed}"
+            frame.text(self.cols - 2 - len(text), 1, text, BOAT_COUNTER_COLOR)
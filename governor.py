@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Activity and Quality Governors
+The pet sits at desktop level, so most of the time it is covered by other
+windows or nothing is happening in it. The governor tells the frame
+scheduler when rendering would be wasted: while every window is unmapped
+or fully obscured, or after the world has been quiet for a while. The
+scheduler then stops rendering and only wakes up for a coarse simulation
+tick; a click or a window becoming visible wakes it up again straight away.
+Bubbles drifting past a kraken keep it from going idle, but once idle only
+real events (shrimp, a boat, a splash) wake it up: bubbles pass by every
+few seconds and would otherwise keep the pet awake nearly all the time.
+
+Tk only sends <Visibility> events (fully covered windows) on X11. On macOS
+and Windows a covered pet is only idle once the world is quiet; minimized
+windows are still caught there by checking each window's state every
+SCHEDULER_CONFIG['window_check_interval'] seconds.
+
+While rendering, the quality governor measures what each frame costs and
+trades detail (bubbles, wave and sprite animation rate) for
+CPU time to stay within a budget.
+"""
+
+import tkinter as tk
+from collections import deque
+from designs import SCHEDULER_CONFIG, QUALITY_CONFIG, QUALITY_LEVELS
+
+
+class ActivityGovernor:
+    """Decides when the pet can go idle, from window visibility and world activity
+
+    Args:
+        world: World whose activity is watched
+        windows: Tk windows showing the world (visible if any of them is)
+        idle_after: Seconds of quiet before going idle (default: SCHEDULER_CONFIG['idle_after'])
+        bubble_distance: Bubbles this close to a kraken's sprite keep the pet from
+            going idle (default: SCHEDULER_CONFIG['idle_bubble_distance'])
+    """
+
+    def __init__(self, world, windows, idle_after=None, bubble_distance=None):
+        self.world = world
+        self.idle_after = idle_after if idle_after is not None else SCHEDULER_CONFIG['idle_after']
+        self.bubble_distance = (bubble_distance if bubble_distance is not None
+                                else SCHEDULER_CONFIG['idle_bubble_distance'])
+        self.scheduler = None  # Set with attach(); woken up on clicks and exposure
+        self.windows = list(windows)
+        self.hidden = set()  # Windows currently unmapped or fully obscured (from events)
+        self.minimized = set()  # Windows found iconified or withdrawn by check_windows()
+        self.checked_at = None  # Time of the last check_windows()
+        self.quiet_since = None  # Time the world was first seen quiet (None while active)
+        self.was_idle = False
+
+        for window in windows:
+            window.bind('<Map>', lambda event, window=window: self.set_hidden(window, False), add='+')
+            window.bind('<Unmap>', lambda event, window=window: self.set_hidden(window, True), add='+')
+            window.bind('<Visibility>', lambda event, window=window: self.set_hidden(
+                window, event.state == 'VisibilityFullyObscured'), add='+')
+
+    def attach(self, scheduler):
+        """Wake this scheduler up when the pet becomes visible or is clicked"""
+        self.scheduler = scheduler
+
+    @property
+    def visible(self):
+        return len(self.hidden | self.minimized) < len(self.windows)
+
+    def set_hidden(self, window, hidden):
+        """Record a window being hidden or shown (from its Map/Unmap/Visibility events)"""
+        if hidden:
+            self.hidden.add(window)
+        elif window in self.hidden:
+            self.hidden.discard(window)
+            self.wake()
+
+    def check_windows(self):
+        """Poll each window's state (the fallback where Tk sends no <Visibility>)"""
+        for window in self.windows:
+            try:
+                minimized = window.state() in ('iconic', 'withdrawn')
+            except tk.TclError:
+                continue  # Window already destroyed
+            if minimized:
+                self.minimized.add(window)
+            elif window in self.minimized:
+                self.minimized.discard(window)
+                self.quiet_since = None  # Restored: render again (we're inside idle(), so no wake())
+
+    def wake(self):
+        """Something the user will see happened (a click or exposure): render again now"""
+        self.quiet_since = None
+        if self.scheduler is not None:
+            self.scheduler.wake()
+
+    def idle(self, now):
+        """Whether the frame at time now can skip rendering"""
+        if self.checked_at is None or now - self.checked_at >= SCHEDULER_CONFIG['window_check_interval']:
+            self.checked_at = now
+            self.check_windows()
+        if not self.visible:
+            idle = True
+        elif not self.world.is_quiet(None if self.was_idle else self.bubble_distance):
+            self.quiet_since = None
+            idle = False
+        else:
+            if self.quiet_since is None:
+                self.quiet_since = now
+            idle = now - self.quiet_since >= self.idle_after
+
+        if idle != self.was_idle:
+            self.was_idle = idle
+            if idle:
+                reason = "quiet" if self.visible else "hidden"
+                print(f"💤 Going idle ({reason}): rendering paused, "
+                      f"ticking every {SCHEDULER_CONFIG['idle_interval']:g}s")
+            else:
+                print("⏰ Awake: rendering resumed")
+        return idle
+
+
+class QualityGovernor:
+    """Lowers and raises visual quality to keep frames within a CPU budget
+
+    The CPU time of every rendered frame (the simulation ticks it ran plus
+    rendering) is averaged over a window of frames. Above the budget the
+    governor steps down one of QUALITY_LEVELS, well under it (upgrade_below)
+    it steps back up; the gap between the two thresholds and a cooldown
+    after every change keep it from flapping, and an upgrade that has to
+    be undone right away makes the next attempt wait four times longer.
+    A frame that comes after a pause (the pet was idle, or the machine
+    slept) restarts the measurement instead of counting the catch-up ticks.
+
+    Args:
+        world: World whose bubble density, wave rate and sprite rate are scaled
+        levels: Quality levels, best first (default: QUALITY_LEVELS)
+        budget_ms: Frame budget (default: QUALITY_CONFIG['budget_ms'])
+    """
+
+    def __init__(self, world, levels=None, budget_ms=None):
+        self.world = world
+        self.levels = levels or QUALITY_LEVELS
+        self.budget = (budget_ms or QUALITY_CONFIG['budget_ms']) / 1000
+        self.samples = deque(maxlen=QUALITY_CONFIG['window'])  # Seconds per frame
+        self.tick_time = 0.0  # Simulation time since the last rendered frame
+        self.frame_at = None  # Time of the last rendered frame
+        self.level = 0  # Index into levels (0 = best)
+        self.changed_at = None  # Time of the last level change
+        self.upgraded_at = None  # Time of the last step up
+        self.upgrade_delay = QUALITY_CONFIG['cooldown']
+
+        # Knob values at full quality
+        self.base_spawn_chance = world.bubble_spawn_chance
+
+    @property
+    def name(self):
+        return self.levels[self.level]['name']
+
+    @property
+    def average_ms(self):
+        """Average frame cost over the window, in milliseconds"""
+        return sum(self.samples) / len(self.samples) * 1000 if self.samples else 0.0
+
+    def add_tick(self, seconds):
+        """Count simulation time towards the next rendered frame"""
+        self.tick_time += seconds
+
+    def add_frame(self, seconds, now):
+        """Record one rendered frame and change the level if it's time to"""
+        last, self.frame_at = self.frame_at, now
+        if last is not None and now - last >= SCHEDULER_CONFIG['idle_interval']:
+            # Rendering was paused: the ticks since then were catch-up, not frame cost
+            self.tick_time = 0.0
+            self.samples.clear()
+            return
+        self.samples.append(self.tick_time + seconds)
+        self.tick_time = 0.0
+        if len(self.samples) < self.samples.maxlen:
+            return
+        since_change = now - self.changed_at if self.changed_at is not None else None
+        if since_change is not None and since_change < QUALITY_CONFIG['cooldown']:
+            return
+
+        average = sum(self.samples) / len(self.samples)
+        if average > self.budget * QUALITY_CONFIG['downgrade_above'] and self.level < len(self.levels) - 1:
+            # An upgrade that didn't hold: wait longer before trying again
+            if self.upgraded_at is not None and now - self.upgraded_at < 2 * self.upgrade_delay:
+                self.upgrade_delay = min(self.upgrade_delay * 4, 120.0)
+            self.set_level(self.level + 1, now)
+        elif (average < self.budget * QUALITY_CONFIG['upgrade_below'] and self.level > 0
+              and (since_change is None or since_change >= self.upgrade_delay)):
+            self.upgraded_at = now
+            self.set_level(self.level - 1, now)
+
+    def set_level(self, level, now=None):
+        """Switch to quality level (index into levels) and apply its knobs"""
+        average = self.average_ms
+        self.level = level
+        self.changed_at = now
+        self.samples.clear()
+        settings = self.levels[level]
+
+        self.world.bubble_spawn_chance = self.base_spawn_chance * settings['bubbles']
+        self.world.wave_update_ticks = settings['wave_ticks']
+        self.world.animation_rate = settings['sprite_rate']
+        print(f"🎚️ Quality: {settings['name']} (level {level}, {average:.1f} ms/frame, "
+              f"budget {self.budget * 1000:.1f} ms)")
+
+    def stats(self):
+        """Current level and frame cost, for diagnostics"""
+        return {
+            'level': self.level,
+            'name': self.name,
+            'frame_ms': self.average_ms,
+            'budget_ms': self.budget * 1000,
+        }
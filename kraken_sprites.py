@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Sprite Tables
+Kraken ASCII art frames. Loaded on first use through designs.get_ascii_pet
+so it stays off the startup path.
+"""
+
+# ASCII art for the kraken in different states
+# Each state has multiple frames for animation
+# All sprites are 11 lines tall and 23 characters wide (rectangular)
+
+ASCII_PET_SPRITES = {
+    # Idle - simple compact octopus design
+    # Clean structure with clear tentacles
+    'idle1': [
+        "         ______        ",
+        "        /      \\       ",
+        "       /        \\      ",
+        "       |        |      ",
+        "    )  o        o   ?  ",
+        "   (    \\      /    |  ",
+        "  _ \\___/||||||\\___/ _ ",
+        "   \\____/ |||| \\____/ `",
+        "   ,-.___/ || \\__,-._  ",
+        "  /    ___/  \\__       ",
+        "     _/         `---   ",
+    ],
+    
+    'idle2': [
+        "         ______        ",
+        "        /      \\       ",
+        "       /        \\      ",
+        "       |        |      ",
+        "    )  O        O   ?  ",
+        "   (    \\  __  /    |  ",
+        "  _ \\___/||||||\\___/ _ ",
+        "   \\____/ |||| \\____/ `",
+        "   ,-.___/ || \\__,-._  ",
+        "  /    ___/  \\__       ",
+        "     _/         `---   ",
+    ],
+    
+    # Swimming - tentacles actively moving
+    'swim1': [
+        "         ______        ",
+        "        /      \\       ",
+        "       /        \\      ",
+        "       |        |      ",
+        "    )  @        @   ?  ",
+        "   (    \\  >   /    |  ",
+        "  _ \\___/||||||\\___/ _ ",
+        "   \\____/ |||| \\____/ `",
+        "   ,-.___/ || \\__,-._  ",
+        "  /    ___/  \\__       ",
+        "     _/         `---   ",
+    ],
+    
+    'swim2': [
+        "         ______        ",
+        "        /      \\       ",
+        "       /        \\      ",
+        "       |        |      ",
+        "    )  O        O   ?  ",
+        "   (    \\  ^   /    |  ",
+        "  _ \\___/||||||\\___/ _ ",
+        "   \\____/ |||| \\____/ `",
+        "   ,-.___/ || \\__,-._  ",
+        "  /    ___/  \\__       ",
+        "     _/         `---   ",
+    ],
+    
+    'swim3': [
+        "         ______        ",
+        "        /      \\       ",
+        "       /        \\      ",
+        "       |        |      ",
+        "    )  @        @   ?  ",
+        "   (    \\  >   /    |  ",
+        "  _ \\___/||||||\\___/ _ ",
+        "   \\____/ |||| \\____/ `",
+        "   ,-.___/ || \\__,-._  ",
+        "  /    ___/  \\__       ",
+        "     _/         `---   ",
+    ],
+    
+    # Eating - chewing animation (no tentacle wrapping)
+    # Mouth is positioned over shrimp, then chews
+    'eat1': [
+        "         ______        ",
+        "        /      \\       ",
+        "       /        \\      ",
+        "       |        |      ",
+        "    )  X        X   ?  ",
+        "   (    \\ /VV\\ /    |  ",
+        "  _ \\___/||||||\\___/ _ ",
+        "   \\____/ |||| \\____/ `",
+        "   ,-.___/ || \\__,-._  ",
+        "  /    ___/  \\__       ",
+        "     _/         `---   ",
+    ],
+    
+    'eat2': [
+        "         ______        ",
+        "        /      \\       ",
+        "       /        \\      ",
+        "       |        |      ",
+        "    )  *        *   ?  ",
+        "   (    \\ <WW> /    |  ",
+        "  _ \\___/||||||\\___/ _ ",
+        "   \\____/ |||| \\____/ `",
+        "   ,-.___/ || \\__,-._  ",
+        "  /    ___/  \\__       ",
+        "     _/         `---   ",
+    ],
+    
+    'eat3': [
+        "         ______        ",
+        "        /      \\       ",
+        "       /        \\      ",
+        "       |        |      ",
+        "    )  ^        ^   ?  ",
+        "   (    \\ /^^\\ /    |  ",
+        "  _ \\___/||||||\\___/ _ ",
+        "   \\____/ |||| \\____/ `",
+        "   ,-.___/ || \\__,-._  ",
+        "  /    ___/  \\__       ",
+        "     _/         `---   ",
+    ],
+    
+    # Upside-down swimming sprites (for swimming to intercept boats)
+    'swim_flip1': [
+        "     _/         `---   ",
+        "  /    ___/  \\__       ",
+        "   ,-.___/ || \\__,-._  ",
+        "   \\____/ |||| \\____/ `",
+        "  _ \\___/||||||\\___/ _ ",
+        "   (    \\      /    |  ",
+        "    )  @        @   ?  ",
+        "       |        |      ",
+        "       \\        /      ",
+        "        \\______/       ",
+        "                       ",
+    ],
+    
+    'swim_flip2': [
+        "     _/         `---   ",
+        "  /    ___/  \\__       ",
+        "   ,-.___/ || \\__,-._  ",
+        "   \\____/ |||| \\____/ `",
+        "  _ \\___/||||||\\___/ _ ",
+        "   (    \\  ^   /    |  ",
+        "    )  O        O   ?  ",
+        "       |        |      ",
+        "       \\        /      ",
+        "        \\______/       ",
+        "                       ",
+    ],
+    
+    'swim_flip3': [
+        "     _/         `---   ",
+        "  /    ___/  \\__       ",
+        "   ,-.___/ || \\__,-._  ",
+        "   \\____/ |||| \\____/ `",
+        "  _ \\___/||||||\\___/ _ ",
+        "   (    \\  >   /    |  ",
+        "    )  @        @   ?  ",
+        "       |        |      ",
+        "       \\        /      ",
+        "        \\______/       ",
+        "                       ",
+    ],
+    
+    # Upside-down attack sprites (for attacking boats)
+    'attack1': [
+        "     _/         `---   ",
+        "  /    ___/  \\__       ",
+        "   ,-.___/ || \\__,-._  ",
+        "   \\____/ |||| \\____/ `",
+        "  _ \\___/||||||\\___/ _ ",
+        "   (    \\  ><  /    |  ",
+        "    )  @        @   ?  ",
+        "       |        |      ",
+        "       \\        /      ",
+        "        \\______/       ",
+        "                       ",
+    ],
+    
+    'attack2': [
+        "     _/         `---   ",
+        "  /    ___/  \\__       ",
+        "   ,-.___/ || \\__,-._  ",
+        "   \\____/ |||| \\____/ `",
+        "  _ \\___/||||||\\___/ _ ",
+        "   (    \\ >XX< /    |  ",
+        "    )  X        X   ?  ",
+        "       |        |      ",
+        "       \\        /      ",
+        "        \\______/       ",
+        "                       ",
+    ],
+    
+    'attack3': [
+        "     _/         `---   ",
+        "  /    ___/  \\__       ",
+        "   ,-.___/ || \\__,-._  ",
+        "   \\____/ |||| \\____/ `",
+        "  _ \\___/||||||\\___/ _ ",
+        "   (    \\ <**> /    |  ",
+        "    )  *        *   ?  ",
+        "       |        |      ",
+        "       \\        /      ",
+        "        \\______/       ",
+        "                       ",
+    ],
+}
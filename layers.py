@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Retained-mode canvas layer
+Creates each canvas item once and afterwards only updates it in place
+with coords/itemconfigure, skipping calls when nothing changed.
+"""
+
+import weakref
+
+# One layer per canvas so every render function shares the same items
+_layers = weakref.WeakKeyDictionary()
+
+
+class _Item:
+    """Book-keeping for one retained canvas item"""
+    __slots__ = ('item_id', 'kind', 'tag', 'coords', 'options')
+
+    def __init__(self, item_id, kind, tag, coords, options):
+        self.item_id = item_id
+        self.kind = kind
+        self.tag = tag
+        self.coords = coords
+        self.options = options
+
+
+class RetainedLayer:
+    """Keyed canvas items that survive between frames
+
+    In retained mode (the default) each key maps to one canvas item that is
+    created on first use and then only moved/reconfigured when its
+    coordinates or options actually change.
+
+    In immediate mode (retained=False) every frame deletes its tag and
+    recreates all items, which is how the pet used to render. It is kept
+    so benchmarks can compare both paths.
+    """
+
+    def __init__(self, canvas, retained=True):
+        self.canvas = canvas
+        self.retained = retained
+        self.items = {}  # key -> _Item
+        self.tags = {}  # tag -> list of keys, in creation order
+
+    def begin(self, tag):
+        """Start a new frame for tag (clears the old frame in immediate mode)"""
+        if not self.retained:
+            self.canvas.delete(tag)
+
+    def text(self, key, x, y, tag, **options):
+        """Create or update a text item; returns True if a new item was created"""
+        return self.item('text', key, (x, y), tag, options)
+
+    def rectangle(self, key, x0, y0, x1, y1, tag, **options):
+        """Create or update a rectangle item; returns True if a new item was created"""
+        return self.item('rectangle', key, (x0, y0, x1, y1), tag, options)
+
+    def line(self, key, x0, y0, x1, y1, tag, **options):
+        """Create or update a line item; returns True if a new item was created"""
+        return self.item('line', key, (x0, y0, x1, y1), tag, options)
+
+    def item(self, kind, key, coords, tag, options):
+        """Create or update a canvas item of the given kind
+
+        Args:
+            kind: Canvas item type ('text', 'rectangle', 'line')
+            key: Stable identity of the item across frames
+            coords: Tuple of item coordinates
+            tag: Canvas tag shared by the group the item belongs to
+            options: Item options (text, fill, font, ...)
+
+        Returns:
+            True if a canvas item was created, False if an existing one was reused
+        """
+        if not self.retained:
+            self._create(kind, coords, tag, options)
+            return True
+
+        item = self.items.get(key)
+        if item is None:
+            options.setdefault('state', 'normal')
+            item_id = self._create(kind, coords, tag, options)
+            self.items[key] = _Item(item_id, kind, tag, coords, options)
+            self.tags.setdefault(tag, []).append(key)
+            return True
+
+        if item.coords != coords:
+            self.canvas.coords(item.item_id, *coords)
+            item.coords = coords
+
+        options.setdefault('state', 'normal')
+        changed = {name: value for name, value in options.items()
+                   if item.options.get(name) != value}
+        if changed:
+            self.canvas.itemconfigure(item.item_id, **changed)
+            item.options.update(changed)
+        return False
+
+    def position(self, key):
+        """Last coordinates set for a retained item, or None if it doesn't exist"""
+        item = self.items.get(key)
+        return item.coords if item is not None else None
+
+    def translate(self, tag, dx, dy):
+        """Shift every item of tag with a single canvas.move call"""
+        if not dx and not dy:
+            return
+        self.canvas.move(tag, dx, dy)
+        for key in self.tags.get(tag, ()):
+            item = self.items[key]
+            item.coords = tuple(value + (dx if i % 2 == 0 else dy)
+                                for i, value in enumerate(item.coords))
+
+    def hide(self, key):
+        """Hide a retained item without deleting it (no-op if already hidden)"""
+        item = self.items.get(key)
+        if item is not None and item.options.get('state') != 'hidden':
+            self.canvas.itemconfigure(item.item_id, state='hidden')
+            item.options['state'] = 'hidden'
+
+    def hide_except(self, tag, live_keys):
+        """Hide every item of tag whose key is not in live_keys"""
+        for key in self.tags.get(tag, ()):
+            if key not in live_keys:
+                self.hide(key)
+
+    def discard(self, key):
+        """Delete a retained item from the canvas and forget it"""
+        item = self.items.pop(key, None)
+        if item is not None:
+            self.canvas.delete(item.item_id)
+            self.tags[item.tag].remove(key)
+
+    def discard_tag(self, tag):
+        """Delete all items of tag from the canvas and forget them"""
+        self.canvas.delete(tag)
+        for key in self.tags.pop(tag, ()):
+            del self.items[key]
+
+    def _create(self, kind, coords, tag, options):
+        create = getattr(self.canvas, 'create_' + kind)
+        return create(*coords, tags=tag, **options)
+
+
+def layer_for(canvas, retained=True):
+    """Get the shared RetainedLayer for a canvas (created on first use)"""
+    layer = _layers.get(canvas)
+    if layer is None or layer.retained != retained:
+        layer = RetainedLayer(canvas, retained=retained)
+        _layers[canvas] = layer
+    return layer
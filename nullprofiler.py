@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Null Profiler
+The do-nothing profiler the World and the renderers hold until profiling
+is turned on. It lives apart from profiler.py so that a pet running
+without profiling never imports the real profiler.
+"""
+
+
+class _NullPhase:
+    """Context manager that does nothing (profiling disabled)"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; every method is a no-op"""
+    enabled = False
+
+    def phase(self, name):
+        return _NULL_PHASE
+
+    def record(self, name, seconds):
+        pass
+
+    def count(self, name, value=1):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Bubble Particle System
+Bubble positions, glyphs and sizes live in parallel buffers that are updated
+and culled with vectorized operations. NumPy is used when installed, with a
+pure-array fallback otherwise.
+"""
+
+import random
+from array import array
+from designs import UNDERWATER_ENVIRONMENT, get_surface_height
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+BUBBLE_GLYPHS = UNDERWATER_ENVIRONMENT['bubbles_small'] + UNDERWATER_ENVIRONMENT['bubbles_medium']
+BUBBLE_SIZES = [10, 12, 14, 16]
+BUBBLE_COLOR = '#FFFFFF'
+RISE_PER_TICK = 2  # Pixels a bubble rises each tick
+
+
+class BubbleSystem:
+    """Fixed-capacity pool of bubbles stored in parallel buffers
+
+    Every bubble occupies a slot that it keeps for its whole life, so
+    renderers can map slot i to canvas item i. Dead slots go on a free
+    list and are reused by later spawns. generation[i] increases each time
+    slot i gets a new bubble, which lets renderers spot respawned slots.
+
+    Args:
+        width: Canvas width
+        water_level: Y-coordinate of ocean surface
+        height: Canvas height
+        capacity: Maximum number of live bubbles
+        rng: random.Random used for spawning (default: new unseeded Random)
+        use_numpy: Force (True) or disable (False) NumPy; None = use it if installed
+        surface_height: Height of the 2-line surface (default: get_surface_height())
+    """
+
+    def __init__(self, width, water_level, height, capacity=4096, rng=None, use_numpy=None,
+                 surface_height=None):
+        self.width = width
+        self.water_level = water_level
+        self.height = height
+        self.capacity = capacity
+        self.rng = rng if rng is not None else random.Random()
+        self.use_numpy = np is not None if use_numpy is None else (use_numpy and np is not None)
+
+        # Spawn in underwater area only (below 2-line surface, above ocean floor)
+        if surface_height is None:
+            surface_height = get_surface_height()
+        self.spawn_top = water_level + surface_height + 10
+        self.spawn_bottom = height - 60
+        # Remove bubbles slightly before they reach the visible surface (for realism)
+        self.removal_y = water_level + 15
+
+        if self.use_numpy:
+            self.x = np.zeros(capacity, dtype=np.int32)
+            self.y = np.zeros(capacity, dtype=np.int32)
+            self.glyph = np.zeros(capacity, dtype=np.int8)  # Index into BUBBLE_GLYPHS
+            self.size = np.zeros(capacity, dtype=np.int8)  # Index into BUBBLE_SIZES
+            self.alive = np.zeros(capacity, dtype=bool)
+            self.generation = np.zeros(capacity, dtype=np.int64)
+        else:
+            self.x = array('i', bytes(4 * capacity))
+            self.y = array('i', bytes(4 * capacity))
+            self.glyph = array('b', bytes(capacity))
+            self.size = array('b', bytes(capacity))
+            self.alive = bytearray(capacity)
+            self.generation = array('q', bytes(8 * capacity))
+
+        self.count = 0  # Live bubbles
+        self.high_water = 0  # Slots [0, high_water) have ever been used
+        self.free_slots = []  # Reusable slots below high_water
+        self.rise_total = 0  # Pixels every live bubble has risen since start
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, count=1):
+        """Spawn up to count bubbles at random underwater positions"""
+        rng = self.rng
+        for _ in range(count):
+            if self.free_slots:
+                slot = self.free_slots.pop()
+            elif self.high_water < self.capacity:
+                slot = self.high_water
+                self.high_water += 1
+            else:
+                return  # Pool is full
+            # Spawn across entire width (no margin)
+            self.x[slot] = rng.randint(0, self.width)
+            self.y[slot] = rng.randint(self.spawn_top, self.spawn_bottom)
+            self.glyph[slot] = rng.randrange(len(BUBBLE_GLYPHS))
+            self.size[slot] = rng.randrange(len(BUBBLE_SIZES))
+            self.alive[slot] = True
+            self.generation[slot] += 1
+            self.count += 1
+
+    def step(self, spawn_chance=0.05):
+        """Spawn, rise and cull bubbles for one tick
+
+        Args:
+            spawn_chance: Expected bubbles spawned per tick; values above 1
+                spawn int(spawn_chance) bubbles plus one more with the fractional chance
+        """
+        whole = int(spawn_chance)
+        spawn_count = whole + (1 if self.rng.random() < spawn_chance - whole else 0)
+        if spawn_count:
+            self.spawn(spawn_count)
+
+        self.rise_total += RISE_PER_TICK
+        n = self.high_water
+        if not self.count:
+            return
+
+        if self.use_numpy:
+            y = self.y[:n]
+            alive = self.alive[:n]
+            np.subtract(y, RISE_PER_TICK, out=y, where=alive)  # Rising physics
+            dead = alive & (y <= self.removal_y)
+            if dead.any():
+                alive[dead] = False
+                culled = np.flatnonzero(dead).tolist()
+                self.free_slots.extend(culled)
+                self.count -= len(culled)
+        else:
+            y = self.y
+            alive = self.alive
+            removal_y = self.removal_y
+            for i in range(n):
+                if not alive[i]:
+                    continue
+                y[i] -= RISE_PER_TICK
+                if y[i] <= removal_y:
+                    alive[i] = 0
+                    self.free_slots.append(i)
+                    self.count -= 1
+
+    def live_slots(self):
+        """Slots holding a live bubble"""
+        if self.use_numpy:
+            return np.flatnonzero(self.alive[:self.high_water]).tolist()
+        return [i for i in range(self.high_water) if self.alive[i]]
+
+    def bubble(self, slot):
+        """(x, y, char, size, color) of the bubble in slot"""
+        return (int(self.x[slot]), int(self.y[slot]), BUBBLE_GLYPHS[self.glyph[slot]],
+                BUBBLE_SIZES[self.size[slot]], BUBBLE_COLOR)
+
+    def changed_slots(self, drawn_generation):
+        """Slots whose generation differs from drawn_generation (spawned or respawned)"""
+        n = self.high_water
+        if self.use_numpy:
+            return np.flatnonzero(self.generation[:n] != drawn_generation[:n]).tolist()
+        generation = self.generation
+        return [i for i in range(n) if generation[i] != drawn_generation[i]]
+
+
+class BubbleRenderer:
+    """Draws a BubbleSystem with a fixed pool of canvas items, one per slot
+
+    All bubbles rise by the same amount each tick, so the whole pool is
+    moved with a single canvas.move on the "bubbles" tag; only newly
+    spawned or culled slots need per-item calls.
+
+    Args:
+        canvas: Canvas to draw on
+        system: BubbleSystem to draw
+        origin_x: World x-coordinate of the canvas's left edge (for viewports)
+        width: Width of the world slice shown (None = everything); bubbles
+            only rise, so ones spawned outside the slice are never drawn
+    """
+
+    def __init__(self, canvas, system, origin_x=0, width=None):
+        self.canvas = canvas
+        self.system = system
+        self.origin_x = origin_x
+        self.end_x = None if width is None else origin_x + width
+        self.item_ids = []  # Canvas item per slot
+        if system.use_numpy:
+            self.shown = np.zeros(system.capacity, dtype=bool)  # Whether slot's item is visible
+            self.drawn_generation = np.zeros(system.capacity, dtype=np.int64)
+        else:
+            self.shown = bytearray(system.capacity)
+            self.drawn_generation = array('q', bytes(8 * system.capacity))
+        self.drawn_rise = 0  # Interpolated rise the items were last moved to
+
+    def render(self, alpha=1.0):
+        """Bring the canvas items in line with the bubble system
+
+        Args:
+            alpha: Fraction of the next tick elapsed; bubbles are drawn
+                between their previous and current positions
+        """
+        system = self.system
+        canvas = self.canvas
+
+        # Everything on screen rises together: one call for the whole pool
+        lag = RISE_PER_TICK * (1.0 - alpha)  # How far the current tick's rise is still to go
+        rise = system.rise_total - lag - self.drawn_rise
+        if rise and self.item_ids:
+            canvas.move("bubbles", 0, -rise)
+        self.drawn_rise = system.rise_total - lag
+
+        # Newly spawned bubbles: place (and restyle) their slot's item
+        for slot in system.changed_slots(self.drawn_generation):
+            self.drawn_generation[slot] = system.generation[slot]
+            if not system.alive[slot]:
+                continue  # Spawned and culled between renders
+            x, y, char, size, color = system.bubble(slot)
+            if self.end_x is not None and not self.origin_x <= x < self.end_x:
+                # In another viewport's slice; hide whatever the slot showed before
+                if self.shown[slot]:
+                    canvas.itemconfigure(self.item_ids[slot], state='hidden')
+                    self.shown[slot] = 0
+                continue
+            x -= self.origin_x
+            y += lag
+            if slot < len(self.item_ids):
+                canvas.coords(self.item_ids[slot], x, y)
+                canvas.itemconfigure(self.item_ids[slot], text=char, font=('Arial', size),
+                                     fill=color, state='normal')
+            else:
+                while len(self.item_ids) < slot:
+                    self.item_ids.append(canvas.create_text(0, 0, text='', state='hidden',
+                                                            tags="bubbles"))
+                self.item_ids.append(canvas.create_text(x, y, text=char, font=('Arial', size),
+                                                        fill=color, tags="bubbles"))
+            self.shown[slot] = 1
+
+        # Culled bubbles: hide their items until the slot is reused
+        for slot in self.culled_slots():
+            canvas.itemconfigure(self.item_ids[slot], state='hidden')
+            self.shown[slot] = 0
+
+    def culled_slots(self):
+        """Slots whose item is visible but whose bubble is gone"""
+        n = len(self.item_ids)
+        alive = self.system.alive
+        if self.system.use_numpy:
+            return np.flatnonzero(self.shown[:n] & ~alive[:n]).tolist()
+        shown = self.shown
+        return [i for i in range(n) if shown[i] and not alive[i]]
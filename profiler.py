@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Frame Profiler
+Times each phase of a tick with perf_counter, keeps rolling p50/p95/p99
+statistics, counts Tcl calls and canvas items, and can show them in an
+on-canvas HUD or dump them to JSON.
+"""
+
+import time
+from collections import deque
+from nullprofiler import NullProfiler, NULL_PROFILER  # The no-op stand-in, re-exported
+
+
+class CountingTk:
+    """Proxy for a Tk interpreter that counts call() round-trips
+
+    Install it on a widget with widget.tk = CountingTk(widget.tk); every
+    tkinter widget method goes through widget.tk.call.
+    """
+
+    def __init__(self, tk):
+        self._tk = tk
+        self.count = 0
+
+    def call(self, *args):
+        self.count += 1
+        return self._tk.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+class _Phase:
+    """Reusable context manager timing one named phase"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Rolling per-phase timings and counters
+
+    Args:
+        window: Number of most recent samples kept per phase
+    """
+    enabled = True
+
+    def __init__(self, window=600):
+        self.window = window
+        self.samples = {}  # phase name -> deque of seconds
+        self.totals = {}  # phase name -> (calls, total seconds) over the whole run
+        self.counters = {}  # counter name -> latest value
+        self.phases = {}  # phase name -> reusable _Phase
+        self.started = time.perf_counter()
+
+    def phase(self, name):
+        """Context manager timing the enclosed block as phase name"""
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = _Phase(self, name)
+        return phase
+
+    def record(self, name, seconds):
+        """Add one timing sample for phase name"""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(seconds)
+        calls, total = self.totals.get(name, (0, 0.0))
+        self.totals[name] = (calls + 1, total + seconds)
+
+    def count(self, name, value=1):
+        """Set counter name to value (e.g. canvas items, Tcl calls per frame)"""
+        self.counters[name] = value
+
+    def stats(self):
+        """{phase: {'p50', 'p95', 'p99', 'max', 'mean', 'calls'}} in milliseconds"""
+        result = {}
+        for name, samples in self.samples.items():
+            ordered = sorted(samples)
+            calls, total = self.totals[name]
+            result[name] = {
+                'p50': percentile(ordered, 0.50) * 1000,
+                'p95': percentile(ordered, 0.95) * 1000,
+                'p99': percentile(ordered, 0.99) * 1000,
+                'max': ordered[-1] * 1000 if ordered else 0.0,
+                'mean': total / calls * 1000 if calls else 0.0,
+                'calls': calls,
+            }
+        return result
+
+    def report(self):
+        """Stats and counters as a JSON-serializable dict"""
+        return {
+            'uptime_seconds': time.perf_counter() - self.started,
+            'window': self.window,
+            'phases_ms': self.stats(),
+            'counters': dict(self.counters),
+        }
+
+    def dump(self, path):
+        """Write report() to a JSON file"""
+        import json  # Only needed on exit; keeps startup imports small
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2, sort_keys=True)
+
+    def summary_lines(self):
+        """Short text lines for the HUD"""
+        lines = []
+        for name, stat in sorted(self.stats().items()):
+            lines.append(f"{name:<16}{stat['p50']:6.2f}{stat['p95']:6.2f}{stat['p99']:6.2f}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<16}{value:>6}")
+        return lines
+
+
+class ProfilerHUD:
+    """On-canvas text overlay showing profiler statistics, refreshed periodically
+
+    Args:
+        canvas: Canvas to draw on
+        profiler: FrameProfiler to display
+        x, y: Bottom-left corner of the overlay
+        interval: Seconds between refreshes
+    """
+
+    def __init__(self, canvas, profiler, x, y, interval=0.5):
+        self.canvas = canvas
+        self.profiler = profiler
+        self.interval = interval
+        self.last_update = 0.0
+        self.item_id = canvas.create_text(x, y, text="", anchor='sw', fill='#00FF88',
+                                          font=('Courier', 8), tags="profiler_hud")
+
+    def update(self):
+        """Refresh the overlay if the refresh interval has passed"""
+        now = time.perf_counter()
+        if now - self.last_update < self.interval:
+            return
+        self.last_update = now
+        self.profiler.count('canvas_items', len(self.canvas.find_all()))
+        header = f"{'phase (ms)':<16}{'p50':>6}{'p95':>6}{'p99':>6}"
+        text = "\n".join([header] + self.profiler.summary_lines())
+        self.canvas.itemconfigure(self.item_id, text=text)
+        self.canvas.tag_raise("profiler_hud")
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Renderer Interface
+Anything that draws World snapshots: the Tk canvas (scene.SceneRenderer) or
+a terminal (terminal.TerminalRenderer). Backends must not require Tk.
+"""
+
+from nullprofiler import NULL_PROFILER
+
+
+class Renderer:
+    """Base class for renderer backends
+
+    A backend draws one frame per render(snapshot) call and is expected to
+    only touch what changed since the previous frame.
+    """
+    profiler = NULL_PROFILER  # Set a FrameProfiler to time render phases
+
+    def render(self, snapshot):
+        """Draw one frame of the world"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release whatever the backend holds (terminal modes, windows)"""
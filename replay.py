@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Session Record/Replay
+The World takes all its randomness from one seeded random.Random, so a
+session is fully described by its seed, its size and the inputs (shrimp
+drops, boats) with the tick they arrived at. The recorder writes those to a
+small binary file; the replayer runs the same session headless, as fast as
+possible, and reports a frame-time profile that can be compared between
+versions.
+
+File format (little-endian):
+    header  '<4sHQIIHddH' magic b'KREC', version, seed, width, height,
+                          kraken count, bubble spawn chance, surface character
+                          width and surface height (both measured from the
+                          font, see fontmetrics.py)
+    event   '<IIBii'     tick, milliseconds since start, kind, x, y
+    end     an event of kind END (tick = total ticks) followed by '<I',
+            a CRC-32 of the final world state
+
+Usage:
+    python3 pet.py --record session.krec                 # record a session
+    python3 replay.py session.krec                       # replay it, print the profile
+    python3 replay.py session.krec --render items --json after.json
+    python3 replay.py session.krec --compare before.json
+"""
+
+import argparse
+import json
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from collections import namedtuple
+
+from profiler import FrameProfiler
+from simulation import World, TICK
+
+MAGIC = b'KREC'
+VERSION = 4
+HEADER = struct.Struct('<4sHQIIHddH')
+EVENT = struct.Struct('<IIBii')
+DIGEST = struct.Struct('<I')
+
+# Event kinds
+END = 0
+SHRIMP = 1
+BOAT_LR = 2
+BOAT_RL = 3
+
+Recording = namedtuple('Recording', [
+    'seed', 'width', 'height', 'kraken_count', 'bubble_spawn_chance', 'char_width', 'surface_height',
+    'events',       # List of (tick, ms, kind, x, y)
+    'ticks',        # Ticks the session ran (None if it wasn't closed cleanly)
+    'digest',       # CRC-32 of the final world state (None if not closed cleanly)
+])
+
+
+def new_seed():
+    """A fresh 63-bit seed for a recorded session"""
+    return random.SystemRandom().getrandbits(63)
+
+
+def state_digest(world):
+    """CRC-32 of the world state a replay must reproduce exactly"""
+    state = (world.wave_animation_frame, world.shrimp_eaten_count, world.boats_destroyed,
+             tuple(world.shrimp.values()), len(world.bubbles), world.boat.active, world.boat.char_pos,
+             tuple((kraken.x, kraken.y, kraken.state) for kraken in world.krakens))
+    return zlib.crc32(repr(state).encode())
+
+
+class Recorder:
+    """Records a session's inputs while forwarding them to the world
+
+    It has the World's input methods, so the pet can send clicks to the
+    recorder instead of the world without other changes.
+
+    Args:
+        path: File to write
+        world: World being recorded (created with rng=random.Random(seed))
+        seed: The seed the world's rng was created with
+    """
+
+    def __init__(self, path, world, seed):
+        self.world = world
+        self.path = path
+        self.started = time.perf_counter()
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, world.width, world.height,
+                                    len(world.krakens), world.bubble_spawn_chance, world.char_width,
+                                    world.surface_height))
+
+    def record(self, kind, x=0, y=0):
+        """Log one input at the current tick"""
+        ms = int((time.perf_counter() - self.started) * 1000)
+        self.file.write(EVENT.pack(self.world.wave_animation_frame, ms, kind, int(x), int(y)))
+
+    def drop_shrimp(self, x, y):
+        self.record(SHRIMP, x, y)
+        return self.world.drop_shrimp(x, y)
+
+    def spawn_boat(self, direction='lr'):
+        self.record(BOAT_LR if direction == 'lr' else BOAT_RL)
+        return self.world.spawn_boat(direction=direction)
+
+    def close(self):
+        """Write the end marker with the final state digest"""
+        if self.file.closed:
+            return
+        self.record(END)
+        self.file.write(DIGEST.pack(state_digest(self.world)))
+        self.file.close()
+
+
+def read_recording(path):
+    """Load a recorded session (a session cut short replays up to its last input)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: not a session recording (too short)")
+    (magic, version, seed, width, height, kraken_count, spawn_chance, char_width,
+     surface_height) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a session recording")
+    if version != VERSION:
+        raise ValueError(f"{path}: recording version {version}, this replayer reads version {VERSION}")
+
+    events = []
+    ticks = digest = None
+    offset = HEADER.size
+    while offset + EVENT.size <= len(data):
+        event = EVENT.unpack_from(data, offset)
+        offset += EVENT.size
+        if event[2] == END:
+            ticks = event[0]
+            if offset + DIGEST.size <= len(data):
+                digest = DIGEST.unpack_from(data, offset)[0]
+            break
+        events.append(event)
+    return Recording(seed, width, height, kraken_count, spawn_chance, char_width, surface_height,
+                     events, ticks, digest)
+
+
+def apply_event(world, kind, x, y):
+    """Feed one recorded input to the world"""
+    if kind == SHRIMP:
+        world.drop_shrimp(x, y)
+    elif kind == BOAT_LR:
+        world.spawn_boat(direction='lr')
+    elif kind == BOAT_RL:
+        world.spawn_boat(direction='rl')
+
+
+# ===== RENDERERS =====
+# What to render each tick while replaying (all display-free)
+
+def make_renderer(name, width, height):
+    """Render callable taking a snapshot, or None for simulation only"""
+    if name == 'none':
+        return None
+    if name == 'compose':
+        from framebuffer import FrameComposer
+        return FrameComposer(width, height).compose
+    # Canvas renderers draw onto the benchmark stub canvas
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench'))
+    from stub_canvas import StubCanvas
+    if name == 'grid':
+        from compositor import GridRenderer
+        return GridRenderer(StubCanvas(width, height), width, height).render
+    from scene import SceneRenderer
+    return SceneRenderer(StubCanvas(width, height), width, height).render
+
+
+RENDERERS = ('none', 'compose', 'items', 'grid')
+
+
+def replay(recording, profiler, render='none'):
+    """Run a recorded session as fast as possible
+
+    Each tick applies the inputs recorded at that tick, advances the world
+    and renders one frame, timing the phases with profiler.
+
+    Returns:
+        The world after the last tick
+    """
+    world = World(recording.width, recording.height, rng=random.Random(recording.seed), verbose=False,
+                  kraken_count=recording.kraken_count, char_width=recording.char_width,
+                  surface_height=recording.surface_height)
+    world.bubble_spawn_chance = recording.bubble_spawn_chance
+    world.profiler = profiler
+    renderer = make_renderer(render, recording.width, recording.height)
+
+    ticks = recording.ticks
+    if ticks is None:
+        ticks = recording.events[-1][0] + 1 if recording.events else 0
+    events = recording.events
+    next_event = 0
+    for tick in range(ticks):
+        while next_event < len(events) and events[next_event][0] <= tick:
+            _, _, kind, x, y = events[next_event]
+            apply_event(world, kind, x, y)
+            next_event += 1
+        with profiler.phase('tick'):
+            world.tick()
+        if renderer is not None:
+            with profiler.phase('frame'):
+                renderer(world.snapshot())
+    for _, _, kind, x, y in events[next_event:]:  # Clicks after the last tick
+        apply_event(world, kind, x, y)
+    return world
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('recording', help='session file written by pet.py --record')
+    parser.add_argument('--render', choices=RENDERERS, default='items',
+                        help='renderer driven each tick (default: items, on a stub canvas)')
+    parser.add_argument('--json', metavar='PATH', help='write the profile to a JSON file')
+    parser.add_argument('--compare', metavar='PATH', help='profile JSON to compare against')
+    args = parser.parse_args()
+
+    recording = read_recording(args.recording)
+    profiler = FrameProfiler(window=1000000)  # Keep every sample
+    start = time.perf_counter()
+    world = replay(recording, profiler, args.render)
+    elapsed = time.perf_counter() - start
+
+    ticks = world.wave_animation_frame
+    print(f"🎬 {args.recording}: seed {recording.seed}, {recording.width}x{recording.height}, "
+          f"{recording.kraken_count} kraken(s), {len(recording.events)} inputs")
+    print(f"⏱️ {ticks} ticks ({ticks * TICK:.0f}s of pet time) in {elapsed:.2f}s, "
+          f"{ticks / elapsed if elapsed else 0:.0f} ticks/s")
+    if recording.digest is None:
+        print("⚠️ Recording wasn't closed cleanly; replayed up to its last input")
+    elif state_digest(world) == recording.digest:
+        print("✅ Final state matches the recording")
+    else:
+        print("❌ Final state differs from the recording (behaviour changed since it was made)")
+
+    report = profiler.report()
+    report['recording'] = os.path.basename(args.recording)
+    report['render'] = args.render
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['phases_ms']
+    print(f"{'phase (ms)':<14}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{'mean':>8}")
+    for name, stat in sorted(report['phases_ms'].items()):
+        print(f"{name:<14}" + "".join(f"{stat[key]:8.3f}" for key in ('p50', 'p95', 'p99', 'max', 'mean')))
+        old = (baseline or {}).get(name)
+        if old:
+            print(f"{'  vs baseline':<14}" + "".join(
+                f"{(stat[key] - old[key]) / old[key]:>+8.1%}" if old[key] else f"{'-':>8}"
+                for key in ('p50', 'p95', 'p99', 'max', 'mean')))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Profile written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
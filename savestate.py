@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Saved State
+The counters, the queued shrimp and the kraken positions survive restarts
+(start_pet.sh starts a fresh pet on every login). Snapshots are a few
+hundred bytes packed with struct; the UI thread only packs them, a
+background thread writes them to a temporary file and renames it over the
+old snapshot, so a crash mid-write never leaves a half-written file and
+disk latency never delays a frame.
+
+File format (little-endian):
+    header  '<4sHdIIHIHH'  magic b'KSAV', version, saved at (Unix time),
+                           world width, height, shrimp eaten, boats destroyed,
+                           kraken count, shrimp count
+    kraken  '<ff'          x, y (one per kraken)
+    shrimp  '<ff'          x, y (one per queued shrimp, in drop order)
+    crc     '<I'           CRC-32 of everything before it
+"""
+
+import os
+import struct
+import threading
+import time
+import zlib
+
+MAGIC = b'KSAV'
+VERSION = 2
+HEADER = struct.Struct('<4sHdIIHIHH')
+POINT = struct.Struct('<ff')
+CRC = struct.Struct('<I')
+
+
+def pack_state(world):
+    """Serialize the parts of the world worth keeping (cheap enough for the UI thread)"""
+    shrimp = list(world.shrimp.values())
+    parts = [HEADER.pack(MAGIC, VERSION, time.time(), world.width, world.height,
+                         world.shrimp_eaten_count, world.boats_destroyed,
+                         len(world.krakens), len(shrimp))]
+    parts.extend(POINT.pack(kraken.x, kraken.y) for kraken in world.krakens)
+    parts.extend(POINT.pack(x, y) for x, y, _ in shrimp)
+    data = b''.join(parts)
+    return data + CRC.pack(zlib.crc32(data))
+
+
+def unpack_state(data):
+    """Parse a snapshot into a dict (raises ValueError if it's damaged or from another version)"""
+    if len(data) < HEADER.size + CRC.size:
+        raise ValueError("snapshot too short")
+    if zlib.crc32(data[:-CRC.size]) != CRC.unpack_from(data, len(data) - CRC.size)[0]:
+        raise ValueError("snapshot checksum mismatch")
+    (magic, version, saved_at, width, height, shrimp_eaten, boats_destroyed,
+     kraken_count, shrimp_count) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a pet state snapshot")
+    if version != VERSION:
+        raise ValueError(f"snapshot version {version}, expected {VERSION}")
+    if len(data) != HEADER.size + (kraken_count + shrimp_count) * POINT.size + CRC.size:
+        raise ValueError("snapshot size doesn't match its header")
+
+    points = [POINT.unpack_from(data, HEADER.size + i * POINT.size)
+              for i in range(kraken_count + shrimp_count)]
+    return {
+        'saved_at': saved_at,
+        'width': width,
+        'height': height,
+        'shrimp_eaten_count': shrimp_eaten,
+        'boats_destroyed': boats_destroyed,
+        'krakens': points[:kraken_count],
+        'shrimp': points[kraken_count:],
+    }
+
+
+def load_state(path):
+    """Read a snapshot file; returns None if there is none or it can't be used"""
+    path = os.path.expanduser(path)
+    try:
+        with open(path, 'rb') as f:
+            return unpack_state(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Ignoring saved state {path}: {e}")
+        return None
+
+
+def apply_state(world, state):
+    """Put a loaded snapshot into a freshly created world
+
+    Positions are scaled if the screen size changed since the snapshot and
+    krakens are kept inside their bounds. Shrimp go through drop_shrimp, so
+    any that no longer fit in the water are dropped.
+    """
+    scale_x = world.width / state['width'] if state['width'] else 1.0
+    scale_y = world.height / state['height'] if state['height'] else 1.0
+
+    world.shrimp_eaten_count = min(state['shrimp_eaten_count'], 100)
+    world.boats_destroyed = state['boats_destroyed']
+    world.show_boat_counter = world.boats_destroyed > 0
+
+    min_x, max_x, min_y, max_y = world.kraken_bounds()
+    for kraken, (x, y) in zip(world.krakens, state['krakens']):
+        x = min(max(x * scale_x, min_x), max_x)
+        y = min(max(y * scale_y, min_y), max(min_y, max_y))
+        kraken.x = kraken.prev_x = kraken.target_x = x
+        kraken.y = kraken.prev_y = kraken.target_y = y
+
+    verbose = world.verbose
+    world.verbose = False  # Rejections here are expected, not the user's clicks
+    restored = sum(1 for x, y in state['shrimp'] if world.drop_shrimp(int(x * scale_x), int(y * scale_y)))
+    world.verbose = verbose
+    return restored
+
+
+def write_atomic(path, data):
+    """Write data to path so readers see either the old file or the whole new one"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class StateSaver:
+    """Writes snapshots on a background thread
+
+    save() only hands the packed bytes over; if the writer is still busy
+    with an older snapshot, the newest one replaces whatever was waiting.
+
+    Args:
+        path: Snapshot file (~ is expanded)
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        self.pending = None  # Newest snapshot not written yet
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.closing = False
+        self.thread = threading.Thread(target=self.run, name='state-saver', daemon=True)
+        self.thread.start()
+
+    def save(self, data):
+        """Queue a snapshot for writing (returns immediately)"""
+        with self.lock:
+            self.pending = data
+        self.wake.set()
+
+    def run(self):
+        while True:
+            self.wake.wait()
+            self.wake.clear()
+            with self.lock:
+                data, self.pending = self.pending, None
+                closing = self.closing  # Read together with pending so close()'s snapshot isn't missed
+            if data is not None:
+                try:
+                    write_atomic(self.path, data)
+                except OSError as e:
+                    print(f"⚠️ Could not save state to {self.path}: {e}")
+            if closing:
+                return
+
+    def close(self, data=None, timeout=2.0):
+        """Write a final snapshot and wait for the writer to finish"""
+        with self.lock:
+            if data is not None:
+                self.pending = data
+            self.closing = True
+        self.wake.set()
+        self.thread.join(timeout)
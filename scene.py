@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Canvas Scene Renderer
+Draws simulation snapshots (see simulation.py) onto a tkinter canvas.
+"""
+
+from designs import get_density_font_size, get_kraken_color
+from particles import BubbleRenderer
+from surface import SurfaceRenderer
+from sprites import SpriteRenderer
+from nullprofiler import NULL_PROFILER
+from renderer import Renderer
+
+
+class SceneRenderer(Renderer):
+    """Renders World snapshots onto a Tk canvas, only touching what changed
+
+    Args:
+        canvas: Canvas to draw on
+        width, height: Canvas size
+        origin_x: World x-coordinate of the canvas's left edge; with several
+            viewports each renderer only draws what falls in its own slice
+        show_shrimp_counter: Draw the shrimp counter (top left)
+        show_boat_counter: Draw the boat counter (top right)
+    """
+
+    def __init__(self, canvas, width, height, origin_x=0, show_shrimp_counter=True, show_boat_counter=True):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.origin_x = origin_x
+        self.show_shrimp_counter = show_shrimp_counter
+        self.show_boat_counter = show_boat_counter
+        self.kraken_font_size = get_density_font_size()
+        # Krakens whose center is this far outside the slice can't overlap it
+        # (sprites are 23 characters wide, a Courier character is ~0.6 font sizes)
+        self.kraken_margin = 12 * self.kraken_font_size
+        self.shrimp_tags = set()  # Shrimp currently drawn on the canvas
+        self.last_shrimp = None  # Snapshot shrimp tuple last drawn
+        self.surface = SurfaceRenderer(canvas, width, height, origin_x)
+        self.kraken_sprites = []  # One SpriteRenderer per kraken, tagged kraken_0, kraken_1, ...
+        self.bubble_renderer = None  # Bound to the world's BubbleSystem on first render
+        self.profiler = NULL_PROFILER  # Set a FrameProfiler to time render phases
+        self.last_counter = None  # (count, indicator) last drawn
+        self.last_boat_counter = None  # (show, count) last drawn
+
+    def render(self, snapshot):
+        """Draw one frame of the world"""
+        profiler = self.profiler
+        with profiler.phase('environment'):
+            self.render_environment(snapshot)
+        with profiler.phase('bubble_render'):
+            self.render_bubbles(snapshot)
+        with profiler.phase('shrimp_render'):
+            self.render_shrimp(snapshot)
+        with profiler.phase('kraken_render'):
+            self.render_kraken(snapshot)
+        self.render_counters(snapshot)
+
+    def render_environment(self, snapshot):
+        """Update the waves and the boat riding them (only changed lines are redrawn)"""
+        self.surface.render(
+            snapshot.wave_frame,
+            boat_char_pos=snapshot.boat_char_pos,
+            boat_active=snapshot.boat_active,
+            boat_direction=snapshot.boat_direction,
+            wave_phase=snapshot.wave_phase,
+            wake=snapshot.wake
+        )
+
+    def render_bubbles(self, snapshot):
+        """Update the pooled bubble items"""
+        if self.bubble_renderer is None or self.bubble_renderer.system is not snapshot.bubbles:
+            self.bubble_renderer = BubbleRenderer(self.canvas, snapshot.bubbles, self.origin_x,
+                                                  None if snapshot.width == self.width else self.width)
+        self.bubble_renderer.render(snapshot.alpha)
+
+    def render_shrimp(self, snapshot):
+        """Create newly dropped shrimp and delete eaten ones"""
+        if snapshot.shrimp is self.last_shrimp:
+            return  # World reuses the same tuple until shrimp change
+        self.last_shrimp = snapshot.shrimp
+        live_tags = set()
+        origin_x = self.origin_x
+        for tag, x, y in snapshot.shrimp:
+            x -= origin_x
+            if not 0 <= x < self.width:
+                continue  # In another viewport's slice
+            live_tags.add(tag)
+            if tag not in self.shrimp_tags:
+                # Same font size as kraken, Georgia for a curved, shrimp-like comma
+                self.canvas.create_text(x, y, text=",", font=("Georgia", get_density_font_size(), "bold"),
+                                        fill="#FFB6C1", tags=tag)
+        for tag in self.shrimp_tags - live_tags:
+            self.canvas.delete(tag)
+        self.shrimp_tags = live_tags
+
+    def render_kraken(self, snapshot):
+        """Render each kraken's current ASCII sprite at its position"""
+        sprites = self.kraken_sprites
+        while len(sprites) < len(snapshot.krakens):
+            sprites.append(SpriteRenderer(self.canvas, f"kraken_{len(sprites)}"))
+        while len(sprites) > len(snapshot.krakens):
+            sprites.pop().clear()
+
+        font_size = self.kraken_font_size
+        color = get_kraken_color()
+        origin_x = self.origin_x
+        min_x = -self.kraken_margin
+        max_x = self.width + self.kraken_margin
+        for sprite, (x, y, name) in zip(sprites, snapshot.krakens):
+            x -= origin_x
+            if min_x < x < max_x:
+                sprite.draw(name, x, y, font_size, color)
+            else:
+                sprite.hide()  # Swimming through another viewport
+
+    def render_counters(self, snapshot):
+        """Update the shrimp and boat counters when their values change"""
+        counter = (snapshot.shrimp_eaten_count, snapshot.counter_indicator)
+        if self.show_shrimp_counter and counter != self.last_counter:
+            self.last_counter = counter
+            self.update_counter_display(*counter)
+
+        boat_counter = (snapshot.show_boat_counter, snapshot.boats_destroyed)
+        if self.show_boat_counter and boat_counter != self.last_boat_counter:
+            self.last_boat_counter = boat_counter
+            self.update_boat_counter_display(*boat_counter)
+
+    def update_counter_display(self, count, indicator):
+        """Update the shrimp eaten counter display at the top left of the window"""
+        # Clear previous counter display
+        self.canvas.delete("shrimp_counter")
+        self.canvas.delete("counter_indicator")
+
+        # Display shrimp counter at top left
+        counter_x = 20
+        counter_y = 15
+
+        # Show the count in shrimp color (#FFB6C1) - smaller Consolas font
+        self.canvas.create_text(counter_x, counter_y,
+                                text=str(count),
+                                font=("Consolas", 18, "bold"),
+                                fill="#FFB6C1",
+                                tags="shrimp_counter",
+                                anchor="nw")
+
+        # Show +1 or -1 indicator if active (to the right of the counter)
+        if indicator:
+            indicator_x = counter_x + 25
+            self.canvas.create_text(indicator_x, counter_y,
+                                    text=indicator,
+                                    font=("Consolas", 14, "bold"),
+                                    fill="#FFB6C1",
+                                    tags="counter_indicator",
+                                    anchor="nw")
+
+    def update_boat_counter_display(self, show, boats_destroyed):
+        """Update the boat destruction counter display at the top right of the window"""
+        # Clear previous boat counter display
+        self.canvas.delete("boat_counter")
+
+        # Only display if at least one boat has been destroyed
+        if show:
+            counter_x = self.width - 20
+            counter_y = 15
+
+            # Show "⛵: count" in white
+            self.canvas.create_text(counter_x, counter_y,
+                                    text=f"⛵: {boats_destroyed}",
+                                    font=("Consolas", 14, "bold"),
+                                    fill="#FFFFFF",
+                                    tags="boat_counter",
+                                    anchor="ne")
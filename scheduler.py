@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Frame Scheduler
+One Tk after() loop that advances the simulation in fixed timesteps measured
+with time.perf_counter and renders, interpolated, at a capped frame rate.
+"""
+
+import os
+import platform
+import threading
+import time
+from designs import SCHEDULER_CONFIG
+
+
+def on_battery():
+    """Best-effort check whether the machine is running on battery power"""
+    system = platform.system()
+    try:
+        if system == "Linux":
+            import glob
+            supplies = glob.glob('/sys/class/power_supply/*')
+            has_battery = False
+            for supply in supplies:
+                with open(os.path.join(supply, 'type')) as f:
+                    supply_type = f.read().strip()
+                if supply_type == 'Battery':
+                    has_battery = True
+                elif supply_type in ('Mains', 'USB'):
+                    with open(os.path.join(supply, 'online')) as f:
+                        if f.read().strip() == '1':
+                            return False
+            return has_battery
+        if system == "Darwin":
+            import subprocess  # Only needed here; slow to import at startup
+            try:
+                output = subprocess.run(['pmset', '-g', 'batt'], capture_output=True,
+                                        text=True, timeout=2).stdout
+            except subprocess.SubprocessError:
+                return False
+            return "'Battery Power'" in output
+        if system == "Windows":
+            import ctypes
+
+            class SYSTEM_POWER_STATUS(ctypes.Structure):
+                _fields_ = [('ACLineStatus', ctypes.c_byte), ('BatteryFlag', ctypes.c_byte),
+                            ('BatteryLifePercent', ctypes.c_byte), ('SystemStatusFlag', ctypes.c_byte),
+                            ('BatteryLifeTime', ctypes.c_ulong), ('BatteryFullLifeTime', ctypes.c_ulong)]
+
+            status = SYSTEM_POWER_STATUS()
+            if ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(status)):
+                return status.ACLineStatus == 0
+    except (OSError, AttributeError, ValueError):
+        pass
+    return False
+
+
+class FixedStepScheduler:
+    """Fixed simulation timestep with an accumulator and interpolated rendering
+
+    Each frame the wall-clock time since the previous frame is added to an
+    accumulator and step(timestep) runs once per whole timestep in it, so
+    simulation speed doesn't depend on how often Tk wakes us up. What is
+    left over becomes alpha (0..1), the fraction of the next step that has
+    elapsed, which render(alpha) uses to interpolate positions.
+
+    Args:
+        root: Tk root used for after() scheduling
+        step: Callable advancing the simulation by one timestep (seconds)
+        render: Callable drawing a frame, given alpha
+        timestep: Simulation timestep in seconds
+        fps: Render rate cap; None picks SCHEDULER_CONFIG's battery/plugged-in rate
+        clock: Time source (seconds)
+        governor: Optional object whose idle(now) says whether to skip
+            rendering; while idle the simulation only wakes up every
+            SCHEDULER_CONFIG['idle_interval'] seconds until wake() is called
+    """
+
+    def __init__(self, root, step, render, timestep, fps=None, clock=time.perf_counter, governor=None):
+        self.root = root
+        self.step = step
+        self.render = render
+        self.timestep = timestep
+        self.fixed_fps = fps
+        self.clock = clock
+        self.governor = governor
+
+        self.fps = fps or SCHEDULER_CONFIG['fps_plugged_in']
+        self.accumulator = 0.0
+        self.last_time = None
+        self.next_frame_time = None
+        self.power_checked_at = None
+        self.power_probe = None  # Thread running on_battery(), if one is in flight
+        self.battery = False  # Last answer from on_battery()
+        self.after_id = None
+        self.steps_run = 0  # Total simulation steps since start
+        self.frames_rendered = 0  # Total frames rendered since start
+        self.idle = False  # Whether the last frame() skipped rendering
+
+    def start(self):
+        """Render the first frame now and keep going from there"""
+        self.last_time = self.clock()
+        self.next_frame_time = self.last_time
+        # Checking the power source can spawn a process; don't let it delay the first frame
+        self.power_checked_at = (self.last_time - SCHEDULER_CONFIG['power_check_interval']
+                                 + SCHEDULER_CONFIG['first_power_check'])
+        self.frame()
+
+    def stop(self):
+        """Cancel the pending frame"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def wake(self):
+        """Leave idle now instead of at the next coarse tick"""
+        if not self.idle or self.after_id is None:
+            return
+        self.root.after_cancel(self.after_id)
+        self.after_id = None
+        self.next_frame_time = self.clock()  # Restart the frame cadence from now
+        self.frame()
+
+    def update_fps(self, now):
+        """Pick the render rate from the power source (re-checked periodically)
+
+        on_battery() can block for seconds (pmset on macOS), so it runs on
+        a daemon thread and the rate follows its last answer meanwhile.
+        """
+        if self.fixed_fps:
+            return
+        interval = SCHEDULER_CONFIG['power_check_interval']
+        probing = self.power_probe is not None and self.power_probe.is_alive()
+        if not probing and (self.power_checked_at is None or now - self.power_checked_at >= interval):
+            self.power_checked_at = now
+            self.power_probe = threading.Thread(target=self.probe_power, name='power-probe', daemon=True)
+            self.power_probe.start()
+        self.fps = (SCHEDULER_CONFIG['fps_on_battery'] if self.battery
+                    else SCHEDULER_CONFIG['fps_plugged_in'])
+
+    def probe_power(self):
+        """Power-probe thread body: remember whether we're on battery"""
+        self.battery = on_battery()
+
+    def frame(self):
+        """Run due simulation steps, render once and schedule the next frame"""
+        now = self.clock()
+        self.update_fps(now)
+
+        # Clamp huge gaps (e.g. after sleep) so we don't spend seconds catching up
+        elapsed = min(now - self.last_time, SCHEDULER_CONFIG['max_catch_up'])
+        self.last_time = now
+        self.accumulator += elapsed
+
+        while self.accumulator >= self.timestep:
+            self.step(self.timestep)
+            self.accumulator -= self.timestep
+            self.steps_run += 1
+
+        # Nothing visible to draw: skip rendering and sleep until the next coarse tick
+        self.idle = self.governor is not None and self.governor.idle(now)
+        if self.idle:
+            self.next_frame_time = now + SCHEDULER_CONFIG['idle_interval']
+            self.after_id = self.root.after(int(SCHEDULER_CONFIG['idle_interval'] * 1000), self.frame)
+            return
+
+        self.render(self.accumulator / self.timestep)
+        self.frames_rendered += 1
+
+        # Frame deadlines advance in fixed increments so the rate doesn't drift;
+        # if we fell behind, restart the cadence from now instead of bursting
+        frame_interval = 1.0 / self.fps
+        self.next_frame_time += frame_interval
+        now = self.clock()
+        if self.next_frame_time < now:
+            self.next_frame_time = now + frame_interval
+        delay_ms = max(1, int((self.next_frame_time - now) * 1000))
+        self.after_id = self.root.after(delay_ms, self.frame)
@@ -0,0 +1,749 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Simulation Core
+Pure-Python world state (kraken, shrimp, boat, bubbles) with no Tkinter dependency.
+The Tk front end in pet.py only renders snapshots of this state.
+"""
+
+import math
+import random
+from collections import namedtuple
+from designs import (ASCII_ANIMATIONS, FOOD_CONFIG, DEBUG_CONFIG, KRAKEN_CONFIG, WAVE_CONFIG, SURFACE_FONT,
+                     is_in_water, get_surface_height, get_density_line_height, get_boat_speed, get_boat_width)
+from fontmetrics import font_metrics
+from particles import BubbleSystem
+from waves import SurfaceRipples
+from spatial import SpatialHash
+from nullprofiler import NULL_PROFILER
+
+# Seconds per behavior tick (the original update_behavior ran every 100 ms)
+TICK = 0.1
+
+# Immutable view of the world handed to renderers
+Snapshot = namedtuple('Snapshot', [
+    'width', 'height', 'water_level',
+    'krakens',                  # Tuple of (x, y, sprite), one per kraken
+    'shrimp',                   # Tuple of (tag, x, y)
+    'bubbles',                  # BubbleSystem (read-only for renderers)
+    'boat_active', 'boat_char_pos', 'boat_direction',
+    'wave_frame',               # Wave animation frame (advances every 10 ticks)
+    'wave_phase',               # Procedural wave phase bucket (advances every tick)
+    'wake',                     # (first col, top, bottom) wake/splash glyphs over the waves, or None
+    'char_width',               # Pixels per surface character (boat and wake columns)
+    'alpha',                    # Fraction of the next tick elapsed (for interpolation)
+    'shrimp_eaten_count', 'counter_indicator',
+    'boats_destroyed', 'show_boat_counter',
+])
+
+
+class Kraken:
+    """State of one kraken (position is the center of the sprite's top line)
+
+    Each kraken runs its own state machine (idle, swimming, eating, attacking);
+    shrimp, the boat and the counters belong to the World and are shared.
+    """
+
+    def __init__(self, x, y, animation_frame=1):
+        self.x = x
+        self.y = y
+        self.prev_x = x  # Position before the latest tick (for interpolation)
+        self.prev_y = y
+        self.state = "idle"
+        self.sprite = 'idle1'
+        self.animation_frame = animation_frame  # Frame 0 (idle1) is shown on spawn
+        self.animation_elapsed = 0.0  # Seconds since the sprite last changed
+        self.animation_delay = 0.5  # Seconds until the next sprite change
+
+        # Shrimp hunting
+        self.current_shrimp_target = None
+        self.eating_shrimp = False
+        self.eating_frames = 0  # Counter for eating animation duration
+        self.stuck_frames = 0  # Counter for how long kraken has been stuck at boundary
+        self.last_x = 0  # Track last position to detect if stuck
+        self.last_y = 0
+
+        # Boat attack
+        self.attacking_boat = False  # Whether kraken is currently attacking a boat
+        self.attack_phase = 'none'  # Attack phases: 'none', 'swimming', 'attacking', 'returning'
+        self.attack_frames = 0  # Counter for attack animation duration
+        self.attack_will_destroy = False
+        self.pre_attack_state = None  # Store what kraken was doing before attack
+        self.pre_attack_target = None  # Store shrimp target before attack
+        self.target_x = x
+        self.target_y = y
+
+
+class Boat:
+    """State of the boat sailing across the surface"""
+
+    def __init__(self):
+        self.active = False  # Whether a boat is currently on screen
+        self.char_pos = -get_boat_width()  # Current boat character position (starts off-screen left)
+        self.prev_char_pos = self.char_pos  # Position before the latest tick (for interpolation)
+        self.direction = 'lr'  # Direction: 'lr' = left-to-right, 'rl' = right-to-left
+        self.attacked = False  # Whether kraken has triggered attack on current boat
+        self.pending_destruction = False  # Flag to destroy boat at next sprite update
+
+
+class World:
+    """Headless kraken simulation advanced with step(dt)
+
+    Args:
+        width: Width of the aquarium in pixels
+        height: Height of the aquarium in pixels
+        rng: random.Random instance used for all randomness (default: new unseeded Random)
+        verbose: Print behaviour messages (disable for fast-forwarding)
+        kraken_count: Number of krakens (default: KRAKEN_CONFIG['count'])
+        char_width: Pixels per surface character (default: measured SURFACE_FONT,
+            or 8 without Tk; see fontmetrics.py)
+        surface_height: Height of the 2-line surface in pixels (default: two measured
+            SURFACE_FONT lines, or 20 without Tk)
+    """
+
+    def __init__(self, width, height, rng=None, verbose=True, kraken_count=None, char_width=None,
+                 surface_height=None):
+        self.width = width
+        self.height = height
+        self.rng = rng if rng is not None else random.Random()
+        self.verbose = verbose
+
+        # Water level matches SurfaceRenderer (top 1/5 is surface)
+        self.water_level = height // 5
+        self.ocean_floor = height - 50
+        self.char_width = char_width or font_metrics(SURFACE_FONT).char_width  # Surface character width in pixels
+        self.surface_height = surface_height or get_surface_height()  # Water starts below the 2 wave lines
+
+        # Kraken dimensions based on density configuration
+        self.kraken_sprite_lines = 11  # Kraken sprite is 11 lines tall
+        self.krakens = []  # Created below, once the sprite size is known
+        self.apply_density()
+
+        # First kraken's starting position (well below water surface)
+        start_x = width // 2
+        start_y = self.water_level + 100
+        if not is_in_water(start_x, start_y, self.water_level, height, self.surface_height):
+            start_y = self.water_level + 50
+        self.krakens = [Kraken(start_x, start_y)]
+
+        # The rest of the school starts at random spots, out of step with each other
+        if kraken_count is None:
+            kraken_count = KRAKEN_CONFIG['count']
+        min_x, max_x, min_y, max_y = self.kraken_bounds()
+        for _ in range(kraken_count - 1):
+            self.krakens.append(Kraken(self.rng.uniform(min_x, max_x),
+                                       self.rng.uniform(min_y, max(min_y, max_y)),
+                                       animation_frame=self.rng.randrange(6)))
+
+        # Counters
+        self.shrimp_eaten_count = 0  # How many shrimp the kraken has eaten (max 100)
+        self.decay_timer = 0  # Frames since last decay (decays every 11 seconds = 110 frames at 10fps)
+        self.counter_change_indicator = None  # "+1" or "-1" visual indicator
+        self.counter_change_frames = 0  # How long to show the indicator
+        self.boats_destroyed = 0  # How many boats the kraken has destroyed
+        self.show_boat_counter = False  # Only show after first boat is destroyed
+
+        # Bubbles, shrimp and boat
+        self.bubbles = BubbleSystem(width, self.water_level, height, rng=self.rng,
+                                    surface_height=self.surface_height)
+        self.bubble_spawn_chance = 0.05  # Expected bubbles spawned per tick
+        self.shrimp = {}  # tag -> (x, y, tag), in drop order
+        self.food_index = SpatialHash(cell_size=FOOD_CONFIG['min_distance'])
+        self.max_shrimp = FOOD_CONFIG['max_shrimp']
+        self.shrimp_counter = 0  # For unique shrimp tags
+        self.shrimp_snapshot = ()  # Cached snapshot tuple, rebuilt when shrimp change
+        self.boat = Boat()
+        self.ripples = SurfaceRipples(int(width // self.char_width) + 2)  # Same columns as the wave lines
+        self.surface_wake = None  # Overlay for the current tick (None while the water is calm)
+
+        self.wave_animation_frame = 0  # Behavior ticks since start (waves advance every 10)
+        self.wave_update_ticks = 1  # Procedural waves move every this many ticks (quality knob)
+        self.animation_rate = 1.0  # Sprite animation speed multiplier (quality knob)
+        self.time_accumulator = 0.0
+        self.profiler = NULL_PROFILER  # Set a FrameProfiler to time tick phases
+
+    @property
+    def kraken(self):
+        """The first kraken (the only one unless KRAKEN_CONFIG['count'] > 1)"""
+        return self.krakens[0]
+
+    def apply_density(self):
+        """Size the krakens from ASCII_DENSITY_CONFIG (again, after it changed)"""
+        self.kraken_line_height = get_density_line_height()
+        self.kraken_total_height = self.kraken_sprite_lines * self.kraken_line_height
+        self.kraken_radius = self.kraken_total_height // 2
+
+        # Mouth offset (where kraken eats) - mouth is on line 6 (0-indexed line 5)
+        self.mouth_offset_x = 0  # Centered horizontally
+        self.mouth_offset_y = 5 * self.kraken_line_height  # 5 lines down from top
+
+        # Bigger sprites have tighter bounds: pull krakens back inside
+        min_x, max_x, min_y, max_y = self.kraken_bounds()
+        for kraken in self.krakens:
+            kraken.x = kraken.prev_x = min(max(kraken.x, min_x), max_x)
+            kraken.y = kraken.prev_y = min(max(kraken.y, min_y), max(min_y, max_y))
+
+    def log(self, message):
+        """Print a behaviour message unless running quietly"""
+        if self.verbose:
+            print(message)
+
+    # ===== TIME =====
+
+    def step(self, dt):
+        """Advance the simulation by dt seconds (runs whole TICKs, keeps the remainder)"""
+        self.time_accumulator += dt
+        while self.time_accumulator >= TICK - 1e-9:
+            self.time_accumulator -= TICK
+            self.tick()
+
+    def tick(self):
+        """Advance the simulation by exactly one behavior tick"""
+        for kraken in self.krakens:
+            kraken.prev_x, kraken.prev_y = kraken.x, kraken.y
+        self.boat.prev_char_pos = self.boat.char_pos
+
+        # Wave frame boundary: a boat marked for destruction disappears now
+        if self.wave_animation_frame % 10 == 0:
+            if self.boat.pending_destruction and self.boat.active:
+                self.boat.active = False
+                # pending_destruction flag will be cleared in attack logic
+        self.wave_animation_frame += 1
+
+        # Bubble physics (spawn, rise, remove at surface)
+        profiler = self.profiler
+        with profiler.phase('bubbles'):
+            self.bubbles.step(self.bubble_spawn_chance)
+
+        # Shrimp eaten counter decay (every 11 seconds = 110 frames at 10fps)
+        self.decay_timer += 1
+        if self.decay_timer >= 110:
+            self.decay_timer = 0
+            if self.shrimp_eaten_count > 0:
+                self.shrimp_eaten_count -= 1
+                self.counter_change_indicator = "-1"
+                self.counter_change_frames = 5  # Show indicator for 0.5 seconds (5 frames at 10fps)
+
+        # Counter change indicator
+        if self.counter_change_frames > 0:
+            self.counter_change_frames -= 1
+            if self.counter_change_frames == 0:
+                self.counter_change_indicator = None
+
+        with profiler.phase('boat'):
+            self.update_boat()
+        with profiler.phase('position'):
+            for kraken in self.krakens:
+                self.update_position(kraken)
+        for kraken in self.krakens:
+            self.update_animation(kraken, TICK)
+        with profiler.phase('surface'):
+            self.update_surface()
+
+    def snapshot(self, alpha=1.0):
+        """Capture the state renderers need for one frame
+
+        Args:
+            alpha: Fraction of the next tick that has elapsed; positions are
+                interpolated between the last two ticks (1.0 = latest tick)
+        """
+        boat = self.boat
+        alpha = min(max(alpha, 0.0), 1.0)
+        krakens = tuple((kraken.prev_x + (kraken.x - kraken.prev_x) * alpha,
+                         kraken.prev_y + (kraken.y - kraken.prev_y) * alpha,
+                         kraken.sprite) for kraken in self.krakens)
+        boat_char_pos = boat.prev_char_pos + (boat.char_pos - boat.prev_char_pos) * alpha
+        return Snapshot(
+            width=self.width, height=self.height, water_level=self.water_level,
+            krakens=krakens,
+            shrimp=self.shrimp_snapshot,
+            bubbles=self.bubbles,
+            boat_active=boat.active, boat_char_pos=int(round(boat_char_pos)), boat_direction=boat.direction,
+            wave_frame=(self.wave_animation_frame - 1) // 10 if self.wave_animation_frame else 0,
+            wave_phase=self.wave_animation_frame - self.wave_animation_frame % self.wave_update_ticks,
+            wake=self.surface_wake,
+            char_width=self.char_width,
+            alpha=alpha,
+            shrimp_eaten_count=self.shrimp_eaten_count,
+            counter_indicator=self.counter_change_indicator,
+            boats_destroyed=self.boats_destroyed,
+            show_boat_counter=self.show_boat_counter,
+        )
+
+    # ===== INPUT =====
+
+    def drop_shrimp(self, x, y):
+        """Drop a shrimp at the specified underwater position (returns True if accepted)"""
+        # First check: maximum number of shrimp in the water
+        max_shrimp = self.max_shrimp
+        if len(self.shrimp) >= max_shrimp:
+            self.log(f"⚠️ Click rejected: shrimp queue is full ({len(self.shrimp)}/{max_shrimp}). Wait for kraken to eat some!")
+            return False
+
+        # Strict validation: shrimp must be below the 2-line surface
+        underwater_start = self.water_level + self.surface_height
+
+        # Second check: y must be in valid underwater range
+        if y < underwater_start:
+            self.log(f"⚠️ Click rejected: y={y} is above underwater start {underwater_start} (water_level={self.water_level})")
+            return False
+
+        if y > self.ocean_floor:
+            self.log(f"⚠️ Click rejected: y={y} is below ocean floor {self.ocean_floor}")
+            return False
+
+        # Third check: use is_in_water validation
+        if not is_in_water(x, y, self.water_level, self.height, self.surface_height):
+            self.log(f"⚠️ Click rejected by is_in_water: ({x}, {y})")
+            return False
+
+        # Fourth check: ensure new shrimp is at least min_distance pixels from all existing shrimp
+        min_distance = FOOD_CONFIG['min_distance']
+        too_close = self.food_index.any_within(x, y, min_distance)
+        if too_close:
+            self.log(f"⚠️ Click rejected: too close to existing shrimp (distance: {too_close[1]:.1f} < {min_distance})")
+            return False
+
+        # All checks passed - add shrimp
+        self.shrimp_counter += 1
+        shrimp_tag = f"shrimp_{self.shrimp_counter}"
+        self.shrimp[shrimp_tag] = (x, y, shrimp_tag)
+        self.food_index.insert(shrimp_tag, x, y)
+        self.shrimp_changed()
+        self.log(f"🦐 Shrimp dropped at ({x}, {y}). Queue size: {len(self.shrimp)}")
+        return True
+
+    def spawn_boat(self, direction='lr'):
+        """Spawn a boat that moves across the water surface (ignored while a boat is active)
+
+        Args:
+            direction: 'lr' for left-to-right, 'rl' for right-to-left
+        """
+        boat = self.boat
+        if not boat.active:
+            boat.active = True
+            boat.direction = direction
+            boat.attacked = False  # Reset attack flag for new boat
+
+            # Set starting position based on direction
+            screen_width_chars = int(self.width // self.char_width)
+            if direction == 'rl':
+                # Start off-screen to the right for right-to-left
+                boat.char_pos = screen_width_chars + 10
+            else:
+                # Start off-screen to the left for left-to-right
+                boat.char_pos = -get_boat_width()
+            boat.prev_char_pos = boat.char_pos
+            self.log("⛵")
+
+    # ===== SHRIMP =====
+
+    def eat_shrimp(self, kraken):
+        """Kraken eats its current target shrimp"""
+        if kraken.current_shrimp_target:
+            tag = kraken.current_shrimp_target[2]
+            del self.shrimp[tag]
+            self.food_index.remove(tag)
+            self.shrimp_changed()
+            kraken.current_shrimp_target = None
+            kraken.eating_shrimp = False
+            kraken.eating_frames = 0  # Reset eating timer
+            # Anyone else chasing this shrimp notices it's gone on their next update
+
+            # Increment shrimp eaten counter (max 100)
+            if self.shrimp_eaten_count < 100:
+                self.shrimp_eaten_count += 1
+                self.counter_change_indicator = "+1"
+                self.counter_change_frames = 5  # Show indicator for 0.5 seconds (5 frames at 10fps)
+
+            self.log(f"🐙 Om nom nom! Shrimp eaten. Remaining: {len(self.shrimp)}")
+
+    def get_next_shrimp_target(self, kraken):
+        """Target the shrimp closest to the kraken"""
+        if self.shrimp and not kraken.current_shrimp_target:
+            closest_tag, _ = self.food_index.nearest(kraken.x, kraken.y)
+            kraken.current_shrimp_target = self.shrimp[closest_tag]
+            kraken.eating_shrimp = True
+            x, y, tag = kraken.current_shrimp_target
+            self.log(f"🐙 Kraken targeting shrimp at ({x}, {y})")
+
+    def shrimp_changed(self):
+        """Rebuild the cached shrimp tuple handed to renderers"""
+        self.shrimp_snapshot = tuple((tag, x, y) for x, y, tag in self.shrimp.values())
+
+    # ===== BOAT =====
+
+    def update_boat(self):
+        """Update boat character position based on direction"""
+        boat = self.boat
+        if boat.active:
+            # Check if boat has reached 1/4 of the way across screen
+            screen_width_chars = int(self.width // self.char_width)
+            one_quarter_position = screen_width_chars / 4
+
+            if not boat.attacked:
+                # Check if boat crossed 1/4 threshold
+                if boat.direction == 'rl':
+                    # Right-to-left: check if passed 3/4 mark (coming from right)
+                    three_quarters_position = 3 * screen_width_chars / 4
+                    if boat.char_pos <= three_quarters_position:
+                        self.trigger_boat_attack()
+                else:
+                    # Left-to-right: check if passed 1/4 mark (coming from left)
+                    if boat.char_pos >= one_quarter_position:
+                        self.trigger_boat_attack()
+
+            # Move at the configured speed (characters per second)
+            distance = get_boat_speed() * TICK
+            if boat.direction == 'rl':
+                boat.char_pos -= distance
+            else:
+                boat.char_pos += distance
+
+            # Check if boat has sailed completely off screen (either direction)
+            if boat.direction == 'rl':
+                if boat.char_pos < -get_boat_width() - 10:
+                    boat.active = False
+                    self.log("⛵...")
+            else:
+                if boat.char_pos > screen_width_chars + 10:
+                    boat.active = False
+                    self.log("⛵...")
+
+    def update_surface(self):
+        """Disturb the water where the boat sails and krakens thrash, then let it settle"""
+        ripples = self.ripples
+        boat = self.boat
+        if boat.active:
+            # Bow pushes the water up, the stern leaves a trough behind
+            strength = WAVE_CONFIG['wake_strength']
+            front = boat.char_pos + get_boat_width()
+            bow, stern = (front, boat.char_pos) if boat.direction == 'lr' else (boat.char_pos, front)
+            ripples.impulse(bow, strength)
+            ripples.impulse(stern, -strength)
+        for kraken in self.krakens:
+            if kraken.attack_phase == 'attacking' and kraken.attack_frames % 4 == 1:
+                ripples.impulse(kraken.x // self.char_width, WAVE_CONFIG['splash_strength'])
+        ripples.step()  # Returns at once while the water is calm
+        self.surface_wake = ripples.overlay()
+
+    def trigger_boat_attack(self):
+        """Trigger an attack on the boat - the kraken closest to it abandons everything and attacks!"""
+        boat_pixel_x = self.boat.char_pos * self.char_width
+        kraken = min(self.krakens, key=lambda k: (k.x - boat_pixel_x)**2 + (k.y - self.water_level)**2)
+        self.boat.attacked = True
+        kraken.attacking_boat = True
+        kraken.attack_phase = 'swimming'  # Start with swimming phase (upside down)
+        kraken.attack_frames = 0
+
+        # Determine if this attack will destroy the boat based on shrimp counter
+        success_rate = (self.shrimp_eaten_count / 100) * 0.5
+        kraken.attack_will_destroy = self.rng.random() < success_rate
+
+        # Save current state to resume later
+        kraken.pre_attack_state = kraken.state
+        kraken.pre_attack_target = kraken.current_shrimp_target
+
+        # Position slightly ahead of the boat (in pixels) based on direction
+        if self.boat.direction == 'rl':
+            kraken.target_x = boat_pixel_x + 180
+        else:
+            kraken.target_x = boat_pixel_x + 300
+
+        kraken.target_y = self.water_level - 20  # Just below the surface
+
+        # DON'T clear shrimp targets - save them for later
+        # But stop eating current shrimp and reset eating counter
+        # This allows kraken to resume eating the same shrimp from scratch
+        kraken.eating_shrimp = False
+        kraken.eating_frames = 0
+
+        self.log("🐙 ATTACK!")
+
+    def is_quiet(self, bubble_distance=None):
+        """Whether nothing worth watching is going on
+
+        No shrimp to hunt, no boat, no attack or splash still settling and,
+        unless bubble_distance is None, no bubble within bubble_distance
+        pixels of a kraken's sprite. Idle krakens stay put, so a quiet world
+        looks the same from one tick to the next apart from the bubbles.
+        """
+        if self.shrimp or self.boat.active or self.ripples.active:
+            return False
+        if any(kraken.attacking_boat or kraken.state != "idle" for kraken in self.krakens):
+            return False
+        if bubble_distance is None:
+            return True
+        bubbles = self.bubbles
+        reach = bubble_distance + self.kraken_radius
+        for slot in bubbles.live_slots():
+            bubble_x = bubbles.x[slot]
+            bubble_y = bubbles.y[slot]
+            for kraken in self.krakens:
+                if abs(bubble_x - kraken.x) < reach and abs(bubble_y - kraken.y - self.kraken_radius) < reach:
+                    return False
+        return True
+
+    # ===== KRAKEN =====
+
+    def kraken_bounds(self):
+        """(min_x, max_x, min_y, max_y) the kraken's sprite anchor must stay within"""
+        margin = self.kraken_radius + 10
+        # TOP boundary: kraken's head (top) can reach the water_level
+        # BOTTOM boundary: kraken's legs (y + kraken_total_height) stay above ocean floor
+        return (margin, self.width - margin,
+                self.water_level, self.ocean_floor - self.kraken_total_height)
+
+    def move_kraken_to(self, kraken, x, y):
+        """Move kraken to specific coordinates (only in water, with strict boundaries)"""
+        min_x, max_x, min_y, max_y = self.kraken_bounds()
+        x = max(min_x, min(x, max_x))
+
+        # Debug: show what boundaries are being calculated (noisy, off by default)
+        if DEBUG_CONFIG['log_movement']:
+            if y < min_y:
+                self.log(f"🐙 Clamping y from {y} to min_y {min_y} (head at water surface)")
+            if y > max_y:
+                self.log(f"🐙 Clamping y from {y} to max_y {max_y} (legs at ocean floor)")
+
+        kraken.x = x
+        kraken.y = max(min_y, min(y, max_y))
+        return True
+
+    def update_position(self, kraken):
+        """Smoothly move kraken towards target (shrimp or boat)"""
+        current_kraken_x, current_kraken_y = kraken.x, kraken.y
+
+        # If attacking boat, handle multi-phase attack sequence
+        if kraken.attacking_boat:
+            self.update_attack(kraken, current_kraken_x, current_kraken_y)
+            return
+
+        # Another kraken got to our shrimp first: look for the next one
+        if kraken.current_shrimp_target and kraken.current_shrimp_target[2] not in self.shrimp:
+            kraken.current_shrimp_target = None
+            kraken.eating_shrimp = False
+            kraken.eating_frames = 0
+
+        # Normal shrimp hunting behavior
+        # Check if there's a shrimp to eat
+        if not kraken.current_shrimp_target and len(self.shrimp) > 0:
+            self.get_next_shrimp_target(kraken)
+
+        # If targeting shrimp, move towards it
+        if kraken.current_shrimp_target:
+            shrimp_x, shrimp_y, shrimp_tag = kraken.current_shrimp_target
+
+            # Calculate where the sprite anchor should be so the mouth reaches the shrimp
+            target_sprite_x = shrimp_x - self.mouth_offset_x
+            target_sprite_y = shrimp_y - self.mouth_offset_y
+
+            # Clamp target to safe bounds (in water and within the container)
+            min_x, max_x, min_y, max_y = self.kraken_bounds()
+            target_sprite_x = max(min_x, min(target_sprite_x, max_x))
+            target_sprite_y = max(min_y, min(target_sprite_y, max_y))
+
+            kraken.target_x = target_sprite_x
+            kraken.target_y = target_sprite_y
+
+            dx = kraken.target_x - current_kraken_x
+            dy = kraken.target_y - current_kraken_y
+            distance = math.sqrt(dx**2 + dy**2)
+
+            # Distance from where the mouth is right now to the shrimp
+            current_mouth_x = current_kraken_x + self.mouth_offset_x
+            current_mouth_y = current_kraken_y + self.mouth_offset_y
+            mouth_distance = math.sqrt((shrimp_x - current_mouth_x)**2 + (shrimp_y - current_mouth_y)**2)
+
+            # Check if kraken is stuck at a boundary (being actively clamped)
+            # Detect by checking if current position is AT the boundary and target is beyond it
+            stuck_at_top = (abs(current_kraken_y - min_y) < 1 and target_sprite_y < current_kraken_y)
+            stuck_at_bottom = (abs(current_kraken_y - max_y) < 1 and target_sprite_y > current_kraken_y)
+            stuck_at_left = (abs(current_kraken_x - min_x) < 1 and target_sprite_x < current_kraken_x)
+            stuck_at_right = (abs(current_kraken_x - max_x) < 1 and target_sprite_x > current_kraken_x)
+            stuck_at_boundary = stuck_at_top or stuck_at_bottom or stuck_at_left or stuck_at_right
+
+            # Check if kraken hasn't moved (is genuinely stuck)
+            position_changed = (abs(current_kraken_x - kraken.last_x) > 0.5 or
+                                abs(current_kraken_y - kraken.last_y) > 0.5)
+
+            if stuck_at_boundary and not position_changed:
+                kraken.stuck_frames += 1
+            else:
+                kraken.stuck_frames = 0
+
+            kraken.last_x = current_kraken_x
+            kraken.last_y = current_kraken_y
+
+            # Only consider truly stuck if we've been stuck for at least 5 frames
+            # AND we're within reasonable mouth distance (not too far from shrimp)
+            truly_stuck_at_boundary = (kraken.stuck_frames >= 5 and stuck_at_boundary and mouth_distance < 50)
+
+            if distance > 2 and not truly_stuck_at_boundary:
+                # Still moving to shrimp - reset eating timer since we're not stationary
+                kraken.state = "swimming"
+                kraken.eating_shrimp = False
+                kraken.eating_frames = 0
+
+                # Move step by step (move_kraken_to keeps it within water bounds)
+                step_size = min(8.0, distance / 3)
+                new_x = current_kraken_x + (dx / distance) * step_size
+                new_y = current_kraken_y + (dy / distance) * step_size
+                self.move_kraken_to(kraken, new_x, new_y)
+            else:
+                # Stopped moving OR at boundary limit - now can start eating animation
+                kraken.state = "eating"
+                kraken.eating_shrimp = True
+                kraken.eating_frames += 1
+                # Eat shrimp after 15 frames
+                if kraken.eating_frames >= 15:
+                    self.eat_shrimp(kraken)
+        else:
+            # No target, return to idle
+            kraken.state = "idle"
+
+    def update_attack(self, kraken, current_kraken_x, current_kraken_y):
+        """Advance the multi-phase boat attack (swimming, attacking, returning)"""
+        boat = self.boat
+        kraken.attack_frames += 1
+
+        # PHASE 1: Swimming upside-down to intercept (0-20 frames, 2 seconds)
+        if kraken.attack_phase == 'swimming':
+            # Update target to track boat movement (stay on the side of boat)
+            boat_pixel_x = boat.char_pos * self.char_width
+            if boat.direction == 'rl':
+                kraken.target_x = boat_pixel_x + 20
+            else:
+                kraken.target_x = boat_pixel_x + 30
+
+            dx = kraken.target_x - current_kraken_x
+            dy = kraken.target_y - current_kraken_y
+
+            # Fast movement during attack
+            distance = math.sqrt(dx**2 + dy**2)
+            if distance > 5:
+                step_size = min(8.0, distance / 2)
+                new_x = current_kraken_x + (dx / distance) * step_size
+                new_y = current_kraken_y + (dy / distance) * step_size
+                self.move_kraken_to(kraken, new_x, new_y)
+
+            # Once reached position, start attacking
+            if distance < 30:
+                kraken.attack_phase = 'attacking'
+                kraken.attack_frames = 0  # Reset for attack phase timing
+
+        # PHASE 2: Attacking the boat
+        elif kraken.attack_phase == 'attacking':
+            # Track and move with the boat during attack
+            boat_pixel_x = boat.char_pos * self.char_width
+            if boat.direction == 'rl':
+                kraken.target_x = boat_pixel_x + 20
+            else:
+                kraken.target_x = boat_pixel_x + 30
+
+            dx = kraken.target_x - current_kraken_x
+            distance_x = abs(dx)
+            if distance_x > 5:
+                step_size = min(4.0, distance_x / 2)
+                new_x = current_kraken_x + (dx / distance_x) * step_size
+                self.move_kraken_to(kraken, new_x, current_kraken_y)
+
+            # Attack duration: 30 frames (3 seconds) to determine outcome
+            attack_should_end = False
+
+            if kraken.attack_frames == 30:
+                if kraken.attack_will_destroy:
+                    # Successful attack: boat disappears at the next wave frame
+                    boat.pending_destruction = True
+                    self.log("💥 Boat destroyed!")
+                else:
+                    # Unsuccessful attack: boat escapes, end immediately
+                    self.log("⛵ Boat escaped!")
+                    attack_should_end = True
+
+            # Check if boat has been destroyed (removed at wave frame boundary)
+            if boat.pending_destruction and not boat.active:
+                attack_should_end = True
+                # The boat goes down with a big splash
+                self.ripples.impulse(boat.char_pos + get_boat_width() // 2, 2 * WAVE_CONFIG['splash_strength'])
+                boat.pending_destruction = False
+                self.boats_destroyed += 1
+                self.show_boat_counter = True
+
+            if attack_should_end:
+                # Return to a central hunting position and find closest shrimp from there
+                kraken.attack_phase = 'returning'
+                kraken.attack_frames = 0
+                kraken.target_x = self.width // 2
+                kraken.target_y = self.water_level + 150
+
+        # PHASE 3: Returning and flipping right-side up (swim back)
+        elif kraken.attack_phase == 'returning':
+            dx = kraken.target_x - current_kraken_x
+            dy = kraken.target_y - current_kraken_y
+
+            # Normal movement speed
+            distance = math.sqrt(dx**2 + dy**2)
+            if distance > 5:
+                step_size = min(6.0, distance / 3)
+                new_x = current_kraken_x + (dx / distance) * step_size
+                new_y = current_kraken_y + (dy / distance) * step_size
+                self.move_kraken_to(kraken, new_x, new_y)
+
+            # Check if we're stuck at a boundary trying to reach an unreachable target
+            min_x, max_x, min_y, max_y = self.kraken_bounds()
+            stuck_at_boundary_returning = (
+                (abs(current_kraken_y - min_y) < 1 and kraken.target_y < current_kraken_y) or
+                (abs(current_kraken_y - max_y) < 1 and kraken.target_y > current_kraken_y) or
+                (abs(current_kraken_x - min_x) < 1 and kraken.target_x < current_kraken_x) or
+                (abs(current_kraken_x - max_x) < 1 and kraken.target_x > current_kraken_x)
+            )
+
+            # Once back in position OR stuck at boundary, finish attack and flip right-side up
+            if distance < 30 or stuck_at_boundary_returning:
+                kraken.attacking_boat = False
+                kraken.attack_phase = 'none'
+                kraken.attack_frames = 0
+
+                # Resume hunting - clear current target so closest shrimp will be selected
+                kraken.current_shrimp_target = None
+                kraken.eating_shrimp = False
+
+                if len(self.shrimp) > 0:
+                    self.log("🐙 Back to hunting...")
+                else:
+                    self.log("🐙 Back to idle...")
+
+                kraken.pre_attack_state = None
+                kraken.pre_attack_target = None
+
+    def update_animation(self, kraken, dt):
+        """Advance the kraken sprite animation by dt seconds"""
+        kraken.animation_elapsed += dt * self.animation_rate
+        if kraken.animation_elapsed < kraken.animation_delay - 1e-9:
+            return
+        kraken.animation_elapsed = 0.0
+
+        # Determine state based on what kraken is doing
+        if kraken.attacking_boat:
+            if kraken.attack_phase == 'swimming':
+                kraken.state = "swimming_flip"  # Swimming upside-down to intercept boat
+            elif kraken.attack_phase == 'attacking':
+                kraken.state = "attacking"  # Attacking the boat (upside-down)
+            else:
+                kraken.state = "swimming"  # Flipped back right-side up, swimming back
+        elif kraken.eating_shrimp:
+            kraken.state = "eating"
+        elif kraken.current_shrimp_target or len(self.shrimp) > 0:
+            kraken.state = "swimming"
+        else:
+            kraken.state = "idle"
+
+        current_animation = ASCII_ANIMATIONS.get(kraken.state, ASCII_ANIMATIONS['idle'])
+        kraken.sprite = current_animation[kraken.animation_frame % len(current_animation)]
+        kraken.animation_frame += 1
+
+        # Faster animation for eating and attacking
+        if kraken.state == "eating" or kraken.state == "attacking":
+            kraken.animation_delay = 0.2
+        else:
+            kraken.animation_delay = 0.5
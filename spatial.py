@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Spatial Hash
+Uniform-grid index of food items for nearest-neighbour and within-radius
+queries without scanning every item.
+"""
+
+import math
+
+
+class SpatialHash:
+    """Points bucketed into square grid cells of cell_size pixels
+
+    insert/remove are O(1); within-radius and nearest queries only visit
+    the cells that can contain an answer.
+    """
+
+    def __init__(self, cell_size=80):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> {key: (x, y)}
+        self.points = {}  # key -> (x, y, cell)
+        self.bounds = None  # (min_cx, min_cy, max_cx, max_cy) of every cell ever used
+
+    def __len__(self):
+        return len(self.points)
+
+    def __contains__(self, key):
+        return key in self.points
+
+    def _cell(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, key, x, y):
+        """Add (or move) a point"""
+        if key in self.points:
+            self.remove(key)
+        cell = self._cell(x, y)
+        self.cells.setdefault(cell, {})[key] = (x, y)
+        self.points[key] = (x, y, cell)
+        if self.bounds is None:
+            self.bounds = (cell[0], cell[1], cell[0], cell[1])
+        else:
+            min_cx, min_cy, max_cx, max_cy = self.bounds
+            self.bounds = (min(min_cx, cell[0]), min(min_cy, cell[1]),
+                           max(max_cx, cell[0]), max(max_cy, cell[1]))
+
+    def remove(self, key):
+        """Remove a point (no-op if it isn't indexed)"""
+        entry = self.points.pop(key, None)
+        if entry is None:
+            return
+        bucket = self.cells[entry[2]]
+        del bucket[key]
+        if not bucket:
+            del self.cells[entry[2]]
+
+    def within(self, x, y, radius):
+        """Keys of all points closer than radius to (x, y)"""
+        return [key for key, _ in self._within(x, y, radius)]
+
+    def any_within(self, x, y, radius):
+        """(key, distance) of some point closer than radius to (x, y), or None"""
+        for key, distance in self._within(x, y, radius):
+            return key, distance
+        return None
+
+    def _within(self, x, y, radius):
+        min_cx, min_cy = self._cell(x - radius, y - radius)
+        max_cx, max_cy = self._cell(x + radius, y + radius)
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for key, (px, py) in bucket.items():
+                    distance = math.sqrt((px - x)**2 + (py - y)**2)
+                    if distance < radius:
+                        yield key, distance
+
+    def nearest(self, x, y):
+        """(key, distance) of the point closest to (x, y), or None if empty
+
+        Searches rings of cells outwards from (x, y) and stops once no
+        unvisited cell can hold anything closer than the best match.
+        """
+        if not self.points:
+            return None
+        cx, cy = self._cell(x, y)
+        cells = self.cells
+        best = None
+        best_distance = float('inf')
+        last_ring = self._max_ring(cx, cy)
+        ring = 0
+        while ring <= last_ring:
+            for cell in self._ring(cx, cy, ring):
+                bucket = cells.get(cell)
+                if not bucket:
+                    continue
+                for key, (px, py) in bucket.items():
+                    distance = math.sqrt((px - x)**2 + (py - y)**2)
+                    if distance < best_distance:
+                        best = key
+                        best_distance = distance
+            # Every point outside this ring is at least ring * cell_size away
+            if best is not None and best_distance <= ring * self.cell_size:
+                return best, best_distance
+            ring += 1
+        return best, best_distance
+
+    def _ring(self, cx, cy, ring):
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-ring, ring + 1):
+            yield (cx + dx, cy - ring)
+            yield (cx + dx, cy + ring)
+        for dy in range(-ring + 1, ring):
+            yield (cx - ring, cy + dy)
+            yield (cx + ring, cy + dy)
+
+    def _max_ring(self, cx, cy):
+        """Ring index beyond which no occupied cell can exist"""
+        min_cx, min_cy, max_cx, max_cy = self.bounds
+        return max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy, 0)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Sprite Cache
+Pre-renders ASCII_PET_SPRITES frames per (sprite name, font size, color) and
+draws them with as few canvas calls as possible.
+"""
+
+from collections import OrderedDict
+from designs import get_ascii_pet
+
+
+class SpriteFrame:
+    """One pre-rendered sprite frame: lines plus the font and color to draw them with"""
+    __slots__ = ('name', 'lines', 'font', 'color', 'line_height')
+
+    def __init__(self, name, lines, font_size, color):
+        self.name = name
+        self.lines = tuple(lines)
+        self.font = ('Courier', font_size, 'bold')
+        self.color = color
+        self.line_height = font_size + 2  # Same spacing as designs.get_density_line_height()
+
+
+class SpriteCache:
+    """LRU cache of SpriteFrames and of the lines that differ between two frames
+
+    Entries are keyed by (sprite name, font size, color), so density or color
+    changes at runtime add new entries and the least recently used ones are
+    evicted once max_entries is reached.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.frames = OrderedDict()  # (name, font_size, color) -> SpriteFrame
+        self.diffs = OrderedDict()  # (old key, new key) -> indices of changed lines
+
+    def get(self, name, font_size, color):
+        """Get the pre-rendered frame for a sprite, building it on first use"""
+        key = (name, font_size, color)
+        frame = self.frames.get(key)
+        if frame is None:
+            frame = SpriteFrame(name, get_ascii_pet(name), font_size, color)
+            self.frames[key] = frame
+            self._evict(self.frames)
+        else:
+            self.frames.move_to_end(key)
+        return frame
+
+    def changed_lines(self, old, new):
+        """Indices of lines whose text differs between two frames"""
+        key = (old.name, new.name)
+        changed = self.diffs.get(key)
+        if changed is None:
+            changed = tuple(i for i, line in enumerate(new.lines)
+                            if i >= len(old.lines) or old.lines[i] != line)
+            self.diffs[key] = changed
+            self._evict(self.diffs)
+        else:
+            self.diffs.move_to_end(key)
+        return changed
+
+    def _evict(self, entries):
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+
+# Shared cache for all sprite renderers
+SPRITE_CACHE = SpriteCache()
+
+
+class SpriteRenderer:
+    """Draws one sprite on a canvas as a group of line items under a single tag
+
+    Switching frames only reconfigures the lines that differ, moving is a
+    single canvas.move on the tag, and a color or font change is a single
+    itemconfigure on the tag.
+    """
+
+    def __init__(self, canvas, tag, cache=SPRITE_CACHE):
+        self.canvas = canvas
+        self.tag = tag
+        self.cache = cache
+        self.line_ids = []
+        self.frame = None  # SpriteFrame currently shown
+        self.x = None
+        self.y = None
+        self.hidden = False
+
+    def draw(self, name, x, y, font_size, color):
+        """Show sprite name with line 0 centered at (x, y)"""
+        frame = self.cache.get(name, font_size, color)
+        if self.frame is None:
+            self.create(frame, x, y)
+            return
+
+        canvas = self.canvas
+        old = self.frame
+        if self.hidden:
+            canvas.itemconfigure(self.tag, state='normal')
+            self.hidden = False
+        if frame.font != old.font or frame.color != old.color:
+            canvas.itemconfigure(self.tag, font=frame.font, fill=frame.color)
+        if frame.line_height != old.line_height:
+            # Line spacing changed with the font size: lay the lines out again
+            for i, item_id in enumerate(self.line_ids):
+                canvas.coords(item_id, x, y + i * frame.line_height)
+        elif x != self.x or y != self.y:
+            canvas.move(self.tag, x - self.x, y - self.y)
+        if frame.name != old.name:
+            for i in self.cache.changed_lines(old, frame):
+                canvas.itemconfigure(self.line_ids[i], text=frame.lines[i])
+
+        self.frame = frame
+        self.x = x
+        self.y = y
+
+    def create(self, frame, x, y):
+        """Create one text item per sprite line"""
+        for i, line in enumerate(frame.lines):
+            self.line_ids.append(self.canvas.create_text(
+                x, y + i * frame.line_height,
+                text=line, font=frame.font, anchor='center', fill=frame.color, tags=self.tag))
+        self.frame = frame
+        self.x = x
+        self.y = y
+
+    def hide(self):
+        """Hide the sprite (the next draw shows it again)"""
+        if self.frame is not None and not self.hidden:
+            self.canvas.itemconfigure(self.tag, state='hidden')
+            self.hidden = True
+
+    def clear(self):
+        """Delete the sprite's items from the canvas"""
+        self.canvas.delete(self.tag)
+        self.line_ids = []
+        self.frame = None
+        self.hidden = False
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Incremental Surface Renderer
+Draws the wave strip and the boat riding it, updating only the lines that
+actually changed since the previous frame.
+"""
+
+from designs import (UNDERWATER_ENVIRONMENT, DEBUG_CONFIG, SURFACE_FONT, get_boat_sprite,
+                     integrate_boat_into_waves)
+from fontmetrics import font_metrics
+from waves import get_wave_field
+
+BLANK_LINES = 5  # Blank lines above the waves that the boat sails through
+
+# Full-width wave strings per canvas width, phase and character width, built once:
+# (width, phase, char_width) -> (frame1..frame4)
+_wave_cache = {}
+WAVE_PERIOD = 4  # Every wave pattern repeats after 4 characters
+
+
+def get_wave_lines(width, phase=0, char_width=None):
+    """Get the four full-width wave animation strings for a canvas width
+
+    Args:
+        width: Canvas width in pixels
+        phase: Character offset into the pattern (so side-by-side canvases line up)
+        char_width: Pixels per surface character (default: measured SURFACE_FONT)
+    """
+    phase %= WAVE_PERIOD
+    char_width = char_width or font_metrics(SURFACE_FONT).char_width
+    lines = _wave_cache.get((width, phase, char_width))
+    if lines is None:
+        cols = int(width // char_width) + 2  # Characters that fit, plus a partial one each side
+        lines = []
+        for i in range(1, 5):
+            pattern = UNDERWATER_ENVIRONMENT[f'ocean_surface_frame{i}']
+            lines.append((pattern * (cols // len(pattern) + 2))[phase:phase + cols])
+        lines = tuple(lines)
+        _wave_cache[(width, phase, char_width)] = lines
+    return lines
+
+
+class SurfaceRenderer:
+    """Retained wave/boat strip: 5 boat lines + 2 wave lines over static backgrounds
+
+    The two background rectangles are drawn once on creation and never
+    touched again. Each frame only the text of lines whose content changed
+    (the wave lines when the frame advances, the lines the boat covers when
+    it moves) is reconfigured.
+
+    Args:
+        canvas: Canvas to draw on
+        width, height: Canvas size
+        origin_x: World x-coordinate of the canvas's left edge (for viewports)
+    """
+
+    def __init__(self, canvas, width, height, origin_x=0):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        metrics = font_metrics(SURFACE_FONT)
+        self.char_width = metrics.char_width  # Pixels per surface character
+        self.line_height = metrics.line_height
+        self.origin_chars = int(origin_x // self.char_width)  # World character at the left edge
+        self.water_level = height // 5
+        self.wave_lines = get_wave_lines(width, self.origin_chars, self.char_width)
+        self.blank_line = " " * len(self.wave_lines[0])
+        self.wave_field = get_wave_field()  # None = cycle the four classic wave strings
+        self.wave_cols = int(width // self.char_width) + 2
+
+        self.line_ids = []  # Canvas item ids: 5 boat lines, top wave, bottom wave
+        self.line_text = []  # Text currently shown on each line
+        self.boat_lines = set()  # Blank lines the boat covered last frame
+        self.last_wave_frame = None
+        self.last_boat = None  # (char_pos, direction) last drawn, or None
+
+        self.create_items()
+
+    def create_items(self):
+        """Create the static backgrounds and the seven surface lines once"""
+        canvas = self.canvas
+        water_level = self.water_level
+        line_height = self.line_height
+        surface_height = 2 * line_height  # Height of 2-line surface
+
+        # Surface area background (deep blue, almost black)
+        canvas.create_rectangle(0, 0, self.width, water_level,
+                                fill='#0A0F1C', outline='', tags="environment")
+
+        # 5 blank lines (the boat draws into them) starting 5 lines above water_level
+        surface_y_start = water_level - (BLANK_LINES * line_height)
+        rows = [(surface_y_start + i * line_height, '#FFFFFF') for i in range(BLANK_LINES)]
+        rows.append((water_level, '#FFFFFF'))  # Top wave at water level
+        rows.append((water_level + line_height, '#AAAAAA'))  # Bottom wave, darker for depth
+        for i, (y_pos, color) in enumerate(rows):
+            text = self.blank_line if i < BLANK_LINES else ""
+            self.line_ids.append(canvas.create_text(0, y_pos, text=text, font=SURFACE_FONT,
+                                                    fill=color, anchor='w', tags="environment"))
+            self.line_text.append(text)
+
+        # Underwater background, below the 2-line surface
+        canvas.create_rectangle(0, water_level + surface_height, self.width, self.height,
+                                fill='#0A0F1C', outline='', tags="environment")
+
+        # Environment sits at the bottom of the z-order; retained items keep that order
+        canvas.lower("environment")
+
+        if DEBUG_CONFIG['show_grid']:
+            from debug_grid import render_debug_grid  # Only loaded when the grid is on
+            render_debug_grid(canvas, self.width, self.height, water_level)
+
+    def set_line(self, index, text):
+        """Reconfigure one surface line if its text changed"""
+        if self.line_text[index] != text:
+            self.canvas.itemconfigure(self.line_ids[index], text=text)
+            self.line_text[index] = text
+
+    def render(self, wave_frame, boat_char_pos=None, boat_active=False, boat_direction='lr', wave_phase=None,
+               wake=None):
+        """Update the surface for a wave frame and boat position
+
+        Args:
+            wave_frame: Current wave animation frame (classic wave strings)
+            wave_phase: Current phase bucket (procedural waves, see waves.py)
+            wake: (first col, top, bottom) wake/splash glyphs drawn over the waves, or None
+            boat_char_pos: Character position of boat (for integration into waves)
+            boat_active: Whether boat is active and should be rendered
+            boat_direction: Direction of boat ('lr' = left-to-right, 'rl' = right-to-left)
+        """
+        if boat_char_pos is not None:
+            boat_char_pos -= self.origin_chars  # World characters -> this canvas's characters
+        boat = (boat_char_pos, boat_direction) if boat_active and boat_char_pos is not None else None
+        procedural = self.wave_field is not None and wave_phase is not None
+        wave_key = (wave_phase if procedural else wave_frame, wake)
+        wave_changed = wave_key != self.last_wave_frame
+        boat_changed = boat != self.last_boat
+        if not wave_changed and not boat_changed:
+            return
+        self.last_wave_frame = wave_key
+        self.last_boat = boat
+
+        boat_sprite = get_boat_sprite(boat_direction) if boat else None
+
+        # Boat lines: only lines the boat covers now or covered last frame need new text
+        if boat_changed:
+            covered = set()
+            if boat:
+                line_width = len(self.blank_line)
+                visible = boat_char_pos < line_width and boat_char_pos + len(boat_sprite[0]) >= 0
+                if visible:
+                    covered = {i for i in range(min(BLANK_LINES, len(boat_sprite) - 1))
+                               if boat_sprite[i].strip()}
+            for i in covered:
+                self.set_line(i, integrate_boat_into_waves(self.blank_line, boat_sprite[i], boat_char_pos))
+            for i in self.boat_lines - covered:
+                self.set_line(i, self.blank_line)
+            self.boat_lines = covered
+
+        # Wave lines: top wave carries the boat's hull bottom, bottom wave uses the alternate frame
+        if procedural:
+            wave_top, wave_bottom = self.wave_field.lines(self.origin_chars, self.wave_cols, wave_phase)
+        else:
+            wave_top = self.wave_lines[wave_frame % 4]
+            wave_bottom = self.wave_lines[(wave_frame + 2) % 4]
+        if wake is not None:
+            wake_col = wake[0] - self.origin_chars
+            wave_top = integrate_boat_into_waves(wave_top, wake[1], wake_col)
+            wave_bottom = integrate_boat_into_waves(wave_bottom, wake[2], wake_col)
+        if boat and len(boat_sprite) >= 6:
+            wave_top = integrate_boat_into_waves(wave_top, boat_sprite[5], boat_char_pos)
+        self.set_line(BLANK_LINES, wave_top)
+        self.set_line(BLANK_LINES + 1, wave_bottom)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Batched Tcl Drawing
+Every tkinter canvas method is a separate Python -> Tcl round-trip. A
+BatchedCanvas stands in for a canvas and, instead of calling Tcl, appends
+each coords/itemconfigure/move/delete/raise/lower to a list; flush() hands
+the whole frame's list to a small Tcl proc with one tk.call, and the proc
+runs the commands. Calls that return something (create_*, find_*,
+queries) flush the pending list first and then go straight to the canvas,
+so ordering is preserved.
+
+The commands travel as nested Tcl lists built by tkinter from Python
+tuples, never as script text, so nothing needs escaping: ASCII art with
+backslashes, braces, brackets or $ reaches the canvas exactly as written.
+(Building and escaping a script for tk.eval was tried first; quoting in
+Python and re-parsing in Tcl made it several times slower than separate
+calls, while the list hand-off is faster than separate calls.)
+"""
+
+# Runs one frame's commands; each command is {widget subcommand args...}
+BATCH_COMMAND = '::ascii_pet_batch'
+BATCH_PROC = 'proc %s {commands} {foreach command $commands {{*}$command}}' % BATCH_COMMAND
+
+
+class BatchedCanvas:
+    """Canvas proxy that queues drawing commands and runs them with one Tcl call
+
+    Renderers use it like the canvas itself. Call flush() once per frame,
+    after rendering, to apply the queued commands.
+
+    Args:
+        canvas: tkinter Canvas (or anything with the same methods and a .tk)
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.path = str(canvas)  # Tcl command of the canvas widget
+        self.commands = []  # Commands queued since the last flush, as tuples of words
+        self.flushes = 0  # Non-empty flushes (one Tcl round-trip each)
+        self.installed = False  # Whether BATCH_PROC exists in the canvas's interpreter
+
+    def flush(self):
+        """Run every queued command with a single Tcl call"""
+        if not self.commands:
+            return
+        commands = tuple(self.commands)
+        self.commands = []
+        tk = self.canvas.tk
+        if not self.installed:
+            tk.eval(BATCH_PROC)
+            self.installed = True
+        self.flushes += 1
+        tk.call(BATCH_COMMAND, commands)
+
+    @staticmethod
+    def _options(cnf, options):
+        if cnf:
+            options = dict(cnf, **options)
+        words = []
+        for name, value in options.items():
+            words.append('-' + name.rstrip('_'))
+            words.append(value)
+        return words
+
+    # ===== QUEUED COMMANDS =====
+
+    def coords(self, tag_or_id, *coords):
+        if not coords:
+            self.flush()
+            return self.canvas.coords(tag_or_id)  # Query
+        if len(coords) == 1 and isinstance(coords[0], (tuple, list)):
+            coords = coords[0]
+        self.commands.append((self.path, 'coords', tag_or_id) + tuple(coords))
+
+    def itemconfigure(self, tag_or_id, cnf=None, **options):
+        if not cnf and not options:
+            self.flush()
+            return self.canvas.itemconfigure(tag_or_id)  # Query
+        self.commands.append((self.path, 'itemconfigure', tag_or_id, *self._options(cnf, options)))
+
+    itemconfig = itemconfigure
+
+    def move(self, tag_or_id, dx, dy):
+        self.commands.append((self.path, 'move', tag_or_id, dx, dy))
+
+    def delete(self, *tags_or_ids):
+        self.commands.append((self.path, 'delete') + tags_or_ids)
+
+    def tag_raise(self, *args):
+        self.commands.append((self.path, 'raise') + args)
+
+    def tag_lower(self, *args):
+        self.commands.append((self.path, 'lower') + args)
+
+    lift = tag_raise
+    lower = tag_lower
+
+    # ===== EVERYTHING ELSE =====
+
+    def __getattr__(self, name):
+        # create_*, find_*, bind, ... return results: run what's queued, then call directly
+        self.flush()
+        return getattr(self.canvas, name)
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Terminal Backend
+Draws the scene into a terminal with ANSI escape codes instead of a Tk
+canvas, for servers without Tk (tmux panes over SSH). Frames are composed
+into a character grid and diffed against the previous one, so only the
+cells that changed are written.
+
+Usage:
+    python3 terminal.py
+    python3 terminal.py --krakens 3 --fps 5
+"""
+
+import argparse
+import heapq
+import os
+import random
+import select
+import shutil
+import signal
+import sys
+import time
+
+from designs import TERMINAL_CONFIG, is_in_water
+from export import hex_to_rgb
+from framebuffer import FrameComposer, BACKGROUND, SURFACE_COLOR
+from renderer import Renderer
+from scheduler import FixedStepScheduler
+from simulation import World, TICK
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows: no keyboard/mouse input, drawing still works
+    termios = None
+
+# Unchanged cells between two changed ones are rewritten rather than skipped
+# when that is shorter than a cursor move (about 8 bytes)
+MAX_GAP = 4
+
+# Double-width glyphs would shift the rest of the row in a terminal
+NARROW_GLYPHS = {'⛵': 'B'}
+
+# Mouse reporting (button presses only, SGR coordinates)
+MOUSE_ON = "\x1b[?1000h\x1b[?1006h"
+MOUSE_OFF = "\x1b[?1000l\x1b[?1006l"
+
+
+def rgb_to_256(r, g, b):
+    """Nearest xterm-256 color (6x6x6 cube or gray ramp) to an RGB color"""
+    levels = (0, 95, 135, 175, 215, 255)
+
+    def nearest_level(value):
+        return min(range(6), key=lambda i: abs(levels[i] - value))
+
+    cube = (nearest_level(r), nearest_level(g), nearest_level(b))
+    cube_rgb = tuple(levels[i] for i in cube)
+    gray = max(0, min(23, int(round(((r + g + b) / 3 - 8) / 10))))
+    gray_rgb = (8 + gray * 10,) * 3
+
+    def distance(other):
+        return sum((a - c) ** 2 for a, c in zip((r, g, b), other))
+
+    if distance(gray_rgb) < distance(cube_rgb):
+        return 232 + gray
+    return 16 + 36 * cube[0] + 6 * cube[1] + cube[2]
+
+
+def changed_spans(old_chars, old_colors, chars, colors, cols):
+    """Column ranges [start, end) of one row that differ from the old row
+
+    A space looks the same whatever its foreground color, so color-only
+    changes of spaces don't count. Spans closer than MAX_GAP are merged.
+    """
+    spans = []
+    start = end = None
+    for col in range(cols):
+        char = chars[col]
+        if char != old_chars[col] or (colors[col] != old_colors[col] and char != ' '):
+            if start is not None and col - end <= MAX_GAP:
+                end = col + 1
+            else:
+                if start is not None:
+                    spans.append((start, end))
+                start, end = col, col + 1
+    if start is not None:
+        spans.append((start, end))
+    return spans
+
+
+class TerminalRenderer(Renderer):
+    """Renders World snapshots into a terminal, writing only changed cells
+
+    Args:
+        stream: Text stream connected to the terminal (e.g. sys.stdout)
+        width, height: World size in pixels
+        cell_width, cell_height: World pixels per terminal cell
+        truecolor: Use 24-bit colors (default: TERMINAL_CONFIG, else $COLORTERM)
+    """
+
+    def __init__(self, stream, width, height, cell_width=8, cell_height=None, truecolor=None):
+        self.stream = stream
+        self.composer = FrameComposer(width, height, cell_width, cell_height)
+        self.cols = self.composer.cols
+        self.rows = self.composer.rows
+        self.screen_cols = self.cols  # Visible part of the grid (the terminal may shrink)
+        self.screen_rows = self.rows
+
+        if truecolor is None:
+            truecolor = TERMINAL_CONFIG['truecolor']
+        if truecolor is None:
+            truecolor = os.environ.get('COLORTERM', '') in ('truecolor', '24bit')
+        self.truecolor = truecolor
+        self.background = self.color_code(BACKGROUND, background=True)
+        self.foreground = {color: self.color_code(color) for color in self.composer.palette()}
+        self.foreground[None] = self.foreground[SURFACE_COLOR]
+
+        self.previous = None  # Last frame written (None = repaint everything)
+        self.status = ""  # Text on the line below the grid
+        self.status_written = None
+        self.cells_written = 0  # Cells written by the last render
+        self.bytes_written = 0  # Characters written by the last render
+
+    def color_code(self, color, background=False):
+        """ANSI escape selecting a '#RRGGBB' foreground/background color"""
+        r, g, b = hex_to_rgb(color)
+        layer = 48 if background else 38
+        if self.truecolor:
+            return f"\x1b[{layer};2;{r};{g};{b}m"
+        return f"\x1b[{layer};5;{rgb_to_256(r, g, b)}m"
+
+    def start(self):
+        """Switch to the alternate screen, hide the cursor and paint the background"""
+        self.stream.write("\x1b[?1049h\x1b[?25l" + self.background + "\x1b[2J")
+        self.stream.flush()
+        self.invalidate()
+
+    def close(self):
+        """Restore the terminal"""
+        self.stream.write("\x1b[0m\x1b[?25h\x1b[?1049l")
+        self.stream.flush()
+
+    def invalidate(self):
+        """Repaint everything on the next frame (after a resize or clear)"""
+        self.previous = None
+        self.status_written = None
+
+    def resize(self, columns, lines):
+        """Clip drawing to a terminal of columns x lines (one line is the status)"""
+        self.screen_cols = min(self.cols, columns)
+        self.screen_rows = min(self.rows, max(0, lines - 1))
+        self.stream.write(self.background + "\x1b[2J")
+        self.invalidate()
+
+    def render(self, snapshot):
+        with self.profiler.phase('terminal_compose'):
+            frame = self.composer.compose(snapshot)
+        with self.profiler.phase('terminal_write'):
+            output = self.diff(frame)
+            if self.status != self.status_written:
+                output += (f"\x1b[{self.screen_rows + 1};1H" + self.background + self.foreground[None]
+                           + self.status[:self.screen_cols] + "\x1b[K")
+                self.status_written = self.status
+            self.bytes_written = len(output)
+            if output:
+                self.stream.write(output)
+                self.stream.flush()
+        self.previous = frame
+        self.profiler.count('terminal_cells', self.cells_written)
+        self.profiler.count('terminal_bytes', self.bytes_written)
+
+    def diff(self, frame):
+        """Escape sequences turning the previous frame into this one"""
+        previous = self.previous
+        foreground = self.foreground
+        cols = self.screen_cols
+        parts = [self.background]
+        current_color = False  # Nothing selected yet (None is a valid cell color)
+        cells = 0
+        for row in range(self.screen_rows):
+            chars = frame.chars[row]
+            colors = frame.colors[row]
+            if previous is None:
+                spans = [(0, cols)]
+            elif chars == previous.chars[row] and colors == previous.colors[row]:
+                continue
+            else:
+                spans = changed_spans(previous.chars[row], previous.colors[row], chars, colors, cols)
+            for start, end in spans:
+                parts.append(f"\x1b[{row + 1};{start + 1}H")
+                # One color escape per run of same-colored cells (spaces take any color)
+                run_start = start
+                for col in range(start, end + 1):
+                    if col < end and (chars[col] == ' ' or colors[col] == current_color):
+                        continue
+                    text = ''.join(chars[run_start:col])
+                    if text:
+                        parts.append(text)
+                    if col < end:
+                        current_color = colors[col]
+                        parts.append(foreground.get(current_color, foreground[None]))
+                    run_start = col
+                cells += end - start
+        self.cells_written = cells
+        if len(parts) == 1:
+            return ""
+        output = ''.join(parts)
+        for wide, narrow in NARROW_GLYPHS.items():
+            output = output.replace(wide, narrow)
+        return output
+
+
+class TerminalLoop:
+    """Minimal stand-in for Tk's event loop: after() timers plus keyboard input
+
+    FixedStepScheduler only needs after()/after_cancel(), so it drives the
+    terminal backend exactly like the Tk window. While waiting for the next
+    timer, stdin is watched for key presses and mouse clicks.
+
+    Args:
+        on_input: Called with each chunk of text read from stdin
+        input_stream: Terminal to read from (None = no input)
+    """
+
+    def __init__(self, on_input=None, input_stream=None):
+        self.on_input = on_input
+        self.input_stream = input_stream
+        self.timers = []  # Heap of (due time, id, callback)
+        self.next_id = 0
+        self.cancelled = set()
+        self.running = False
+
+    def after(self, delay_ms, callback):
+        self.next_id += 1
+        heapq.heappush(self.timers, (time.perf_counter() + delay_ms / 1000.0, self.next_id, callback))
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.cancelled.add(after_id)
+
+    def quit(self):
+        self.running = False
+
+    def mainloop(self):
+        self.running = True
+        while self.running and self.timers:
+            due, after_id, callback = self.timers[0]
+            wait = due - time.perf_counter()
+            if wait > 0:
+                self.wait_for_input(wait)
+                continue
+            heapq.heappop(self.timers)
+            if after_id in self.cancelled:
+                self.cancelled.discard(after_id)
+                continue
+            callback()
+
+    def wait_for_input(self, timeout):
+        """Sleep up to timeout seconds, handling input if any arrives"""
+        if self.input_stream is None:
+            time.sleep(timeout)
+            return
+        try:
+            ready, _, _ = select.select([self.input_stream], [], [], timeout)
+        except InterruptedError:  # SIGWINCH
+            return
+        if ready:
+            data = os.read(self.input_stream.fileno(), 1024).decode('utf-8', 'replace')
+            if data and self.on_input is not None:
+                self.on_input(data)
+
+
+class TerminalKraken:
+    """The aquarium in a terminal: World + TerminalRenderer + TerminalLoop
+
+    The world is sized from the terminal (one cell = 8 x line height pixels
+    of world space) and keeps that size if the terminal is resized later;
+    a smaller terminal just shows the top-left part.
+
+    Args:
+        kraken_count: Number of krakens (default: KRAKEN_CONFIG['count'])
+        fps: Frame rate (default: TERMINAL_CONFIG['fps'])
+        stream: Output terminal (default: sys.stdout)
+    """
+
+    def __init__(self, kraken_count=None, fps=None, stream=None):
+        self.stream = stream or sys.stdout
+        self.input = sys.stdin if termios is not None and sys.stdin.isatty() else None
+        self.mouse = TERMINAL_CONFIG['mouse'] and self.input is not None
+        self.saved_tty = None
+
+        columns, lines = shutil.get_terminal_size()
+        probe = FrameComposer(8, 8)  # Cell size only
+        self.cell_width = probe.cell_width
+        self.cell_height = probe.cell_height
+        self.width = columns * self.cell_width
+        self.height = (lines - 1) * self.cell_height  # Last line is the status line
+
+        self.world = World(self.width, self.height, verbose=False, kraken_count=kraken_count,
+                           char_width=self.cell_width,  # Surface characters are terminal cells
+                           surface_height=2 * self.cell_height)  # ... and so are the 2 surface rows
+        self.renderer = TerminalRenderer(self.stream, self.width, self.height,
+                                         self.cell_width, self.cell_height)
+        self.loop = TerminalLoop(self.on_input, self.input)
+        self.scheduler = FixedStepScheduler(self.loop, self.world.step, self.render_frame, TICK,
+                                            fps=fps or TERMINAL_CONFIG['fps'])
+        self.resized = False
+
+    def render_frame(self, alpha):
+        if self.resized:
+            self.resized = False
+            self.renderer.resize(*shutil.get_terminal_size())
+        world = self.world
+        self.renderer.status = (f" shrimp {world.shrimp_eaten_count}  boats {world.boats_destroyed}"
+                                f"  ·  f feed  b boat  q quit")
+        self.renderer.render(world.snapshot(alpha))
+
+    def on_input(self, data):
+        """Handle key presses and SGR mouse reports (ESC [ < button ; col ; row M)"""
+        while data:
+            if data.startswith("\x1b[<"):
+                end = min((i for i in (data.find('M'), data.find('m')) if i != -1), default=-1)
+                if end == -1:
+                    return
+                report, pressed, data = data[3:end], data[end] == 'M', data[end + 1:]
+                if pressed and report.count(';') == 2:
+                    button, col, row = (int(value) for value in report.split(';'))
+                    if button in (0, 2):  # Left/right press
+                        self.on_click(col - 1, row - 1, right=button == 2)
+                continue
+            key, data = data[0], data[1:]
+            if key in ('q', 'Q'):
+                self.loop.quit()
+            elif key == 'f':
+                self.feed()
+            elif key == 'b' and not self.world.boat.active:
+                self.world.spawn_boat(direction=random.choice(('lr', 'rl')))
+
+    def on_click(self, col, row, right=False):
+        """Same as the desktop pet: shrimp in the water, boats above it"""
+        x = col * self.cell_width + self.cell_width // 2
+        y = row * self.cell_height + self.cell_height // 2
+        if is_in_water(x, y, self.world.water_level, self.height, self.world.surface_height):
+            self.world.drop_shrimp(x, y)
+        elif y < self.world.water_level and not self.world.boat.active:
+            self.world.spawn_boat(direction='lr' if right else 'rl')
+
+    def feed(self):
+        """Drop a shrimp somewhere random in the water"""
+        world = self.world
+        top = world.water_level + world.surface_height
+        bottom = self.height - 50
+        if bottom > top:
+            world.drop_shrimp(random.randrange(0, self.width), random.randrange(top, bottom))
+
+    def on_resize(self, signum, frame):
+        self.resized = True
+
+    def run(self):
+        if self.input is not None:
+            self.saved_tty = termios.tcgetattr(self.input)
+            tty.setcbreak(self.input)  # Keys without Enter, no echo; Ctrl-C still works
+        if hasattr(signal, 'SIGWINCH'):
+            signal.signal(signal.SIGWINCH, self.on_resize)
+        self.renderer.start()
+        if self.mouse:
+            self.stream.write(MOUSE_ON)
+        try:
+            self.scheduler.start()
+            self.loop.mainloop()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.scheduler.stop()
+            if self.mouse:
+                self.stream.write(MOUSE_OFF)
+            self.renderer.close()
+            if self.saved_tty is not None:
+                termios.tcsetattr(self.input, termios.TCSADRAIN, self.saved_tty)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--krakens', type=int, metavar='N',
+                        help='number of krakens (default: KRAKEN_CONFIG["count"])')
+    parser.add_argument('--fps', type=int, help='frames per second (default: TERMINAL_CONFIG["fps"])')
+    args = parser.parse_args()
+    if args.krakens is not None and args.krakens < 1:
+        parser.error("--krakens must be at least 1")
+    if args.fps is not None and args.fps < 1:
+        parser.error("--fps must be at least 1")
+
+    TerminalKraken(kraken_count=args.krakens, fps=args.fps).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Viewports
+Lays out several windows (one per monitor region) side by side over one
+shared world, each showing its own horizontal slice of it.
+"""
+
+from designs import VIEWPORT_CONFIG
+
+
+class Viewport:
+    """One window's slice [origin_x, origin_x + width) of the shared world
+
+    Args:
+        screen_x, screen_y: Window position on screen
+        width, height: Window size (height is the world height)
+        origin_x: World x-coordinate shown at the window's left edge
+    """
+
+    def __init__(self, screen_x, screen_y, width, height, origin_x):
+        self.screen_x = screen_x
+        self.screen_y = screen_y
+        self.width = width
+        self.height = height
+        self.origin_x = origin_x
+
+    def geometry(self):
+        """Tk geometry string for the window"""
+        return f"{self.width}x{self.height}+{self.screen_x}+{self.screen_y}"
+
+    def __repr__(self):
+        return f"Viewport({self.geometry()}, world x {self.origin_x}..{self.origin_x + self.width})"
+
+
+def split_screen(screen_width, screen_height, count):
+    """Split the (virtual) screen into count equally wide side-by-side regions
+
+    Tk reports a multi-monitor desktop as one wide screen, so for a wall of
+    identical displays splitting it evenly gives one region per monitor.
+
+    Returns:
+        List of (x, y, width, height) regions
+    """
+    region_width = screen_width // count
+    return [(i * region_width, 0, region_width, screen_height) for i in range(count)]
+
+
+def layout_viewports(regions, height, margin=None):
+    """Place one viewport along the bottom of each region
+
+    Regions are ordered left to right and their viewports are laid end to
+    end in world space, so something leaving the right edge of one window
+    appears at the left edge of the next.
+
+    Args:
+        regions: (x, y, width, height) monitor regions in screen coordinates
+        height: Height of every viewport (and of the world)
+        margin: Gap between a viewport and the bottom of its region
+            (default: VIEWPORT_CONFIG['bottom_margin'])
+
+    Returns:
+        List of Viewports; the world is sum(viewport.width) pixels wide
+    """
+    if margin is None:
+        margin = VIEWPORT_CONFIG['bottom_margin']
+    viewports = []
+    origin_x = 0
+    for x, y, width, region_height in sorted(regions):
+        viewports.append(Viewport(x, y + region_height - height - margin, width, height, origin_x))
+        origin_x += width
+    return viewports
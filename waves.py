@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+ASCII Underwater Kraken - Procedural Wave Field
+The ocean surface as a sum of sines over the whole width, evaluated for
+every column at once (vectorized with NumPy when installed) and quantized
+to ~ and ≈ glyphs. Results are cached per (columns, phase bucket).
+Wakes and splashes on top of it come from a small height field that is
+only stepped where something disturbed the water.
+"""
+
+import math
+from collections import OrderedDict
+from designs import WAVE_CONFIG
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+LOW_GLYPH = '~'  # Trough or flat water
+HIGH_GLYPH = '≈'  # Crest
+SPLASH_GLYPH = '^'  # Spray thrown up by a splash
+
+
+class WaveField:
+    """Procedural two-line water surface, periodic in time
+
+    Each component is (amplitude, wavelength in characters, cycles per
+    period): it travels across the surface and completes a whole number of
+    cycles every `period` phase buckets, so the sum repeats only after a
+    full period (a minute by default). The cache holds a whole period for
+    every (first_col, cols) slice asked for, so after the first period
+    every frame is a hit; that costs two lines per phase bucket and slice
+    (about 0.7 MB for a 1920 px viewport and the default 600 buckets). The
+    bottom line is the same field with every component a quarter
+    wavelength behind, like the lagging second row of the old frames.
+
+    Args:
+        components: Sine components (default: WAVE_CONFIG['components'])
+        period: Phase buckets before the pattern repeats (default: WAVE_CONFIG['period'])
+        max_entries: Cached (columns, phase) results kept (default: period x slices)
+        use_numpy: Force (True) or disable (False) NumPy; None = use it if installed
+    """
+
+    def __init__(self, components=None, period=None, max_entries=None, use_numpy=None):
+        self.components = tuple(components or WAVE_CONFIG['components'])
+        self.period = period or WAVE_CONFIG['period']
+        self.max_entries = max_entries
+        self.use_numpy = np is not None if use_numpy is None else (use_numpy and np is not None)
+        self.cache = OrderedDict()  # (first_col, cols, phase bucket) -> (top line, bottom line)
+        self.slices = set()  # (first_col, cols) asked for so far
+        self.bases = {}  # (first_col, cols) -> per component (a*sin(kx), a*cos(kx)) columns (no NumPy)
+
+        # Per component: radians per column and per phase bucket
+        self.wavenumbers = [2 * math.pi / wavelength for _, wavelength, _ in self.components]
+        self.speeds = [2 * math.pi * cycles / self.period for _, _, cycles in self.components]
+        self.amplitudes = [amplitude for amplitude, _, _ in self.components]
+        if self.use_numpy:
+            self.np_wavenumbers = np.array(self.wavenumbers)[:, None]
+            self.np_speeds = np.array(self.speeds)[:, None]
+            self.np_amplitudes = np.array(self.amplitudes)[:, None]
+
+    def lines(self, first_col, cols, phase):
+        """Top and bottom wave lines for columns [first_col, first_col + cols)
+
+        Heights only depend on the absolute column, so side-by-side
+        viewports asking for their own slices line up seamlessly.
+
+        Args:
+            first_col: World column of the first character
+            cols: Number of characters
+            phase: Phase bucket (e.g. simulation ticks); wraps every period
+        """
+        key = (first_col, cols, phase % self.period)
+        lines = self.cache.get(key)
+        if lines is None:
+            if self.use_numpy:
+                lines = self._lines_numpy(first_col, cols, key[2])
+            else:
+                lines = self._lines_python(first_col, cols, key[2])
+            self.cache[key] = lines
+            self.slices.add(key[:2])
+            max_entries = self.max_entries or self.period * len(self.slices)
+            while len(self.cache) > max_entries:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+        return lines
+
+    def _lines_numpy(self, first_col, cols, phase):
+        # One (components x columns) evaluation per line, summed over components
+        x = np.arange(first_col, first_col + cols, dtype=np.float64)[None, :]
+        angle = self.np_wavenumbers * x + self.np_speeds * phase
+        top = (self.np_amplitudes * np.sin(angle)).sum(axis=0)
+        bottom = (self.np_amplitudes * np.cos(angle)).sum(axis=0)  # Quarter wavelength behind
+        return self._quantize_numpy(top), self._quantize_numpy(bottom)
+
+    @staticmethod
+    def _quantize_numpy(heights):
+        codes = np.where(heights > WAVE_CONFIG['threshold'], ord(HIGH_GLYPH), ord(LOW_GLYPH))
+        return codes.astype('<u4').tobytes().decode('utf-32-le')
+
+    def _lines_python(self, first_col, cols, phase):
+        # sin(kx + wt) = sin(kx)cos(wt) + cos(kx)sin(wt): the per-column sines
+        # are computed once per slice, each phase only needs one sin/cos per component
+        basis = self.bases.get((first_col, cols))
+        if basis is None:
+            basis = self.bases[(first_col, cols)] = [
+                ([amplitude * math.sin(wavenumber * x) for x in range(first_col, first_col + cols)],
+                 [amplitude * math.cos(wavenumber * x) for x in range(first_col, first_col + cols)])
+                for amplitude, wavenumber in zip(self.amplitudes, self.wavenumbers)]
+        top = [0.0] * cols
+        bottom = [0.0] * cols
+        for (sines, cosines), speed in zip(basis, self.speeds):
+            cos_t = math.cos(speed * phase)
+            sin_t = math.sin(speed * phase)
+            top = [h + s * cos_t + c * sin_t for h, s, c in zip(top, sines, cosines)]
+            bottom = [h + c * cos_t - s * sin_t for h, s, c in zip(bottom, sines, cosines)]
+        threshold = WAVE_CONFIG['threshold']
+        return (''.join([HIGH_GLYPH if h > threshold else LOW_GLYPH for h in top]),
+                ''.join([HIGH_GLYPH if h > threshold else LOW_GLYPH for h in bottom]))
+
+
+_wave_field = None
+
+
+def get_wave_field():
+    """Shared WaveField for all renderers (None when WAVE_CONFIG['procedural'] is off)"""
+    global _wave_field
+    if not WAVE_CONFIG['procedural']:
+        return None
+    if _wave_field is None:
+        _wave_field = WaveField()
+    return _wave_field
+
+
+class SurfaceRipples:
+    """Wakes and splashes: a damped 1D wave equation over the surface columns
+
+    Impulses (a boat's bow and stern, a kraken thrashing at the surface)
+    displace single columns; each step the displacement spreads to the
+    neighbours and decays. Only the active range of columns around the
+    disturbances is stepped, and once everything has settled below
+    `rest` the field is cleared and stepping costs nothing until the
+    next impulse.
+
+    Args:
+        cols: Surface width in characters
+        speed: Wave speed in columns per step (below 1 for stability)
+        damping: Fraction of the displacement kept each step
+        rest: Displacement below which a column counts as calm
+    """
+
+    def __init__(self, cols, speed=None, damping=None, rest=None):
+        self.cols = cols
+        self.coupling = (speed if speed is not None else WAVE_CONFIG['ripple_speed']) ** 2
+        self.damping = damping if damping is not None else WAVE_CONFIG['ripple_damping']
+        self.rest = rest if rest is not None else WAVE_CONFIG['ripple_rest']
+        self.height = [0.0] * cols
+        self.previous = [0.0] * cols  # Heights one step ago
+        self.lo = 0  # Active columns are [lo, hi)
+        self.hi = 0
+
+    @property
+    def active(self):
+        return self.lo < self.hi
+
+    def impulse(self, col, strength):
+        """Displace one column (up for positive strength) and wake the region around it"""
+        col = int(col)
+        if not 0 < col < self.cols - 1:
+            return  # Edge columns stay fixed at rest
+        self.height[col] += strength
+        if self.active:
+            self.lo = min(self.lo, col)
+            self.hi = max(self.hi, col + 1)
+        else:
+            self.lo, self.hi = col, col + 1
+
+    def step(self):
+        """Advance one step over the active region (nothing to do when calm)"""
+        if self.lo >= self.hi:
+            return
+        # Waves travel at most one column per step, so the region grows by one each side
+        lo = max(1, self.lo - 1)
+        hi = min(self.cols - 1, self.hi + 1)
+        height = self.height
+        previous = self.previous
+        coupling = self.coupling
+        damping = self.damping
+        new = [(2 * height[i] - previous[i]
+                + coupling * (height[i - 1] + height[i + 1] - 2 * height[i])) * damping
+               for i in range(lo, hi)]
+        previous[lo:hi] = height[lo:hi]
+        height[lo:hi] = new
+
+        # Shrink the region to the columns that are still moving
+        rest = self.rest
+        moving = [i for i in range(lo, hi) if abs(height[i]) > rest or abs(previous[i]) > rest]
+        if moving:
+            self.lo, self.hi = moving[0], moving[-1] + 1
+        else:
+            height[lo:hi] = [0.0] * (hi - lo)
+            previous[lo:hi] = [0.0] * (hi - lo)
+            self.lo = self.hi = 0
+
+    def overlay(self):
+        """(first col, top line, bottom line) glyphs for the disturbed columns, or None when calm
+
+        Spaces mean "keep the wave glyph"; the bottom line shows the
+        previous step so it lags the top like the waves do.
+        """
+        if self.lo >= self.hi:
+            return None
+        return (self.lo, self._glyphs(self.height, SPLASH_GLYPH), self._glyphs(self.previous, HIGH_GLYPH))
+
+    def _glyphs(self, heights, peak_glyph):
+        ripple = WAVE_CONFIG['ripple_glyph_level']
+        splash = WAVE_CONFIG['splash_glyph_level']
+        glyphs = []
+        for h in heights[self.lo:self.hi]:
+            if h > splash:
+                glyphs.append(peak_glyph)
+            elif h > ripple:
+                glyphs.append(HIGH_GLYPH)
+            elif h < -ripple:
+                glyphs.append(LOW_GLYPH)
+            else:
+                glyphs.append(' ')
+        return ''.join(glyphs)